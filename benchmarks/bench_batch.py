@@ -0,0 +1,56 @@
+"""Попарная арифметика: цикл по объектам Decimal/Binary против пакетов.
+
+Запуск: python benchmarks/bench_batch.py [--count N] [--digits D]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package.batch import BinaryBatch, DecimalBatch  # noqa: E402
+from task_package.zad2 import Binary, Decimal  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--digits", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for item_type, batch_type in ((Decimal, DecimalBatch), (Binary, BinaryBatch)):
+        base = item_type.BASE
+        left = [
+            [rng.randrange(1, base)]
+            + [rng.randrange(base) for _ in range(args.digits - 1)]
+            for _ in range(args.count)
+        ]
+        right = [
+            [rng.randrange(1, base)]
+            + [rng.randrange(base) for _ in range(args.digits - 1)]
+            for _ in range(args.count)
+        ]
+
+        def objects() -> None:
+            for x, y in zip(left, right):
+                item_type(x).add(item_type(y)).multiply(item_type(y)).digits
+
+        def batches() -> None:
+            a, b = batch_type(left), batch_type(right)
+            a.add(b).multiply(b)._packed()
+
+        per_object = min(timeit.repeat(objects, number=1, repeat=args.repeat))
+        per_batch = min(timeit.repeat(batches, number=1, repeat=args.repeat))
+        print(
+            f"{item_type.__name__:8} n={args.count} digits={args.digits}: "
+            f"объекты {per_object:.3f} с, пакет {per_batch:.3f} с, ускорение x{per_object / per_batch:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
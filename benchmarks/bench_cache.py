@@ -0,0 +1,73 @@
+"""Цепочки операций над Decimal/Binary: кэшированное значение против разбора цифр.
+
+Запуск: python benchmarks/bench_cache.py [--steps N] [--digits D]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert  # noqa: E402
+from task_package.zad2 import Binary, Decimal, Integer  # noqa: E402
+
+
+def chain_cached(start: Integer, step: Integer, steps: int) -> Integer:
+    """Цепочка add/multiply с использованием кэша значения"""
+    acc = start
+    for i in range(steps):
+        acc = acc.add(step) if i % 2 else acc.multiply(step)
+    return acc
+
+
+def chain_round_trip(start: Integer, step: Integer, steps: int) -> Integer:
+    """Та же цепочка с полным разбором и построением цифр на каждом шаге"""
+    cls = type(start)
+    base = cls.BASE
+    digits = list(start.digits)
+    step_digits = list(step.digits)
+    for i in range(steps):
+        a = convert.to_int(digits, base)
+        b = convert.to_int(step_digits, base)
+        digits = list(convert.from_int(a + b if i % 2 else a * b, base))
+    return cls(digits)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--digits", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for cls in (Decimal, Binary):
+        start = cls([1] * args.digits)
+        step = cls([1] + [0] * (cls.BASE - 1))
+        assert (
+            chain_cached(start, step, 10).to_int()
+            == chain_round_trip(start, step, 10).to_int()
+        )
+        cached = min(
+            timeit.repeat(
+                lambda: chain_cached(start, step, args.steps),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        plain = min(
+            timeit.repeat(
+                lambda: chain_round_trip(start, step, args.steps),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{cls.__name__:8} steps={args.steps} digits={args.digits}: "
+            f"кэш {cached * 1e3:.2f} мс, разбор {plain * 1e3:.2f} мс, ускорение x{plain / cached:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
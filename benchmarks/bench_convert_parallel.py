@@ -0,0 +1,54 @@
+"""Ускорение параллельного преобразования int <-> цифры относительно последовательного.
+
+Для каждого размера измеряет convert.from_int и convert.to_int с отключённым
+параллельным путём (PARALLEL_THRESHOLD=None) и с пулом из --workers процессов.
+
+Запуск: python benchmarks/bench_convert_parallel.py [--digits N ...] [--workers N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert  # noqa: E402
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(num: int, digits: bytes, threshold: Optional[int]) -> Tuple[float, float]:
+    convert.PARALLEL_THRESHOLD = threshold
+    return timed(lambda: convert.from_int(num)), timed(lambda: convert.to_int(digits))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--digits", type=int, nargs="+", default=[10**6, 3 * 10**6, 10**7]
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    convert.PARALLEL_WORKERS = args.workers
+    print(f"процессов: {args.workers}")
+    for ndigits in args.digits:
+        num = random.Random(ndigits).getrandbits(int(ndigits * 3.3219))
+        digits = convert.from_int(num)
+        serial_from, serial_to = run(num, digits, None)
+        par_from, par_to = run(num, digits, 1)
+        print(
+            f"{ndigits:>10} цифр: from_int {serial_from:.2f} -> {par_from:.2f} с ({serial_from / par_from:.2f}x), "
+            f"to_int {serial_to:.2f} -> {par_to:.2f} с ({serial_to / par_to:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
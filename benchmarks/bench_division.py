@@ -0,0 +1,52 @@
+"""Частное и остаток: divmod против цепочки subtract(multiply(divide(...))).
+
+Запуск: python benchmarks/bench_division.py [--digits D ...]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert  # noqa: E402
+from task_package.zad2 import Binary, Decimal  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--digits", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for cls in (Decimal, Binary):
+        for digits in args.digits:
+            bits = int(digits * 3.33) if cls is Decimal else digits
+            a_raw = convert.from_int(rng.getrandbits(2 * bits), cls.BASE)
+            b_raw = convert.from_int(rng.getrandbits(bits) | 1, cls.BASE)
+
+            def chained() -> None:
+                a, b = cls(a_raw), cls(b_raw)
+                q = a.divide(b)
+                r = a.subtract(q.multiply(b))
+                q.digits, r.digits
+
+            def single() -> None:
+                q, r = divmod(cls(a_raw), cls(b_raw))
+                q.digits, r.digits
+
+            t_chain = min(timeit.repeat(chained, number=1, repeat=args.repeat))
+            t_single = min(timeit.repeat(single, number=1, repeat=args.repeat))
+            print(
+                f"{cls.__name__:8} делитель {digits:7} цифр: цепочка {t_chain * 1e3:9.2f} мс, "
+                f"divmod {t_single * 1e3:9.2f} мс, ускорение x{t_chain / t_single:.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
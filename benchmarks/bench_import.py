@@ -0,0 +1,103 @@
+"""Время холодного импорта task_package по данным python -X importtime.
+
+Каждый замер — отдельный процесс интерпретатора. Учитывается суммарное
+(cumulative) время модулей верхнего уровня, загруженных ради пакета, включая
+стандартные модули, которые импортируются впервые. Скрипт завершается с кодом
+1, если медиана превышает бюджет.
+
+Запуск:
+    python benchmarks/bench_import.py [--runs 15] [--budget-ms 40] [--statement "from task_package import Binary"]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Бюджет времени импорта по умолчанию, мс (см. README)
+BUDGET_MS = {
+    "import task_package": 30.0,
+    "from task_package import Binary": 40.0,
+}
+DEFAULT_BUDGET_MS = 40.0
+
+
+def import_time(statement: str) -> Dict[str, float]:
+    """Время (мс) модулей верхнего уровня, импортированных при выполнении statement"""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # Сначала импорт без замера, чтобы время не включало компиляцию в .pyc
+    subprocess.run([sys.executable, "-c", statement], env=env, check=True)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # Модули, загружаемые при старте интерпретатора, не относятся к пакету
+    baseline = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    startup = set(_top_level(baseline.stderr))
+    return {
+        name: ms
+        for name, ms in _top_level(result.stderr).items()
+        if name not in startup
+    }
+
+
+def _top_level(report: str) -> Dict[str, float]:
+    modules: Dict[str, float] = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith(" ") and not name.startswith("  "):
+            try:
+                modules[name.strip()] = int(cumulative) / 1000
+            except ValueError:
+                continue  # строка заголовка
+    return modules
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Время холодного импорта task_package")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument(
+        "--statement", action="append", help="измеряемая инструкция (можно несколько)"
+    )
+    parser.add_argument(
+        "--budget-ms", type=float, help="бюджет для всех инструкций, мс"
+    )
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for statement in args.statement or list(BUDGET_MS):
+        totals = []
+        modules: Dict[str, float] = {}
+        for _ in range(args.runs):
+            modules = import_time(statement)
+            totals.append(sum(modules.values()))
+        median = statistics.median(totals)
+        budget = args.budget_ms or BUDGET_MS.get(statement, DEFAULT_BUDGET_MS)
+        status = "в пределах бюджета" if median <= budget else "ПРЕВЫШЕН БЮДЖЕТ"
+        print(
+            f"{statement!r}: медиана {median:.1f} мс, бюджет {budget:.0f} мс — {status}"
+        )
+        for name, ms in sorted(modules.items(), key=lambda item: -item[1]):
+            print(f"    {name:40} {ms:7.1f} мс")
+        failed += median > budget
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
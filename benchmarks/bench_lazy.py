@@ -0,0 +1,80 @@
+"""Цепочка из 10 операций: пошаговые Real/RealArray против слитого ленивого выражения.
+
+Сравнивает три варианта на --size входах: цикл по Real с объектом на каждом
+шаге, RealArray с промежуточным массивом на каждом шаге и lazy.Expr,
+скомпилированное в одно ядро.
+
+Запуск: python benchmarks/bench_lazy.py [--size N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package.arrays import RealArray, has_numpy  # noqa: E402
+from task_package.lazy import Expr, var  # noqa: E402
+from task_package.zad1 import Real  # noqa: E402
+
+
+def chain_real(value: Real) -> Real:
+    step = Real(value.add(5)._value).power(2)
+    step = Real(step.divide(3)._value).power(0.5)
+    step = Real(step.add(1)._value).logarithm(2)
+    step = Real(step.add(2)._value).power(3)
+    step = Real(step.divide(7)._value)
+    return step.logarithm()
+
+
+def chain_array(values: RealArray) -> RealArray:
+    step = RealArray._wrap(values.add(5)._data).power(2)
+    step = RealArray._wrap(step.divide(3)._data).power(0.5)
+    step = RealArray._wrap(step.add(1)._data).logarithm(2)
+    step = RealArray._wrap(step.add(2)._data).power(3)
+    step = RealArray._wrap(step.divide(7)._data)
+    return step.logarithm()
+
+
+def chain_lazy() -> Expr:
+    x = var("x")
+    return (
+        x.add(5)
+        .power(2)
+        .divide(3)
+        .power(0.5)
+        .add(1)
+        .logarithm(2)
+        .add(2)
+        .power(3)
+        .divide(7)
+        .logarithm()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    floats = [rng.uniform(0.5, 100.0) for _ in range(args.size)]
+    reals = [Real(v) for v in floats]
+    values = RealArray(floats)
+    expr = chain_lazy()
+
+    assert expr.evaluate(x=values).tolist() == chain_array(values).tolist()
+    print(f"{args.size} входов, 10 шагов, NumPy: {'да' if has_numpy() else 'нет'}")
+    timings = (
+        ("Real по шагам", lambda: [chain_real(r) for r in reals]),
+        ("RealArray по шагам", lambda: chain_array(values)),
+        ("lazy, одно ядро", lambda: expr.evaluate(x=values)),
+    )
+    for name, func in timings:
+        print(f"{name:20} {min(timeit.repeat(func, number=1, repeat=3)):.3f} с")
+
+
+if __name__ == "__main__":
+    main()
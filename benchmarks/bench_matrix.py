@@ -0,0 +1,80 @@
+"""Решение рациональных систем: RationalMatrix (Бареисс) против исключения Гаусса над дробями.
+
+Строит случайную систему --size×--size с дробными коэффициентами и сравнивает
+RationalMatrix.solve, determinant и inverse с обычным методом Гаусса над
+fractions.Fraction (сокращение в каждой клетке на каждом шаге).
+
+Запуск: python benchmarks/bench_matrix.py [--size N] [--skip-baseline]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+from typing import Callable, List, Tuple, TypeVar
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package.matrix import RationalMatrix  # noqa: E402
+from task_package.rational import Rational  # noqa: E402
+
+V = TypeVar("V")
+
+
+def timed(func: Callable[[], V]) -> Tuple[float, V]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def gauss_solve(rows: List[List[Fraction]], rhs: List[Fraction]) -> List[Fraction]:
+    """Метод Гаусса-Жордана над Fraction"""
+    n = len(rows)
+    m = [row + [value] for row, value in zip(rows, rhs)]
+    for k in range(n):
+        pivot = next(i for i in range(k, n) if m[i][k])
+        m[k], m[pivot] = m[pivot], m[k]
+        inv = 1 / m[k][k]
+        m[k] = [x * inv for x in m[k]]
+        for i in range(n):
+            if i != k and m[i][k]:
+                factor = m[i][k]
+                m[i] = [a - factor * b for a, b in zip(m[i], m[k])]
+    return [row[n] for row in m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pairs = [
+        [(rng.randint(-99, 99), rng.randint(1, 9)) for _ in range(args.size)]
+        for _ in range(args.size)
+    ]
+    rhs_pairs = [(rng.randint(-99, 99), rng.randint(1, 9)) for _ in range(args.size)]
+    matrix = RationalMatrix([[Rational(n, d) for n, d in row] for row in pairs])
+    rhs = [Rational(n, d) for n, d in rhs_pairs]
+
+    print(f"Система {args.size}×{args.size}:")
+    elapsed, solution = timed(lambda: matrix.solve(rhs))
+    print(f"  RationalMatrix.solve        {elapsed:.2f} с")
+    elapsed, _ = timed(matrix.determinant)
+    print(f"  RationalMatrix.determinant  {elapsed:.2f} с")
+    elapsed, _ = timed(matrix.inverse)
+    print(f"  RationalMatrix.inverse      {elapsed:.2f} с")
+    if not args.skip_baseline:
+        fractions = [[Fraction(n, d) for n, d in row] for row in pairs]
+        elapsed, expected = timed(
+            lambda: gauss_solve(fractions, [Fraction(n, d) for n, d in rhs_pairs])
+        )
+        assert [Fraction(x.numerator, x.denominator) for x in solution] == expected
+        print(f"  Гаусс над Fraction          {elapsed:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
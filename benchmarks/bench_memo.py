@@ -0,0 +1,57 @@
+"""Real.power и Real.logarithm с кэшем и без него на повторяющихся аргументах.
+
+Генерирует поток вызовов по --pairs различным парам (значение, показатель или
+основание) и сравнивает время без кэша и с кэшем enable_cache(--maxsize).
+
+Запуск: python benchmarks/bench_memo.py [--calls N] [--pairs N] [--maxsize N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import zad1  # noqa: E402
+from task_package.zad1 import Real  # noqa: E402
+
+
+def workload(calls: int, pairs: int) -> List[Tuple[Real, float]]:
+    rng = random.Random(0)
+    distinct = [
+        (Real(rng.uniform(1.0, 100.0)), rng.choice((2.0, 10.0, 0.5, 1.5)))
+        for _ in range(pairs)
+    ]
+    return [rng.choice(distinct) for _ in range(calls)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--pairs", type=int, default=4000)
+    parser.add_argument("--maxsize", type=int, default=8192)
+    args = parser.parse_args()
+
+    calls = workload(args.calls, args.pairs)
+    for name, method in (("power", Real.power), ("logarithm", Real.logarithm)):
+        zad1.disable_cache()
+        plain = min(
+            timeit.repeat(lambda: [method(x, y) for x, y in calls], number=1, repeat=3)
+        )
+        zad1.enable_cache(args.maxsize)
+        cached = min(
+            timeit.repeat(lambda: [method(x, y) for x, y in calls], number=1, repeat=3)
+        )
+        info = zad1.cache_info()
+        print(
+            f"{name:10} без кэша {plain:.3f} с, с кэшем {cached:.3f} с ({plain / cached:.2f}x), "
+            f"попаданий {info['hits']}, промахов {info['misses']}"
+        )
+    zad1.disable_cache()
+
+
+if __name__ == "__main__":
+    main()
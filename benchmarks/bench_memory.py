@@ -0,0 +1,58 @@
+"""Память на хранение цифр: список int против компактного формата Integer.
+
+Запуск: python benchmarks/bench_memory.py [--digits N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package.zad2 import Binary, Decimal  # noqa: E402
+
+
+class ListDecimal:
+    """Прежняя раскладка: цифры в списке Python и __dict__ у экземпляра"""
+
+    def __init__(self, digits: List[int]) -> None:
+        self.digits = digits
+
+
+def measure(factory: Callable[[], object]) -> int:
+    """Память, удерживаемая построенным объектом"""
+    tracemalloc.start()
+    obj = factory()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--digits", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    dec_digits = [rng.randrange(10) for _ in range(args.digits)]
+    bin_digits = [rng.randrange(2) for _ in range(args.digits)]
+
+    rows = [
+        ("Decimal, список", lambda: ListDecimal(list(dec_digits))),
+        ("Decimal, компактно", lambda: Decimal(dec_digits)),
+        ("Binary, список", lambda: ListDecimal(list(bin_digits))),
+        ("Binary, компактно", lambda: Binary(bin_digits)),
+    ]
+    for name, factory in rows:
+        size = measure(factory)
+        print(
+            f"{name:20} {size / 1024:10.1f} КиБ  ({size / args.digits:.3f} байт на цифру)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Накопление суммы: именованные методы против операторов на месте.
+
+Считает созданные объекты-обёртки и время на операцию для
+``total = total.add(x)`` и ``total += x``.
+
+Запуск: python benchmarks/bench_operators.py [--ops N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package.zad1 import Number, Real  # noqa: E402
+from task_package.zad2 import Binary, Decimal  # noqa: E402
+
+_created: Dict[type, int] = {}
+
+
+def count_instances(cls: type) -> None:
+    """Подмена __new__ для подсчёта созданных экземпляров класса"""
+
+    def __new__(klass: type, *args: object, **kwargs: object) -> object:
+        _created[klass] = _created.get(klass, 0) + 1
+        return object.__new__(klass)
+
+    cls.__new__ = __new__  # type: ignore[assignment]
+
+
+def measure(loop: Callable[[int], object], ops: int) -> Tuple[float, float]:
+    """Объекты и наносекунды на одну операцию"""
+    _created.clear()
+    start = time.perf_counter()
+    loop(ops)
+    elapsed = time.perf_counter() - start
+    return sum(_created.values()) / ops, elapsed / ops * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for cls in (Number, Real, Decimal, Binary):
+        count_instances(cls)
+
+    def named_number(n: int) -> None:
+        total, step = Number(0), Number(1.5)
+        for _ in range(n):
+            total = total.add(step)
+
+    def inplace_number(n: int) -> None:
+        total, step = Number(0), Number(1.5)
+        for _ in range(n):
+            total += step
+
+    def named_real(n: int) -> None:
+        total = Real(1.0)
+        for _ in range(n):
+            total = total.power(1.0)
+
+    def inplace_real(n: int) -> None:
+        total = Real(1.0)
+        for _ in range(n):
+            total **= 1.0
+
+    def named_decimal(n: int) -> None:
+        total, step = Decimal([0]), Decimal([7])
+        for _ in range(n):
+            total = total.add(step)
+
+    def inplace_decimal(n: int) -> None:
+        total, step = Decimal([0]), Decimal([7])
+        for _ in range(n):
+            total += step
+
+    def named_binary(n: int) -> None:
+        total, step = Binary([0]), Binary([1, 1])
+        for _ in range(n):
+            total = total.multiply(step)
+
+    def inplace_binary(n: int) -> None:
+        total, step = Binary([0]), Binary([1, 1])
+        for _ in range(n):
+            total *= step
+
+    cases = [
+        ("Number.add / +=", named_number, inplace_number),
+        ("Real.power / **=", named_real, inplace_real),
+        ("Decimal.add / +=", named_decimal, inplace_decimal),
+        ("Binary.multiply / *=", named_binary, inplace_binary),
+    ]
+    for name, named, inplace in cases:
+        named_allocs, named_ns = measure(named, args.ops)
+        inplace_allocs, inplace_ns = measure(inplace, args.ops)
+        print(
+            f"{name:22} до: {named_allocs:.2f} объектов/оп, {named_ns:6.0f} нс/оп; "
+            f"после: {inplace_allocs:.2f} объектов/оп, {inplace_ns:6.0f} нс/оп"
+        )
+
+
+if __name__ == "__main__":
+    main()
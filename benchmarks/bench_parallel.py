@@ -0,0 +1,60 @@
+"""Масштабирование parallel_map по числу процессов.
+
+Строит набор умножений Decimal смешанного размера (от десятков до десятков
+тысяч цифр, логарифмически равномерно) и сравнивает последовательное
+выполнение с пулом из 1..N процессов.
+
+Запуск: python benchmarks/bench_parallel.py [--count N] [--max-digits N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package.parallel import parallel_map  # noqa: E402
+from task_package.zad2 import Decimal  # noqa: E402
+
+
+def operands(count: int, max_digits: int, seed: int) -> List[Decimal]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(count):
+        digits = int(10 ** rng.uniform(1, len(str(max_digits)) - 1))
+        out.append(Decimal.from_int(rng.getrandbits(digits * 10 // 3)))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--max-digits", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    lefts = operands(args.count, args.max_digits, 1)
+    rights = operands(args.count, args.max_digits, 2)
+
+    start = time.perf_counter()
+    expected = [a.multiply(b) for a, b in zip(lefts, rights)]
+    serial = time.perf_counter() - start
+    print(f"{args.count} умножений, последовательно: {serial:.2f} с")
+
+    workers = 1
+    while workers <= args.workers:
+        start = time.perf_counter()
+        result = parallel_map(Decimal.multiply, lefts, rights, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(
+            f"процессов {workers:3}: {elapsed:.2f} с, ускорение {serial / elapsed:.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Цепочки сложения дробей: Rational против fractions.Fraction и examples/example1.py.
+
+Складывает 1/1 + 1/2 + ... + 1/N (гармонический ряд) и знакочередующийся ряд
+с малыми знаменателями, по одной операции add на слагаемое, а также
+Rational.sum (попарное сложение с отложенным сокращением).
+
+Запуск: python benchmarks/bench_rational.py [--terms N] [--example]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from fractions import Fraction
+from typing import Any, Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+
+from task_package.rational import Rational  # noqa: E402
+
+
+def chain(terms: List[Any], zero: Any, add: Callable[[Any, Any], Any]) -> Any:
+    acc = zero
+    for term in terms:
+        acc = add(acc, term)
+    return acc
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=5000)
+    parser.add_argument(
+        "--example",
+        action="store_true",
+        help="также examples/example1.Rational (медленно)",
+    )
+    args = parser.parse_args()
+
+    series = {
+        "гармонический": [(1, k) for k in range(1, args.terms + 1)],
+        "знакочередующийся": [((-1) ** k, 1 + k % 12) for k in range(args.terms)],
+    }
+    for name, pairs in series.items():
+        rationals = [Rational(n, d) for n, d in pairs]
+        fractions = [Fraction(n, d) for n, d in pairs]
+        expected = chain(fractions, Fraction(0), Fraction.__add__)
+        assert chain(rationals, Rational(0), Rational.add) == Rational(
+            expected.numerator, expected.denominator
+        )
+        assert Rational.sum(rationals) == Rational(
+            expected.numerator, expected.denominator
+        )
+        print(f"{name}, {args.terms} слагаемых:")
+        t_rational = min(
+            timeit.repeat(
+                lambda: chain(rationals, Rational(0), Rational.add), number=1, repeat=3
+            )
+        )
+        t_fraction = min(
+            timeit.repeat(
+                lambda: chain(fractions, Fraction(0), Fraction.__add__),
+                number=1,
+                repeat=3,
+            )
+        )
+        t_sum = min(timeit.repeat(lambda: Rational.sum(rationals), number=1, repeat=3))
+        print(f"  Rational  {t_rational:.3f} с")
+        print(f"  sum       {t_sum:.3f} с ({t_rational / t_sum:.2f}x быстрее цепочки)")
+        print(f"  Fraction  {t_fraction:.3f} с ({t_fraction / t_rational:.2f}x)")
+        if args.example:
+            from example1 import Rational as ExampleRational
+
+            # Пример теряет знак, поэтому сравнивается только время
+            examples = [ExampleRational(n, d) for n, d in pairs]
+            try:
+                t_example = timeit.timeit(
+                    lambda: chain(examples, ExampleRational(0), ExampleRational.add),
+                    number=1,
+                )
+            except RecursionError:
+                print("  example1  RecursionError в рекурсивном gcd")
+            else:
+                print(f"  example1  {t_example:.3f} с ({t_example / t_rational:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
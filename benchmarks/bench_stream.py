@@ -0,0 +1,79 @@
+"""Пиковая память и время Decimal/Binary.from_stream на больших файлах.
+
+Создаёт временный файл из случайных цифр заданного размера и читает его
+потоково. Прежний путь (весь текст + int + список цифр) можно включить
+флагом --baseline; на сотнях мегабайт он требует в десятки раз больше памяти.
+
+Запуск: python benchmarks/bench_stream.py [--megabytes N] [--baseline]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert  # noqa: E402
+from task_package.zad2 import Binary, Decimal, RadixInteger  # noqa: E402
+
+
+def write_digits(path: str, base: int, size: int) -> None:
+    """Запись size случайных цифр порциями по 1 МиБ"""
+    rng = random.Random(base)
+    alphabet = convert.ALPHABET[:base]
+    with open(path, "wb") as out:
+        left = size
+        while left:
+            count = min(left, 1 << 20)
+            out.write(bytes(rng.choices(alphabet, k=count)))
+            left -= count
+
+
+def measure(func: Callable[[], object]) -> Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def baseline(cls: type, path: str) -> RadixInteger:
+    """Прежний подход: весь текст, затем список цифр"""
+    with open(path, "rb") as stream:
+        text = stream.read().strip()
+    return cls([int(ch, cls.BASE) for ch in text.decode()])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--baseline", action="store_true")
+    args = parser.parse_args()
+
+    size = args.megabytes << 20
+    with tempfile.TemporaryDirectory() as tmp:
+        for cls in (Decimal, Binary):
+            path = os.path.join(tmp, f"{cls.__name__}.txt")
+            write_digits(path, cls.BASE, size)
+            elapsed, peak = measure(lambda: cls.from_stream(path, args.chunk_size))
+            print(
+                f"{cls.__name__:8} {args.megabytes} МиБ: from_stream {elapsed:.2f} с, пик {peak / size:.2f} байт на цифру"
+            )
+            if args.baseline:
+                elapsed, peak = measure(lambda: baseline(cls, path))
+                print(
+                    f"{'':8} прежний путь {elapsed:.2f} с, пик {peak / size:.2f} байт на цифру"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Проверка цифр: прежний цикл по цифрам против convert.digits_valid.
+
+Запуск: python benchmarks/bench_validation.py [--digits N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert  # noqa: E402
+from task_package.zad2 import Binary, Decimal  # noqa: E402
+
+
+def loop_validate_digits(digits: List[int]) -> None:
+    """Прежняя проверка Decimal._validate_digits"""
+    for digit in digits:
+        if not 0 <= digit <= 9:
+            raise ValueError("Цифры должны быть в диапазоне 0-9")
+
+
+def loop_validate_bits(digits: List[int]) -> None:
+    """Прежняя проверка Binary._validate_bits"""
+    for bit in digits:
+        if bit not in (0, 1):
+            raise ValueError("Биты должны быть 0 или 1")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--digits", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cases = [
+        ("Decimal", 10, loop_validate_digits, Decimal),
+        ("Binary", 2, loop_validate_bits, Binary),
+    ]
+    for name, base, loop, cls in cases:
+        digits = [rng.randrange(base) for _ in range(args.digits)]
+        old = min(timeit.repeat(lambda: loop(digits), number=1, repeat=args.repeat))
+        new = min(
+            timeit.repeat(
+                lambda: convert.digits_valid(bytes(digits), base),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        build = min(timeit.repeat(lambda: cls(digits), number=1, repeat=args.repeat))
+        print(
+            f"{name:8} {args.digits} цифр: цикл {old * 1e3:.2f} мс, "
+            f"translate {new * 1e3:.2f} мс (x{old / new:.0f}), конструктор {build * 1e3:.2f} мс"
+        )
+
+
+if __name__ == "__main__":
+    main()
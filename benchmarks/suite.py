@@ -0,0 +1,304 @@
+"""Набор замеров горячих путей zad1 и zad2 с сохранением результатов и поиском регрессий.
+
+Замеры: создание Decimal/Binary из цифр, to_int/from_int, add, subtract,
+multiply, divide, mod для размеров от 1 до 10^6 цифр (операнды из from_int, а
+в замерах *_raw — из _from_raw, то есть только цифрами), а также Number.add,
+Number.divide, Real.power и Real.logarithm. Время измеряется стандартным
+timeit; тот же набор доступен как тесты pytest-benchmark (test_suite.py).
+
+Запуск:
+    python benchmarks/suite.py run [--max-digits N] [--filter TEXT] [-o results.json]
+    python benchmarks/suite.py compare baseline.json results.json [--threshold 0.1]
+
+compare принимает и JSON этого скрипта, и JSON pytest-benchmark
+(--benchmark-json) и завершается с кодом 1, если какой-либо замер медленнее
+базового больше чем на threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert  # noqa: E402
+from task_package.zad1 import Number, Real  # noqa: E402
+from task_package.zad2 import Binary, Decimal, RadixInteger  # noqa: E402
+
+SIZES = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+Setup = Callable[[int], Callable[[], object]]
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Setup
+    sizes: Sequence[int] = SIZES
+
+
+def _raw(cls: type, digits: int, seed: int) -> bytes:
+    """Случайные значения цифр без ведущего нуля"""
+    rng = random.Random(seed * 1_000_003 + digits)
+    base = cls.BASE  # type: ignore[attr-defined]
+    return bytes(
+        [rng.randrange(1, base)] + [rng.randrange(base) for _ in range(digits - 1)]
+    )
+
+
+def _construct(cls: type) -> Setup:
+    def setup(digits: int) -> Callable[[], object]:
+        values = list(_raw(cls, digits, 1))
+        return lambda: cls(values)
+
+    return setup
+
+
+def _to_int(cls: type) -> Setup:
+    def setup(digits: int) -> Callable[[], object]:
+        raw = _raw(cls, digits, 1)
+        return lambda: cls._from_raw(raw).to_int()  # type: ignore[attr-defined]
+
+    return setup
+
+
+def _from_int(cls: type) -> Setup:
+    def setup(digits: int) -> Callable[[], object]:
+        value = convert.to_int(_raw(cls, digits, 1), cls.BASE)  # type: ignore[attr-defined]
+        return lambda: cls.from_int(value)._storage()  # type: ignore[attr-defined]
+
+    return setup
+
+
+def _binary_op(
+    cls: type, method: Callable[[Any, Any], Any], divisor_digits: Callable[[int], int]
+) -> Setup:
+    def setup(digits: int) -> Callable[[], object]:
+        base = cls.BASE  # type: ignore[attr-defined]
+        a: RadixInteger = cls.from_int(convert.to_int(_raw(cls, digits, 1), base))  # type: ignore[attr-defined]
+        b: RadixInteger = cls.from_int(convert.to_int(_raw(cls, divisor_digits(digits), 2), base))  # type: ignore[attr-defined]
+        return lambda: method(a, b)
+
+    return setup
+
+
+def _binary_op_raw(
+    cls: type, method: Callable[[Any, Any], Any], divisor_digits: Callable[[int], int]
+) -> Setup:
+    """Операнды заданы только цифрами: объекты создаются заново, чтобы int не кэшировался"""
+
+    def setup(digits: int) -> Callable[[], object]:
+        left = _raw(cls, digits, 1)
+        right = _raw(cls, divisor_digits(digits), 2)
+        from_raw = cls._from_raw  # type: ignore[attr-defined]
+        return lambda: method(from_raw(left), from_raw(right))
+
+    return setup
+
+
+def _float_op(
+    cls: type, method: Callable[[Any, Any], Any], left: float, right: float
+) -> Setup:
+    def setup(digits: int) -> Callable[[], object]:
+        value = cls(left)
+        return lambda: method(value, right)
+
+    return setup
+
+
+def _same(digits: int) -> int:
+    return digits
+
+
+def _half(digits: int) -> int:
+    return max(1, digits // 2)
+
+
+def _cases() -> List[Case]:
+    cases: List[Case] = []
+    for cls in (Decimal, Binary):
+        prefix = f"zad2.{cls.__name__}"
+        cases += [
+            Case(f"{prefix}.construct", _construct(cls)),
+            Case(f"{prefix}.to_int", _to_int(cls)),
+            Case(f"{prefix}.from_int", _from_int(cls)),
+            Case(f"{prefix}.add", _binary_op(cls, cls.add, _same)),
+            Case(f"{prefix}.subtract", _binary_op(cls, cls.subtract, _same)),
+            Case(f"{prefix}.multiply", _binary_op(cls, cls.multiply, _same)),
+            Case(f"{prefix}.divide", _binary_op(cls, cls.divide, _half)),
+            Case(f"{prefix}.mod", _binary_op(cls, cls.mod, _half)),
+            Case(f"{prefix}.add_raw", _binary_op_raw(cls, cls.add, _same)),
+            Case(f"{prefix}.multiply_raw", _binary_op_raw(cls, cls.multiply, _same)),
+            Case(f"{prefix}.divide_raw", _binary_op_raw(cls, cls.divide, _half)),
+        ]
+    cases += [
+        Case("zad1.Number.add", _float_op(Number, Number.add, 10.5, 2.5), (1,)),
+        Case("zad1.Number.divide", _float_op(Number, Number.divide, 10.5, 2.5), (1,)),
+        Case("zad1.Real.power", _float_op(Real, Real.power, 8.0, 0.5), (1,)),
+        Case("zad1.Real.logarithm", _float_op(Real, Real.logarithm, 8.0, 2.0), (1,)),
+    ]
+    return cases
+
+
+CASES = _cases()
+
+
+def select(
+    max_digits: int, pattern: Optional[str] = None
+) -> Iterator[Tuple[Case, int]]:
+    """Пары (замер, размер) с учётом ограничения размера и фильтра по имени"""
+    for case in CASES:
+        if pattern and pattern not in case.name:
+            continue
+        for digits in case.sizes:
+            if digits <= max_digits:
+                yield case, digits
+
+
+def measure(
+    func: Callable[[], object], rounds: int, min_time: float
+) -> Dict[str, float]:
+    """Статистика времени одного вызова (секунды) в формате pytest-benchmark"""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time and number < 1 << 30:
+        number *= 2
+    times = [t / number for t in timer.repeat(repeat=rounds, number=number)]
+    return {
+        "min": min(times),
+        "max": max(times),
+        "mean": statistics.fmean(times),
+        "median": statistics.median(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": number,
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    results: List[Dict[str, Any]] = []
+    for case, digits in select(args.max_digits, args.filter):
+        stats = measure(case.setup(digits), args.rounds, args.min_time)
+        print(f"{case.name:28} {digits:>9} цифр: {_format_time(stats['min'])}")
+        results.append(
+            {
+                "name": f"{case.name}[{digits}]",
+                "params": {"digits": digits},
+                "extra_info": {"case": case.name, "digits": digits},
+                "stats": stats,
+            }
+        )
+    document = {
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "benchmarks": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            json.dump(document, out, indent=2, ensure_ascii=False)
+        print(f"Результаты записаны в {args.output}")
+    return 0
+
+
+def load(path: str, statistic: str) -> Dict[str, float]:
+    """Время по ключу «замер[размер]» из JSON этого скрипта или pytest-benchmark"""
+    with open(path, encoding="utf-8") as stream:
+        document = json.load(stream)
+    timings: Dict[str, float] = {}
+    for entry in document.get("benchmarks", []):
+        extra = entry.get("extra_info") or {}
+        key = (
+            f"{extra['case']}[{extra['digits']}]" if "case" in extra else entry["name"]
+        )
+        timings[key] = entry["stats"][statistic]
+    return timings
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = load(args.baseline, args.statistic)
+    current = load(args.current, args.statistic)
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys()):
+        ratio = current[key] / baseline[key]
+        mark = ""
+        if ratio > 1 + args.threshold:
+            mark = "  РЕГРЕССИЯ"
+            regressions += 1
+        elif ratio < 1 - args.threshold:
+            mark = "  ускорение"
+        print(
+            f"{key:40} {_format_time(baseline[key])} -> {_format_time(current[key])} ({ratio:.2f}x){mark}"
+        )
+    for key in sorted(baseline.keys() - current.keys()):
+        print(f"{key:40} отсутствует в новых результатах")
+    print(f"Регрессий сверх {args.threshold:.0%}: {regressions}")
+    return 1 if regressions else 0
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("с", 1.0), ("мс", 1e-3), ("мкс", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} нс"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="выполнить замеры")
+    run_parser.add_argument("--max-digits", type=int, default=SIZES[-1])
+    run_parser.add_argument(
+        "--filter", help="только замеры, в имени которых есть эта строка"
+    )
+    run_parser.add_argument("--rounds", type=int, default=5)
+    run_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="минимальное время одного раунда, с",
+    )
+    run_parser.add_argument("-o", "--output", help="файл JSON с результатами")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="сравнить результаты с базовыми"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="допустимое замедление (0.1 = 10%%)",
+    )
+    compare_parser.add_argument(
+        "--statistic", default="min", choices=("min", "mean", "median")
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
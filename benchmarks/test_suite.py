@@ -0,0 +1,30 @@
+"""Набор замеров suite.py в виде тестов pytest-benchmark.
+
+Запуск: pytest benchmarks/test_suite.py --benchmark-json=results.json
+Сравнение: python benchmarks/suite.py compare baseline.json results.json
+
+Размеры ограничиваются переменной окружения BENCH_MAX_DIGITS (по умолчанию 10^6).
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from suite import select  # noqa: E402
+
+MAX_DIGITS = int(os.environ.get("BENCH_MAX_DIGITS", 1_000_000))
+PARAMS = list(select(MAX_DIGITS))
+
+
+@pytest.mark.parametrize(
+    "case, digits", PARAMS, ids=[f"{case.name}-{digits}" for case, digits in PARAMS]
+)
+def test_benchmark(benchmark, case, digits):
+    benchmark.extra_info["case"] = case.name
+    benchmark.extra_info["digits"] = digits
+    benchmark(case.setup(digits))
@@ -0,0 +1,112 @@
+"""Подбор порогов умножения лимбами на текущей машине.
+
+Печатает точки перехода школьное -> Карацуба -> Тоом-3 (в лимбах) и длину,
+начиная с которой умножение лимбами быстрее пути через int для Decimal.
+
+Запуск: python benchmarks/tune_limbs.py [--max-digits N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from task_package import convert, limbs  # noqa: E402
+
+# Порог, который не достигается: алгоритм не выбирается
+NEVER = 1 << 30
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def crossover(
+    sizes: List[int],
+    slow: Callable[[List[int], List[int]], object],
+    fast: Callable[[List[int], List[int]], object],
+    repeat: int,
+) -> Optional[int]:
+    """Первая длина, на которой fast обгоняет slow"""
+    rng = random.Random(0)
+    radix = 10**limbs.LIMB_DIGITS
+    for size in sizes:
+        a = [rng.randrange(radix) for _ in range(size)]
+        b = [rng.randrange(radix) for _ in range(size)]
+        t_slow = best_time(lambda: slow(a, b), repeat)
+        t_fast = best_time(lambda: fast(a, b), repeat)
+        print(
+            f"  {size:6} лимбов: {t_slow * 1e3:9.3f} мс против {t_fast * 1e3:9.3f} мс"
+        )
+        if t_fast < t_slow:
+            return size
+    return None
+
+
+@contextmanager
+def thresholds(karatsuba: int, toom3: int) -> Iterator[None]:
+    """Временные пороги: рекурсивные вызовы mul_poly не зависят от текущих"""
+    saved = limbs.KARATSUBA_THRESHOLD, limbs.TOOM3_THRESHOLD
+    limbs.KARATSUBA_THRESHOLD, limbs.TOOM3_THRESHOLD = karatsuba, toom3
+    try:
+        yield
+    finally:
+        limbs.KARATSUBA_THRESHOLD, limbs.TOOM3_THRESHOLD = saved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-digits", type=int, default=400_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Один шаг Карацубы против школьного; подзадачи — школьным методом
+    print("Школьное -> Карацуба:")
+    with thresholds(NEVER, NEVER):
+        kara = crossover(
+            [16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512],
+            limbs.mul_schoolbook,
+            limbs.mul_karatsuba,
+            args.repeat,
+        )
+    kara = kara or NEVER
+    print(f"KARATSUBA_THRESHOLD ~ {kara} (сейчас {limbs.KARATSUBA_THRESHOLD})")
+
+    # Тоом-3 имеет смысл только выше порога Карацубы: TOOM3_THRESHOLD >= KARATSUBA_THRESHOLD
+    print("Карацуба -> Тоом-3:")
+    sizes = [size for size in (96, 150, 200, 300, 450, 600, 900, 1350) if size >= kara]
+    with thresholds(kara, NEVER):
+        toom = crossover(sizes, limbs.mul_karatsuba, limbs.mul_toom3, args.repeat)
+    toom = max(toom or NEVER, kara)
+    print(f"TOOM3_THRESHOLD ~ {toom} (сейчас {limbs.TOOM3_THRESHOLD})")
+
+    print("Путь через int -> лимбы (Decimal.multiply):")
+    rng = random.Random(1)
+    found = None
+    digits = 10_000
+    while digits <= args.max_digits:
+        left = convert.from_int(rng.getrandbits(int(digits * 3.33)))
+        right = convert.from_int(rng.getrandbits(int(digits * 3.33)))
+        t_int = best_time(
+            lambda: convert.from_int(convert.to_int(left) * convert.to_int(right)), 1
+        )
+        t_limbs = best_time(lambda: limbs.multiply_digits(left, right), 1)
+        print(f"  {digits:8} цифр: int {t_int:8.3f} с, лимбы {t_limbs:8.3f} с")
+        if found is None and t_limbs < t_int:
+            found = digits
+        digits *= 2
+    if found is None:
+        print(
+            f"DIGITS_THRESHOLD: лимбы медленнее до {args.max_digits} цифр, оставьте None (сейчас {limbs.DIGITS_THRESHOLD})"
+        )
+    else:
+        print(f"DIGITS_THRESHOLD ~ {found} (сейчас {limbs.DIGITS_THRESHOLD})")
+
+
+if __name__ == "__main__":
+    main()
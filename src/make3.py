@@ -0,0 +1,60 @@
+import argparse
+import io
+import sys
+from typing import List, Optional
+
+from .task_package.pipeline import CHUNK_SIZE, evaluate_file
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Вычисление файла выражений над целыми числами"
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="файл с выражениями (- для stdin)"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="файл результатов (- для stdout)"
+    )
+    parser.add_argument(
+        "--base", type=int, default=10, help="основание литералов без префикса"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=CHUNK_SIZE, help="размер порции строк"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="остановиться на первой ошибке"
+    )
+    args = parser.parse_args(argv)
+    if not 2 <= args.base <= 36:
+        parser.error("основание должно быть в диапазоне 2-36")
+    if args.chunk_size < 1:
+        parser.error("размер порции должен быть положительным")
+
+    # Байты вне ASCII заменяются на U+FFFD: такая строка даёт «error: ...»,
+    # а не прерывает обработку всего файла
+    if args.input == "-":
+        source = sys.stdin
+        if isinstance(source, io.TextIOWrapper):
+            source.reconfigure(errors="replace")
+    else:
+        source = open(args.input, encoding="ascii", errors="replace")
+    # Сообщения об ошибках в результатах содержат кириллицу
+    target = (
+        sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    )
+    try:
+        evaluate_file(source, target, args.base, args.chunk_size, args.strict)
+    except ValueError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
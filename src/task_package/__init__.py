@@ -1,4 +1,56 @@
-from .zad1 import Number, Real
-from .zad2 import Binary, Decimal, Integer, demonstrate_output
+"""Числовые классы zad1/zad2 и движки над ними.
 
-__all__ = ["Real", "Number", "Decimal", "Binary", "demonstrate_output", "Integer"]
+Имена пакета загружаются лениво, при первом обращении (PEP 562): ``from
+task_package import Binary`` импортирует только zad2 и его ядро
+преобразований, а массивы (NumPy), пакеты, параллельные вычисления и mmap
+подключаются, лишь когда нужны.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# Имена для проверки типов; во время выполнения их отдаёт __getattr__
+if TYPE_CHECKING:
+    from .arrays import NumberArray, RealArray  # noqa: F401
+    from .batch import BinaryBatch, DecimalBatch, IntegerBatch  # noqa: F401
+    from .zad1 import Number, Real  # noqa: F401
+    from .zad2 import (  # noqa: F401
+        Binary,
+        Decimal,
+        Integer,
+        Radix,
+        RadixInteger,
+        demonstrate_output,
+    )
+
+# Имя -> модуль, из которого оно загружается
+_EXPORTS = {
+    "Real": ".zad1",
+    "Number": ".zad1",
+    "Decimal": ".zad2",
+    "Binary": ".zad2",
+    "demonstrate_output": ".zad2",
+    "Integer": ".zad2",
+    "Radix": ".zad2",
+    "RadixInteger": ".zad2",
+    "NumberArray": ".arrays",
+    "RealArray": ".arrays",
+    "IntegerBatch": ".batch",
+    "DecimalBatch": ".batch",
+    "BinaryBatch": ".batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_EXPORTS])
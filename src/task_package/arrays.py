@@ -0,0 +1,159 @@
+"""Массивы чисел Number/Real с поэлементными операциями.
+
+Значения хранятся в непрерывном буфере float64: ``numpy.ndarray``, если NumPy
+установлен, иначе ``array('d')``. Проверки деления на ноль и области
+определения логарифма выполняются сразу для всего массива.
+"""
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .zad1 import Number, Real
+
+try:
+    import numpy as np  # type: ignore[import]
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None
+
+A = TypeVar("A", bound="NumberArray")
+Operand = Union["NumberArray", Number, float, int]
+
+
+def has_numpy() -> bool:
+    """Доступен ли NumPy в качестве бэкенда"""
+    return np is not None
+
+
+class NumberArray:
+    """Массив чисел с плавающей точкой с операциями Number"""
+
+    __slots__ = ("_data",)
+
+    item_type: Type[Number] = Number
+
+    def __init__(self, values: Iterable[Union[Number, float, int]] = ()) -> None:
+        floats = [v._value if isinstance(v, Number) else float(v) for v in values]
+        self._data: Any = (
+            np.array(floats, dtype=np.float64) if np is not None else array("d", floats)
+        )
+
+    @classmethod
+    def _wrap(cls: Type[A], data: Any) -> A:
+        """Создание массива поверх готового буфера без копирования"""
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
+    def _operand(self, other: Operand) -> Any:
+        """Буфер другого массива или скаляр float для трансляции"""
+        if isinstance(other, NumberArray):
+            if len(other) != len(self):
+                raise ValueError("Размеры массивов не совпадают")
+            return other._data
+        if isinstance(other, Number):
+            return other._value
+        return float(other)
+
+    def _apply(self, func: Callable[[Any, Any], Any], operand: Any) -> Any:
+        if np is not None:
+            return func(self._data, operand)
+        if isinstance(operand, float):
+            return array("d", map(func, self._data, repeat(operand)))
+        return array("d", map(func, self._data, operand))
+
+    def add(self: A, other: Operand) -> A:
+        """Поэлементное сложение"""
+        return self._wrap(self._apply(operator.add, self._operand(other)))
+
+    def divide(self: A, other: Operand) -> A:
+        """Поэлементное деление"""
+        operand = self._operand(other)
+        if _has_zero(operand):
+            raise ValueError("Деление на ноль невозможно")
+        return self._wrap(self._apply(operator.truediv, operand))
+
+    def tolist(self) -> List[float]:
+        """Значения в виде списка float"""
+        return list(map(float, self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> Number:
+        return self.item_type(self._data[index])
+
+    def __iter__(self) -> Iterator[Number]:
+        item_type = self.item_type
+        return (item_type(value) for value in self._data)
+
+    def __str__(self) -> str:
+        return str(self.tolist())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.tolist()})"
+
+
+class RealArray(NumberArray):
+    """Массив чисел с операциями Real"""
+
+    __slots__ = ()
+
+    item_type = Real
+
+    def power(self, exponent: Operand) -> "RealArray":
+        """Поэлементное возведение в степень"""
+        return self._wrap(self._apply(operator.pow, self._operand(exponent)))
+
+    def logarithm(self, base: Optional[Operand] = None) -> "RealArray":
+        """Поэлементный логарифм (натуральный, если base не указан)"""
+        if base is None:
+            if _has_non_positive(self._data):
+                raise ValueError("Логарифм определен только для положительных чисел")
+            if np is not None:
+                return self._wrap(np.log(self._data))
+            return self._wrap(array("d", map(math.log, self._data)))
+
+        operand = self._operand(base)
+        if _has_non_positive(self._data) or _invalid_base(operand):
+            raise ValueError("Некорректные значения для логарифма")
+        if np is not None:
+            return self._wrap(np.log(self._data) / np.log(operand))
+        return self._wrap(self._apply(math.log, operand))
+
+
+def _has_non_positive(data: Any) -> bool:
+    # min() не годится: NaN в начале скрывает отрицательные значения
+    if np is not None:
+        return bool((data <= 0).any())
+    return any(value <= 0 for value in data)
+
+
+def _contains(operand: Any, value: float) -> bool:
+    if np is not None:
+        return bool((operand == value).any())
+    return value in operand
+
+
+def _has_zero(operand: Any) -> bool:
+    if isinstance(operand, float):
+        return operand == 0
+    return _contains(operand, 0.0)
+
+
+def _invalid_base(operand: Any) -> bool:
+    if isinstance(operand, float):
+        return operand <= 0 or operand == 1
+    return _has_non_positive(operand) or _contains(operand, 1.0)
@@ -0,0 +1,184 @@
+"""Пакеты целых чисел Decimal/Binary в колоночном формате.
+
+Пакет хранит цифры всех чисел в одном буфере (по байту на цифру) и массив
+смещений. Проверка цифр выполняется один раз на весь буфер, а арифметика
+применяется ко всему пакету за один вызов. Как и у Integer, буфер и список
+значений строятся лениво друг из друга.
+"""
+
+import operator
+from array import array
+from itertools import accumulate
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from . import convert
+from .zad2 import Binary, Decimal, Integer
+
+B = TypeVar("B", bound="IntegerBatch")
+
+
+class IntegerBatch:
+    """Пакет неотрицательных целых чисел одной системы счисления"""
+
+    __slots__ = ("_buffer", "_offsets", "_values")
+
+    item_type: Type[Integer]
+
+    def __init__(self, numbers: Iterable[Sequence[int]] = ()) -> None:
+        chunks = [self.item_type._digit_bytes(digits) for digits in numbers]
+        buffer = b"".join(chunks)
+        self._validate(buffer)
+        self._buffer: Optional[bytes] = buffer
+        self._offsets: Optional[array] = _offsets(chunks)
+        self._values: Optional[List[int]] = None
+
+    @classmethod
+    def from_ints(cls: Type[B], values: Iterable[int]) -> B:
+        """Пакет из целых чисел (знак отбрасывается); буфер строится лениво"""
+        return cls._from_values([abs(value) for value in values])
+
+    @classmethod
+    def from_items(cls: Type[B], items: Iterable[Integer]) -> B:
+        """Пакет из объектов item_type"""
+        values = []
+        for item in items:
+            if not isinstance(item, cls.item_type):
+                raise TypeError(
+                    f"Элементы пакета должны иметь тип {cls.item_type.__name__}"
+                )
+            values.append(item.to_int())
+        return cls._from_values(values)
+
+    @classmethod
+    def _from_values(cls: Type[B], values: List[int]) -> B:
+        obj = cls.__new__(cls)
+        obj._buffer = None
+        obj._offsets = None
+        obj._values = values
+        return obj
+
+    def _validate(self, buffer: bytes) -> None:
+        """Проверка всех цифр пакета за один проход"""
+        if not convert.digits_valid(buffer, self.item_type.BASE):
+            raise ValueError(self.item_type._DIGITS_ERROR)
+
+    def to_ints(self) -> List[int]:
+        """Значения всех чисел пакета (результат кэшируется)"""
+        if self._values is None:
+            base = self.item_type.BASE
+            text = convert.to_ascii(self._buffer or b"")
+            offsets = self._offsets or array("Q", [0])
+            self._values = [
+                _parse(text[start:end], base)
+                for start, end in zip(offsets, offsets[1:])
+            ]
+        return self._values
+
+    def _packed(self) -> bytes:
+        """Буфер цифр; строится из значений при первом обращении"""
+        if self._buffer is None:
+            base = self.item_type.BASE
+            chunks = [_format(value, base) for value in self._values or ()]
+            self._buffer = convert.from_ascii(b"".join(chunks))
+            self._offsets = _offsets(chunks)
+        return self._buffer
+
+    def _binary_op(self: B, other: B, func: Callable[[int, int], int]) -> B:
+        left, right = self._operands(other)
+        return self._from_values([abs(value) for value in map(func, left, right)])
+
+    def _operands(self, other: "IntegerBatch") -> Tuple[List[int], List[int]]:
+        if type(other) is not type(self):
+            raise TypeError("Операнды должны быть пакетами одного типа")
+        left, right = self.to_ints(), other.to_ints()
+        if len(left) != len(right):
+            raise ValueError("Размеры пакетов не совпадают")
+        return left, right
+
+    def add(self: B, other: B) -> B:
+        """Поэлементное сложение пакетов"""
+        return self._binary_op(other, operator.add)
+
+    def subtract(self: B, other: B) -> B:
+        """Поэлементное вычитание пакетов (по модулю, как у Integer)"""
+        return self._binary_op(other, operator.sub)
+
+    def multiply(self: B, other: B) -> B:
+        """Поэлементное умножение пакетов"""
+        return self._binary_op(other, operator.mul)
+
+    def divide(self: B, other: B) -> B:
+        """Поэлементное целочисленное деление пакетов"""
+        left, right = self._operands(other)
+        if 0 in right:
+            raise ValueError("Деление на ноль")
+        return self._from_values(list(map(operator.floordiv, left, right)))
+
+    def __len__(self) -> int:
+        if self._values is not None:
+            return len(self._values)
+        return len(self._offsets or ()) - 1
+
+    def __getitem__(self, index: int) -> Integer:
+        if self._values is not None:
+            return self.item_type.from_int(self._values[index])
+        offsets = self._offsets or array("Q", [0])
+        index = range(len(self))[index]
+        return self.item_type._from_raw(
+            self._packed()[offsets[index] : offsets[index + 1]]
+        )
+
+    def __iter__(self) -> Iterator[Integer]:
+        from_int = self.item_type.from_int
+        return (from_int(value) for value in self.to_ints())
+
+    def __repr__(self) -> str:
+        packed = self._packed()
+        offsets = self._offsets or array("Q", [0])
+        numbers = [list(packed[start:end]) for start, end in zip(offsets, offsets[1:])]
+        return f"{type(self).__name__}({numbers})"
+
+
+class DecimalBatch(IntegerBatch):
+    """Пакет десятичных чисел"""
+
+    __slots__ = ()
+
+    item_type = Decimal
+
+
+class BinaryBatch(IntegerBatch):
+    """Пакет двоичных чисел"""
+
+    __slots__ = ()
+
+    item_type = Binary
+
+
+def _offsets(chunks: List[bytes]) -> array:
+    """Смещения начала каждого числа в общем буфере"""
+    offsets = array("Q", [0])
+    offsets.extend(accumulate(map(len, chunks)))
+    return offsets
+
+
+def _parse(text: bytes, base: int) -> int:
+    if len(text) <= convert.LEAF_DIGITS or convert.is_power_of_two(base):
+        return int(text, base) if text else 0
+    return convert.to_int(convert.from_ascii(text), base)
+
+
+def _format(value: int, base: int) -> bytes:
+    if base == 10 and value.bit_length() < 3 * convert.LEAF_DIGITS:
+        return b"%d" % value
+    return convert.to_ascii(convert.from_int(value, base))
@@ -0,0 +1,291 @@
+"""Движок преобразования между int и массивами цифр в произвольной системе счисления.
+
+Цифры хранятся как ``bytes`` со значениями цифр (0..base-1), старшая цифра первой.
+Для систем, не являющихся степенью двойки, используется рекурсивное разбиение
+по заранее вычисленным степеням основания (``base ** (LEAF_DIGITS * 2**k)``),
+а деление на степени выполняет ``division.divmod_int``, поэтому преобразование
+не квадратично по числу цифр и не упирается в лимит ``sys.get_int_max_str_digits()``.
+Для степеней двойки используется нарезка битов. Очень большие значения
+(от ``PARALLEL_THRESHOLD`` цифр) разбиваются по тем же степеням основания
+на поддеревья, которые преобразуются в пуле процессов.
+"""
+
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from . import division
+
+DigitsLike = Union[bytes, bytearray, memoryview, Sequence[int]]
+
+ALPHABET = b"0123456789abcdefghijklmnopqrstuvwxyz"
+MAX_BASE = len(ALPHABET)
+
+# Количество цифр в листе рекурсии: ниже него работают встроенные str()/int()
+LEAF_DIGITS = 1000
+
+# Начиная с этого числа цифр поддеревья преобразуются в отдельных процессах
+# (None отключает параллельный путь); PARALLEL_WORKERS=None — по числу ядер
+PARALLEL_THRESHOLD: Optional[int] = 2_000_000
+PARALLEL_WORKERS: Optional[int] = None
+
+# До этой длины digit_count уточняет значения рядом со степенями основания
+_DIGIT_COUNT_EXACT = 100_000
+
+_TO_ASCII = bytes.maketrans(bytes(range(MAX_BASE)), ALPHABET)
+# Байты вне алфавита переводятся в 0xFF, чтобы их отвергала digits_valid
+_FROM_ASCII = bytes(ALPHABET.find(bytes([char]).lower()) & 0xFF for char in range(256))
+_POW2_FORMAT = {2: "b", 8: "o", 16: "x"}
+
+_powers: Dict[int, List[int]] = {}
+_digit_sets: Dict[int, bytes] = {}
+
+
+def _check_base(base: int) -> None:
+    if not 2 <= base <= MAX_BASE:
+        raise ValueError(f"Основание должно быть в диапазоне 2-{MAX_BASE}")
+
+
+def is_power_of_two(base: int) -> bool:
+    """Является ли основание степенью двойки"""
+    return base & (base - 1) == 0
+
+
+def digit_count(value: int, base: int = 10) -> int:
+    """Число цифр |value| в системе base без перевода в цифры
+
+    Для степеней двойки считается по длине в битах. Для остальных оснований —
+    по логарифму, который CPython берёт из старших бит числа; рядом со
+    степенью base (где точности float не хватает) значение сравнивается с
+    самой степенью, если она не длиннее _DIGIT_COUNT_EXACT цифр.
+    """
+    value = abs(value)
+    if value < base:
+        return 1
+    if is_power_of_two(base):
+        return -(-value.bit_length() // (base.bit_length() - 1))
+    estimate = math.log(value, base)
+    digits = math.floor(estimate) + 1
+    fraction = estimate - (digits - 1)
+    tolerance = 1e-12 * estimate
+    if fraction < tolerance and digits - 1 <= _DIGIT_COUNT_EXACT:
+        if value < base ** (digits - 1):
+            digits -= 1
+    elif fraction > 1 - tolerance and digits <= _DIGIT_COUNT_EXACT:
+        if value >= base**digits:
+            digits += 1
+    return digits
+
+
+def digits_valid(raw: Union[bytes, bytearray, memoryview], base: int) -> bool:
+    """Все ли значения цифр меньше основания (проверка без цикла Python)"""
+    valid = _digit_sets.get(base)
+    if valid is None:
+        valid = _digit_sets[base] = bytes(range(base))
+    return not bytes(raw).translate(None, valid)
+
+
+def power_table(base: int, level: int) -> List[int]:
+    """Таблица степеней base ** (LEAF_DIGITS * 2**k) для k = 0..level"""
+    table = _powers.get(base)
+    if table is None:
+        table = _powers[base] = [base**LEAF_DIGITS]
+    while len(table) <= level:
+        table.append(table[-1] * table[-1])
+    return table
+
+
+def to_ascii(digits: DigitsLike) -> bytes:
+    """Значения цифр -> ASCII-символы цифр"""
+    return bytes(digits).translate(_TO_ASCII)
+
+
+def from_ascii(text: Union[bytes, str]) -> bytes:
+    """ASCII-символы цифр -> значения цифр (без проверки; посторонние байты дают 0xFF)"""
+    if isinstance(text, str):
+        text = text.encode("ascii")
+    return text.translate(_FROM_ASCII)
+
+
+def to_int(digits: DigitsLike, base: int = 10) -> int:
+    """Преобразование массива цифр в целое число"""
+    _check_base(base)
+    ascii_digits = to_ascii(digits)
+    if not ascii_digits:
+        return 0
+    if is_power_of_two(base) or len(ascii_digits) <= LEAF_DIGITS:
+        return int(ascii_digits, base)
+    level = 0
+    while (LEAF_DIGITS << (level + 1)) < len(ascii_digits):
+        level += 1
+    workers = _parallel_workers(len(ascii_digits))
+    if workers > 1:
+        return _to_int_parallel(ascii_digits, base, level, workers)
+    return _to_int_rec(ascii_digits, base, level, power_table(base, level))
+
+
+def _to_int_rec(text: bytes, base: int, level: int, table: List[int]) -> int:
+    if len(text) <= LEAF_DIGITS:
+        return int(text, base)
+    while (LEAF_DIGITS << level) >= len(text):
+        level -= 1
+    split = len(text) - (LEAF_DIGITS << level)
+    high = _to_int_rec(text[:split], base, level, table)
+    low = _to_int_rec(text[split:], base, level, table)
+    return high * table[level] + low
+
+
+def from_int(num: int, base: int = 10) -> bytes:
+    """Преобразование целого числа (по модулю) в массив цифр"""
+    _check_base(base)
+    n = abs(num)
+    if n == 0:
+        return b"\x00"
+    if is_power_of_two(base):
+        return from_ascii(_format_pow2(n, base))
+    table = power_table(base, 0)
+    if n < table[0]:
+        return from_ascii(_leaf(n, base, 0))
+    level = 0
+    while True:
+        table = power_table(base, level + 1)
+        if table[level + 1] > n:
+            break
+        level += 1
+    workers = _parallel_workers(int(n.bit_length() / math.log2(base)))
+    if workers > 1:
+        return from_ascii(_from_int_parallel(n, base, level, workers))
+    pieces: List[bytes] = []
+    _from_int_rec(n, base, level, table, 0, pieces)
+    return from_ascii(b"".join(pieces))
+
+
+def _from_int_rec(
+    n: int, base: int, level: int, table: List[int], width: int, pieces: List[bytes]
+) -> None:
+    if level < 0:
+        pieces.append(_leaf(n, base, width))
+        return
+    size = LEAF_DIGITS << level
+    if not width and n < table[level]:
+        _from_int_rec(n, base, level - 1, table, 0, pieces)
+        return
+    high, low = division.divmod_int(n, table[level])
+    _from_int_rec(high, base, level - 1, table, width - size if width else 0, pieces)
+    _from_int_rec(low, base, level - 1, table, size, pieces)
+
+
+def _parallel_workers(ndigits: int) -> int:
+    """Число процессов для преобразования ndigits цифр (1 — без пула)"""
+    if PARALLEL_THRESHOLD is None or ndigits < PARALLEL_THRESHOLD:
+        return 1
+    from multiprocessing import parent_process
+
+    # В процессе-работнике (parallel_map, сервер) пул не вкладывается в пул
+    if parent_process() is not None:
+        return 1
+    return PARALLEL_WORKERS or os.cpu_count() or 1
+
+
+def _split_depth(workers: int) -> int:
+    """Глубина разбиения: примерно по два поддерева на процесс"""
+    return (workers - 1).bit_length() + 1
+
+
+def _to_int_parallel(text: bytes, base: int, level: int, workers: int) -> int:
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks: List[Tuple[bytes, int, int]] = []
+    plan = _plan_text(text, base, 0, len(text), level, _split_depth(workers), tasks)
+    with ProcessPoolExecutor(workers) as pool:
+        results = list(pool.map(_to_int_piece, *zip(*tasks)))
+    table = power_table(base, level)
+
+    def join(node: Union[int, Tuple[object, object, int]]) -> int:
+        if isinstance(node, int):
+            return results[node]
+        high, low, node_level = node
+        return join(high) * table[node_level] + join(low)  # type: ignore[arg-type]
+
+    return join(plan)
+
+
+def _plan_text(
+    text: bytes,
+    base: int,
+    lo: int,
+    hi: int,
+    level: int,
+    depth: int,
+    tasks: List[Tuple[bytes, int, int]],
+) -> Union[int, Tuple[object, object, int]]:
+    """Те же разрезы, что в _to_int_rec; верхние depth уровней остаются родителю"""
+    if depth == 0 or hi - lo <= LEAF_DIGITS:
+        tasks.append((text[lo:hi], base, level))
+        return len(tasks) - 1
+    while (LEAF_DIGITS << level) >= hi - lo:
+        level -= 1
+    split = hi - (LEAF_DIGITS << level)
+    high = _plan_text(text, base, lo, split, level, depth - 1, tasks)
+    low = _plan_text(text, base, split, hi, level, depth - 1, tasks)
+    return high, low, level
+
+
+def _to_int_piece(text: bytes, base: int, level: int) -> int:
+    return _to_int_rec(text, base, level, power_table(base, max(level, 0)))
+
+
+def _from_int_parallel(n: int, base: int, level: int, workers: int) -> bytes:
+    from concurrent.futures import ProcessPoolExecutor
+
+    table = power_table(base, level)
+    tasks: List[Tuple[int, int, int, int]] = []
+
+    def split(n: int, level: int, width: int, depth: int) -> None:
+        if level < 0 or depth == 0:
+            tasks.append((n, base, level, width))
+            return
+        size = LEAF_DIGITS << level
+        if not width and n < table[level]:
+            split(n, level - 1, 0, depth)
+            return
+        high, low = division.divmod_int(n, table[level])
+        split(high, level - 1, width - size if width else 0, depth - 1)
+        split(low, level - 1, size, depth - 1)
+
+    split(n, level, 0, _split_depth(workers))
+    with ProcessPoolExecutor(workers) as pool:
+        return b"".join(pool.map(_from_int_piece, *zip(*tasks)))
+
+
+def _from_int_piece(n: int, base: int, level: int, width: int) -> bytes:
+    pieces: List[bytes] = []
+    _from_int_rec(n, base, level, power_table(base, max(level, 0)), width, pieces)
+    return b"".join(pieces)
+
+
+def _leaf(n: int, base: int, width: int) -> bytes:
+    """Перевод небольшого числа (меньше base ** LEAF_DIGITS) в ASCII-цифры"""
+    if base == 10:
+        return b"%0*d" % (width, n)
+    out = bytearray()
+    while n:
+        n, rem = divmod(n, base)
+        out.append(ALPHABET[rem])
+    if len(out) < width:
+        out.extend(b"0" * (width - len(out)))
+    out.reverse()
+    return bytes(out) or b"0"
+
+
+def _format_pow2(n: int, base: int) -> bytes:
+    """Нарезка битов числа на группы по log2(base) бит"""
+    spec = _POW2_FORMAT.get(base)
+    if spec is not None:
+        return format(n, spec).encode("ascii")
+    shift = base.bit_length() - 1
+    bits = format(n, "b")
+    bits = "0" * (-len(bits) % shift) + bits
+    return bytes(
+        ALPHABET[int(bits[i : i + shift], 2)] for i in range(0, len(bits), shift)
+    )
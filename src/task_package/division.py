@@ -0,0 +1,99 @@
+"""Быстрое деление с остатком для больших целых (алгоритм Бурникеля-Циглера).
+
+Встроенный ``divmod`` для длинных int квадратичен. Здесь делитель из n бит
+рассматривается как одна «цифра» по основанию 2**n, делимое режется на такие
+цифры, а каждый шаг 2n/n делится рекурсивно через два шага 3n/2n. Умножения
+внутри рекурсии выполняет CPython (Карацуба), поэтому частное и остаток
+получаются за один проход с субквадратичной сложностью.
+"""
+
+from typing import List, Tuple
+
+# Ниже этого размера делителя (в битах) используется встроенный divmod
+DIV_THRESHOLD = 40_000
+
+# Размер (в битах) частного на шаге рекурсии, ниже которого делит CPython
+_DIV_LIMIT = 4_000
+
+
+def divmod_int(a: int, b: int) -> Tuple[int, int]:
+    """Частное (с округлением вниз) и остаток неотрицательного a на положительное b"""
+    if b.bit_length() < DIV_THRESHOLD or a.bit_length() - b.bit_length() < _DIV_LIMIT:
+        return divmod(a, b)
+    return _divmod_pos(a, b)
+
+
+def _divmod_pos(a: int, b: int) -> Tuple[int, int]:
+    n = b.bit_length()
+    remainder = 0
+    q_digits: List[int] = []
+    for a_digit in reversed(_int_to_digits(a, n)):
+        q_digit, remainder = _div2n1n((remainder << n) + a_digit, b, n)
+        q_digits.append(q_digit)
+    q_digits.reverse()
+    return _digits_to_int(q_digits, n), remainder
+
+
+def _div2n1n(a: int, b: int, n: int) -> Tuple[int, int]:
+    """Деление a < 2**(2n) на b из n бит (a // b < 2**n)"""
+    if a.bit_length() - n <= _DIV_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+
+def _div3n2n(a12: int, a3: int, b: int, b1: int, b2: int, n: int) -> Tuple[int, int]:
+    """Деление (a12 * 2**n + a3) на b = b1 * 2**n + b2"""
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+
+def _int_to_digits(a: int, n: int) -> List[int]:
+    """Разбиение a на цифры по основанию 2**n (младшая первой)"""
+    digits = [0] * ((a.bit_length() + n - 1) // n)
+
+    def split(x: int, lo: int, hi: int) -> None:
+        if lo + 1 == hi:
+            digits[lo] = x
+            return
+        mid = (lo + hi) >> 1
+        shift = (mid - lo) * n
+        upper = x >> shift
+        split(x ^ (upper << shift), lo, mid)
+        split(upper, mid, hi)
+
+    if a:
+        split(a, 0, len(digits))
+    return digits
+
+
+def _digits_to_int(digits: List[int], n: int) -> int:
+    """Сборка числа из цифр по основанию 2**n (младшая первой)"""
+    if not digits:
+        return 0
+
+    def join(lo: int, hi: int) -> int:
+        if lo + 1 == hi:
+            return digits[lo]
+        mid = (lo + hi) >> 1
+        return join(mid, hi) << ((mid - lo) * n) | join(lo, mid)
+
+    return join(0, len(digits))
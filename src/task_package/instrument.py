@@ -0,0 +1,243 @@
+"""Счётчики вызовов, времени и размеров операндов для методов Integer, Number и Real.
+
+Инструментирование включается явно: ``enable()`` заменяет методы классов
+обёртками, ``disable()`` возвращает исходные функции, поэтому в выключенном
+состоянии накладных расходов нет. Для каждого метода (по имени класса
+получателя, например ``Decimal.add``) собираются число вызовов, суммарное
+время (включая вложенные вызовы) и гистограмма размера наибольшего операнда
+в цифрах.
+
+    with instrument.collect() as recorder:
+        run_job()
+    recorder.write_prometheus("metrics.prom")
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from . import convert, zad1, zad2
+
+# Верхние границы корзин гистограммы размеров операндов (в цифрах)
+SIZE_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+_INTEGER_METHODS = (
+    "to_int",
+    "from_int",
+    "_from_raw",
+    "_validate",
+    "_pack",
+    "_unpack",
+    "_pack_int",
+    "_unpack_int",
+    "add",
+    "subtract",
+    "multiply",
+    "divide",
+    "mod",
+    "divmod",
+    "from_stream",
+    "to_radix",
+)
+_TARGETS: Tuple[Tuple[type, Tuple[str, ...]], ...] = (
+    (zad2.Integer, _INTEGER_METHODS),
+    (zad2.RadixInteger, _INTEGER_METHODS),
+    (zad2.PackedRadixInteger, _INTEGER_METHODS),
+    (zad2.Decimal, _INTEGER_METHODS),
+    (zad2.Binary, _INTEGER_METHODS),
+    (zad1.Number, ("add", "divide")),
+    (zad1.Real, ("power", "logarithm")),
+)
+
+
+class _MethodStats:
+    __slots__ = ("calls", "seconds", "buckets", "size_sum", "size_count")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(SIZE_BUCKETS) + 1)
+        self.size_sum = 0
+        self.size_count = 0
+
+
+class Recorder:
+    """Накопленная статистика по методам"""
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float, size: Optional[int]) -> None:
+        with self._lock:
+            stats = self._stats.get(method)
+            if stats is None:
+                stats = self._stats[method] = _MethodStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            if size is not None:
+                stats.buckets[bisect_left(SIZE_BUCKETS, size)] += 1
+                stats.size_sum += size
+                stats.size_count += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Статистика в виде словаря: метод -> calls, seconds, sizes"""
+        with self._lock:
+            return {
+                method: {
+                    "calls": stats.calls,
+                    "seconds": stats.seconds,
+                    "sizes": dict(
+                        zip([*map(str, SIZE_BUCKETS), "+Inf"], stats.buckets)
+                    ),
+                }
+                for method, stats in sorted(self._stats.items())
+            }
+
+    def to_prometheus(self, prefix: str = "task_package") -> str:
+        """Статистика в текстовом формате Prometheus"""
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines = [
+                f"# HELP {prefix}_calls_total Число вызовов метода",
+                f"# TYPE {prefix}_calls_total counter",
+            ]
+            lines += [
+                f'{prefix}_calls_total{{method="{method}"}} {stats.calls}'
+                for method, stats in items
+            ]
+            lines += [
+                f"# HELP {prefix}_seconds_total Суммарное время в методе, с",
+                f"# TYPE {prefix}_seconds_total counter",
+            ]
+            lines += [
+                f'{prefix}_seconds_total{{method="{method}"}} {stats.seconds!r}'
+                for method, stats in items
+            ]
+            lines += [
+                f"# HELP {prefix}_operand_digits Размер наибольшего операнда в цифрах",
+                f"# TYPE {prefix}_operand_digits histogram",
+            ]
+            for method, stats in items:
+                if not stats.size_count:
+                    continue
+                total = 0
+                for bound, count in zip(
+                    [*map(str, SIZE_BUCKETS), "+Inf"], stats.buckets
+                ):
+                    total += count
+                    lines.append(
+                        f'{prefix}_operand_digits_bucket{{method="{method}",le="{bound}"}} {total}'
+                    )
+                lines.append(
+                    f'{prefix}_operand_digits_sum{{method="{method}"}} {stats.size_sum}'
+                )
+                lines.append(
+                    f'{prefix}_operand_digits_count{{method="{method}"}} {stats.size_count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "task_package") -> None:
+        """Запись статистики в файл (для textfile collector node_exporter)"""
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(self.to_prometheus(prefix))
+
+
+recorder = Recorder()
+
+_originals: List[Tuple[type, str, Any]] = []
+_depth = 0
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable() -> None:
+    """Установка обёрток (повторный вызов ничего не меняет)"""
+    if _originals:
+        return
+    for cls, names in _TARGETS:
+        for name in names:
+            original = cls.__dict__.get(name)
+            if original is None:
+                continue
+            _originals.append((cls, name, original))
+            setattr(cls, name, _wrap(original, name))
+
+
+def disable() -> None:
+    """Возврат исходных методов"""
+    while _originals:
+        cls, name, original = _originals.pop()
+        setattr(cls, name, original)
+
+
+@contextmanager
+def collect(reset: bool = True) -> Iterator[Recorder]:
+    """Сбор статистики внутри блока with; вложенные блоки разделяют обёртки"""
+    global _depth
+    if reset and not _depth:
+        recorder.reset()
+    enable()
+    _depth += 1
+    try:
+        yield recorder
+    finally:
+        _depth -= 1
+        if not _depth:
+            disable()
+
+
+def _wrap(original: Any, name: str) -> Any:
+    if isinstance(original, classmethod):
+        return classmethod(_timed(original.__func__, name))
+    if isinstance(original, staticmethod):
+        return original
+    return _timed(original, name)
+
+
+def _timed(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    record = recorder.record
+    perf_counter = time.perf_counter
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        receiver = args[0]
+        owner = receiver if isinstance(receiver, type) else type(receiver)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(
+                f"{owner.__name__}.{name}", perf_counter() - start, operand_size(args)
+            )
+
+    return wrapper
+
+
+def operand_size(args: Tuple[Any, ...]) -> Optional[int]:
+    """Размер наибольшего операнда в цифрах (None, если операндов-чисел нет)"""
+    size: Optional[int] = None
+    for arg in args:
+        if isinstance(arg, zad2.Integer):
+            count = arg._digit_count()
+            if count is None:
+                continue
+            digits = count
+        elif isinstance(arg, int) and not isinstance(arg, bool):
+            digits = convert.digit_count(arg)
+        elif isinstance(arg, (bytes, bytearray, memoryview)):
+            digits = len(arg)
+        else:
+            continue
+        if size is None or digits > size:
+            size = digits
+    return size
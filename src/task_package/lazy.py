@@ -0,0 +1,270 @@
+"""Ленивые выражения над Number/Real со слиянием цепочки в одно вычисление.
+
+Операции над ``Expr`` (add, divide, power, logarithm и операторы) не вычисляют
+значений, а строят граф. Одинаковые подвыражения представлены одним узлом
+(hash-consing), поэтому при вычислении каждое считается один раз. При первом
+``evaluate`` граф компилируется в одну функцию Python: для скалярных входов
+и буферов ``array('d')`` она выполняется за один проход по элементам без
+промежуточных объектов Real, для NumPy — как одно векторное ядро.
+
+    x = var("x")
+    expr = x.add(5).power(3).divide(var("y")).logarithm(2)
+    expr.evaluate(x=RealArray([1.0, 2.0]), y=4.0)
+"""
+
+import math
+import struct
+import weakref
+from array import array
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .arrays import NumberArray, RealArray, np
+from .zad1 import Number, Real
+
+Operand = Union["Expr", Number, float, int]
+Input = Union[NumberArray, Number, float, int]
+
+_ZERO_DIVISION = "Деление на ноль невозможно"
+_LOG_DOMAIN = "Логарифм определен только для положительных чисел"
+_LOG_INVALID = "Некорректные значения для логарифма"
+
+_float_bits = struct.Struct("<d").pack
+
+# Таблица уникальных узлов: ключ — операция и идентификаторы аргументов
+_nodes: "weakref.WeakValueDictionary[Tuple[Any, ...], Expr]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+class Expr:
+    """Узел графа выражения; создаётся через var, const и операции"""
+
+    __slots__ = ("op", "args", "value", "_kernels", "__weakref__")
+
+    op: str
+    args: Tuple["Expr", ...]
+    value: Any
+    _kernels: Optional[Dict[bool, Tuple[Callable[..., Any], List[str]]]]
+
+    def __new__(
+        cls, op: str, args: Tuple["Expr", ...] = (), value: Any = None
+    ) -> "Expr":
+        key = (
+            op,
+            value if op == "var" else _float_bits(value) if op == "const" else None,
+        ) + tuple(map(id, args))
+        node = _nodes.get(key)
+        if node is None:
+            node = object.__new__(cls)
+            node.op = op
+            node.args = args
+            node.value = value
+            node._kernels = None
+            _nodes[key] = node
+        return node
+
+    def add(self, other: Operand) -> "Expr":
+        """Сложение"""
+        return Expr("add", (self, _expr(other)))
+
+    def divide(self, other: Operand) -> "Expr":
+        """Деление"""
+        return Expr("divide", (self, _expr(other)))
+
+    def power(self, exponent: Operand) -> "Expr":
+        """Возведение в степень"""
+        return Expr("power", (self, _expr(exponent)))
+
+    def logarithm(self, base: Optional[Operand] = None) -> "Expr":
+        """Логарифм (натуральный, если base не указан)"""
+        if base is None:
+            return Expr("log", (self,))
+        return Expr("logb", (self, _expr(base)))
+
+    def __add__(self, other: Operand) -> "Expr":
+        return self.add(other)
+
+    def __radd__(self, other: Operand) -> "Expr":
+        return _expr(other).add(self)
+
+    def __truediv__(self, other: Operand) -> "Expr":
+        return self.divide(other)
+
+    def __rtruediv__(self, other: Operand) -> "Expr":
+        return _expr(other).divide(self)
+
+    def __pow__(self, exponent: Operand) -> "Expr":
+        return self.power(exponent)
+
+    def __rpow__(self, base: Operand) -> "Expr":
+        return _expr(base).power(self)
+
+    def nodes(self) -> List["Expr"]:
+        """Уникальные узлы в порядке вычисления (аргументы раньше операций)"""
+        order: List[Expr] = []
+        seen = set()
+        stack: List[Tuple[Expr, bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in seen:
+                continue
+            if expanded:
+                seen.add(id(node))
+                order.append(node)
+                continue
+            stack.append((node, True))
+            stack.extend(
+                (arg, False) for arg in reversed(node.args) if id(arg) not in seen
+            )
+        return order
+
+    def evaluate(self, **inputs: Input) -> Union[Real, RealArray]:
+        """Значение выражения для входов var; массивы дают RealArray"""
+        vectorized = any(isinstance(value, NumberArray) for value in inputs.values())
+        kernel, names = self._kernel(vectorized and np is not None)
+        missing = [name for name in names if name not in inputs]
+        if missing:
+            raise ValueError(f"Не заданы значения переменных: {', '.join(missing)}")
+        args = [_buffer(inputs[name]) for name in names]
+        if not vectorized:
+            return Real(kernel(*args))
+        size = _length([_buffer(value) for value in inputs.values()])
+        if np is not None:
+            result = kernel(*args)
+            if np.ndim(result) == 0:
+                result = np.full(size, result, dtype=np.float64)
+            return RealArray._wrap(result)
+        if not args:
+            return RealArray._wrap(array("d", repeat(kernel(), size)))
+        columns = [
+            value if isinstance(value, array) else repeat(value, size) for value in args
+        ]
+        return RealArray._wrap(array("d", map(kernel, *columns)))
+
+    def _kernel(self, vectorized: bool) -> Tuple[Callable[..., Any], List[str]]:
+        if self._kernels is None:
+            self._kernels = {}
+        compiled = self._kernels.get(vectorized)
+        if compiled is None:
+            compiled = self._kernels[vectorized] = _compile(self.nodes(), vectorized)
+        return compiled
+
+    def __repr__(self) -> str:
+        if self.op == "var":
+            return str(self.value)
+        if self.op == "const":
+            return repr(self.value)
+        return f"{self.op}({', '.join(map(repr, self.args))})"
+
+
+def var(name: str) -> Expr:
+    """Входная переменная выражения"""
+    if not name.isidentifier():
+        raise ValueError(f"Некорректное имя переменной: {name!r}")
+    return Expr("var", value=name)
+
+
+def const(value: Union[Number, float, int]) -> Expr:
+    """Константа выражения"""
+    return Expr(
+        "const", value=value._value if isinstance(value, Number) else float(value)
+    )
+
+
+def _expr(value: Operand) -> Expr:
+    return value if isinstance(value, Expr) else const(value)
+
+
+def _buffer(value: Input) -> Any:
+    if isinstance(value, NumberArray):
+        return value._data
+    if isinstance(value, Number):
+        return value._value
+    return float(value)
+
+
+def _length(args: List[Any]) -> int:
+    sizes = {len(value) for value in args if not isinstance(value, float)}
+    if len(sizes) > 1:
+        raise ValueError("Размеры массивов не совпадают")
+    return sizes.pop()
+
+
+def _compile(
+    order: List[Expr], vectorized: bool
+) -> Tuple[Callable[..., Any], List[str]]:
+    """Генерация одной функции, вычисляющей все узлы по порядку"""
+    names: List[str] = []
+    constants: List[float] = []
+    slots: Dict[int, str] = {}
+    lines: List[str] = []
+    for node in order:
+        if node.op == "var":
+            slots[id(node)] = f"v{len(names)}"
+            names.append(node.value)
+            continue
+        if node.op == "const":
+            slots[id(node)] = f"c{len(constants)}"
+            constants.append(node.value)
+            continue
+        target = slots[id(node)] = f"t{len(lines)}"
+        args = [slots[id(arg)] for arg in node.args]
+        lines.extend(_STATEMENTS[vectorized][node.op](target, *args))
+    # Константы и функции передаются значениями по умолчанию: это локальные переменные ядра
+    params = ", ".join(
+        [f"v{i}" for i in range(len(names))] + ["*", "_log=_log", "_any=_any"]
+    )
+    params += "".join(f", c{i}=_c[{i}]" for i in range(len(constants)))
+    body = "\n".join(f"    {line}" for line in lines) or "    pass"
+    result = slots[id(order[-1])]
+    source = f"def _kernel({params}):\n{body}\n    return {result}\n"
+    namespace: Dict[str, Any] = {
+        "_c": tuple(constants),
+        "_log": np.log if vectorized else math.log,
+        "_any": np.any if vectorized else bool,
+        "_E": ValueError,
+        "_ZERO_DIVISION": _ZERO_DIVISION,
+        "_LOG_DOMAIN": _LOG_DOMAIN,
+        "_LOG_INVALID": _LOG_INVALID,
+    }
+    exec(compile(source, "<lazy>", "exec"), namespace)
+    return namespace["_kernel"], names
+
+
+def _scalar_statements() -> Dict[str, Callable[..., List[str]]]:
+    return {
+        "add": lambda t, a, b: [f"{t} = {a} + {b}"],
+        "divide": lambda t, a, b: [
+            f"if {b} == 0: raise _E(_ZERO_DIVISION)",
+            f"{t} = {a} / {b}",
+        ],
+        "power": lambda t, a, b: [f"{t} = {a} ** {b}"],
+        "log": lambda t, a: [f"if {a} <= 0: raise _E(_LOG_DOMAIN)", f"{t} = _log({a})"],
+        "logb": lambda t, a, b: [
+            f"if {a} <= 0 or {b} <= 0 or {b} == 1: raise _E(_LOG_INVALID)",
+            f"{t} = _log({a}, {b})",
+        ],
+    }
+
+
+def _vector_statements() -> Dict[str, Callable[..., List[str]]]:
+    return {
+        "add": lambda t, a, b: [f"{t} = {a} + {b}"],
+        "divide": lambda t, a, b: [
+            f"if _any({b} == 0): raise _E(_ZERO_DIVISION)",
+            f"{t} = {a} / {b}",
+        ],
+        "power": lambda t, a, b: [f"{t} = {a} ** {b}"],
+        "log": lambda t, a: [
+            f"if _any({a} <= 0): raise _E(_LOG_DOMAIN)",
+            f"{t} = _log({a})",
+        ],
+        "logb": lambda t, a, b: [
+            f"if _any({a} <= 0) or _any({b} <= 0) or _any({b} == 1): raise _E(_LOG_INVALID)",
+            f"{t} = _log({a}) / _log({b})",
+        ],
+    }
+
+
+_STATEMENTS = {False: _scalar_statements(), True: _vector_statements()}
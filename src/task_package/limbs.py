@@ -0,0 +1,196 @@
+"""Умножение чисел, записанных лимбами base**k, без перевода в int.
+
+Лимб объединяет ``LIMB_DIGITS`` цифр, лимбы хранятся младшим первым.
+Произведение считается как произведение многочленов: школьным методом для
+коротких операндов, методом Карацубы и Тоома-3 выше порогов, а переносы
+распространяются один раз в конце. Пороги подбираются скриптом
+``benchmarks/tune_limbs.py``.
+
+По умолчанию модуль не используется: на CPython перевод в int и встроенное
+умножение быстрее на всех проверенных размерах, поэтому ``DIGITS_THRESHOLD``
+равен None и Decimal.multiply выбирает умножение лимбами, только если порог
+задан явно.
+"""
+
+from itertools import zip_longest
+from operator import mul
+from typing import List, Optional, Sequence
+
+from . import convert
+
+LIMB_DIGITS = 9
+
+# Пороги в лимбах для переключения алгоритмов; TOOM3_THRESHOLD не меньше
+# KARATSUBA_THRESHOLD, иначе метод Карацубы никогда не выбирается
+KARATSUBA_THRESHOLD = 192
+TOOM3_THRESHOLD = 200
+
+# Начиная с этой длины (в цифрах) Decimal.multiply умножает лимбы,
+# если значения операндов в виде int ещё не вычислены. None — не умножать
+# лимбами: на CPython путь через int быстрее на всех проверенных размерах
+# (см. benchmarks/tune_limbs.py), поэтому путь включается только явно
+DIGITS_THRESHOLD: Optional[int] = None
+
+Poly = List[int]
+
+
+def digits_to_limbs(raw: bytes, base: int = 10, k: int = LIMB_DIGITS) -> Poly:
+    """Значения цифр (старшая первой) -> лимбы (младший первым)"""
+    text = convert.to_ascii(raw)
+    return [int(text[max(0, i - k) : i], base) for i in range(len(text), 0, -k)]
+
+
+def limbs_to_digits(
+    limbs: Sequence[int], base: int = 10, k: int = LIMB_DIGITS
+) -> bytes:
+    """Нормализованные лимбы -> значения цифр без ведущих нулей"""
+    if not limbs:
+        return b"\x00"
+    top = len(limbs) - 1
+    if base == 10:
+        text = b"%d" % limbs[top] + b"".join(
+            b"%0*d" % (k, limb) for limb in reversed(limbs[:top])
+        )
+        return convert.from_ascii(text)
+    pieces = [convert.from_int(limbs[top], base)]
+    pieces.extend(
+        convert.from_int(limb, base).rjust(k, b"\x00") for limb in reversed(limbs[:top])
+    )
+    return b"".join(pieces)
+
+
+def normalize(coeffs: Sequence[int], radix: int) -> Poly:
+    """Распространение переносов: коэффициенты -> лимбы в [0, radix)"""
+    out: Poly = []
+    carry = 0
+    for coeff in coeffs:
+        carry, limb = divmod(carry + coeff, radix)
+        out.append(limb)
+    while carry:
+        carry, limb = divmod(carry, radix)
+        out.append(limb)
+    while out and not out[-1]:
+        out.pop()
+    return out
+
+
+def multiply(a: Sequence[int], b: Sequence[int], radix: int) -> Poly:
+    """Произведение двух чисел в лимбах"""
+    return normalize(mul_poly(list(a), list(b)), radix)
+
+
+def multiply_digits(left: bytes, right: bytes, base: int = 10) -> bytes:
+    """Произведение двух массивов цифр без перевода в int"""
+    radix = base**LIMB_DIGITS
+    limbs = multiply(digits_to_limbs(left, base), digits_to_limbs(right, base), radix)
+    return limbs_to_digits(limbs, base)
+
+
+def mul_poly(a: Poly, b: Poly) -> Poly:
+    """Произведение многочленов с выбором алгоритма по длине"""
+    if not a or not b:
+        return []
+    short = min(len(a), len(b))
+    if short < KARATSUBA_THRESHOLD:
+        return mul_schoolbook(a, b)
+    if 2 * short <= max(len(a), len(b)):
+        return _mul_unbalanced(a, b)
+    if short < TOOM3_THRESHOLD:
+        return mul_karatsuba(a, b)
+    return mul_toom3(a, b)
+
+
+def mul_schoolbook(a: Poly, b: Poly) -> Poly:
+    """Школьное умножение: каждый коэффициент — скалярное произведение срезов"""
+    if not a or not b:
+        return []
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    rb = b[::-1]
+    out: Poly = []
+    for k in range(n + m - 1):
+        lo = max(0, k - m + 1)
+        hi = min(k, n - 1)
+        out.append(sum(map(mul, a[lo : hi + 1], rb[m - 1 - k + lo : m - k + hi])))
+    return out
+
+
+def mul_karatsuba(a: Poly, b: Poly) -> Poly:
+    """Умножение Карацубы: три произведения половинной длины"""
+    half = max(len(a), len(b)) // 2
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+    z0 = mul_poly(a0, b0)
+    z2 = mul_poly(a1, b1)
+    z1 = _sub(_sub(mul_poly(_add(a0, a1), _add(b0, b1)), z0), z2)
+    out = [0] * (len(a) + len(b) - 1)
+    _add_into(out, z0, 0)
+    _add_into(out, z1, half)
+    _add_into(out, z2, 2 * half)
+    return out
+
+
+def mul_toom3(a: Poly, b: Poly) -> Poly:
+    """Умножение Тоома-3 (точки 0, 1, -1, -2, ∞, интерполяция Бодрато)"""
+    k = (max(len(a), len(b)) + 2) // 3
+    a0, a1, a2 = a[:k], a[k : 2 * k], a[2 * k :]
+    b0, b1, b2 = b[:k], b[k : 2 * k], b[2 * k :]
+
+    a02, b02 = _add(a0, a2), _add(b0, b2)
+    r0 = mul_poly(a0, b0)
+    r1 = mul_poly(_add(a02, a1), _add(b02, b1))
+    rm1 = mul_poly(_sub(a02, a1), _sub(b02, b1))
+    rm2 = mul_poly(
+        _sub(_add(a0, _scale(a2, 4)), _scale(a1, 2)),
+        _sub(_add(b0, _scale(b2, 4)), _scale(b1, 2)),
+    )
+    rinf = mul_poly(a2, b2)
+
+    t3 = _exact_div(_sub(rm2, r1), 3)
+    t1 = _exact_div(_sub(r1, rm1), 2)
+    t2 = _sub(rm1, r0)
+    t3 = _add(_exact_div(_sub(t2, t3), 2), _scale(rinf, 2))
+    t2 = _sub(_add(t2, t1), rinf)
+    t1 = _sub(t1, t3)
+
+    out = [0] * (len(a) + len(b) - 1)
+    for shift, part in ((0, r0), (k, t1), (2 * k, t2), (3 * k, t3), (4 * k, rinf)):
+        _add_into(out, part, shift)
+    return out
+
+
+def _mul_unbalanced(a: Poly, b: Poly) -> Poly:
+    """Длинный операнд режется на куски длины короткого"""
+    if len(a) < len(b):
+        a, b = b, a
+    step = len(b)
+    out = [0] * (len(a) + len(b) - 1)
+    for start in range(0, len(a), step):
+        _add_into(out, mul_poly(a[start : start + step], b), start)
+    return out
+
+
+def _add(a: Poly, b: Poly) -> Poly:
+    return [x + y for x, y in zip_longest(a, b, fillvalue=0)]
+
+
+def _sub(a: Poly, b: Poly) -> Poly:
+    return [x - y for x, y in zip_longest(a, b, fillvalue=0)]
+
+
+def _scale(a: Poly, factor: int) -> Poly:
+    return [x * factor for x in a]
+
+
+def _exact_div(a: Poly, divisor: int) -> Poly:
+    return [x // divisor for x in a]
+
+
+def _add_into(out: Poly, part: Poly, shift: int) -> None:
+    """out += part * x**shift; старшие нулевые коэффициенты part отбрасываются"""
+    end = len(part)
+    while end and not part[end - 1]:
+        end -= 1
+    for i in range(end):
+        out[shift + i] += part[i]
@@ -0,0 +1,197 @@
+"""Матрицы рациональных чисел и точное решение линейных систем.
+
+Строка хранится как список целых числителей с общим для строки знаменателем,
+поэтому элементы не сокращаются по отдельности. Определитель, обратная
+матрица и решение системы вычисляются бездробным исключением Бареисса над
+целыми числами: каждое деление на предыдущий ведущий элемент точное, размер
+промежуточных чисел ограничен размером миноров, а дроби сокращаются один
+раз — при формировании результата.
+"""
+
+from math import gcd
+from typing import Iterable, List, Sequence, Tuple
+
+from .rational import Rational, RationalLike
+
+_SINGULAR = "Матрица вырождена"
+
+
+class RationalMatrix:
+    """Матрица из Rational с общим знаменателем в каждой строке"""
+
+    __slots__ = ("_rows", "_dens", "_ncols")
+
+    def __init__(self, rows: Iterable[Iterable[RationalLike]]) -> None:
+        numerators: List[List[int]] = []
+        denominators: List[int] = []
+        for row in rows:
+            nums, den = _integer_row(row)
+            numerators.append(nums)
+            denominators.append(den)
+        ncols = len(numerators[0]) if numerators else 0
+        if any(len(nums) != ncols for nums in numerators):
+            raise ValueError("Строки матрицы должны иметь одинаковую длину")
+        self._rows = numerators
+        self._dens = denominators
+        self._ncols = ncols
+
+    @classmethod
+    def _from_rows(cls, rows: List[List[int]], dens: List[int]) -> "RationalMatrix":
+        """Создание из целых строк и знаменателей (знаменатели положительны)"""
+        obj = cls.__new__(cls)
+        obj._rows = rows
+        obj._dens = dens
+        obj._ncols = len(rows[0]) if rows else 0
+        return obj
+
+    @classmethod
+    def identity(cls, n: int) -> "RationalMatrix":
+        """Единичная матрица n×n"""
+        return cls._from_rows(
+            [[int(i == j) for j in range(n)] for i in range(n)], [1] * n
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self._rows), self._ncols
+
+    def __getitem__(self, index: Tuple[int, int]) -> Rational:
+        i, j = index
+        return Rational(self._rows[i][j], self._dens[i])
+
+    def tolist(self) -> List[List[Rational]]:
+        """Элементы в виде вложенных списков Rational"""
+        return [
+            [Rational(num, den) for num in nums]
+            for nums, den in zip(self._rows, self._dens)
+        ]
+
+    def determinant(self) -> Rational:
+        """Определитель"""
+        n = self._square()
+        if n == 0:
+            return Rational(1)
+        work = [list(nums) for nums in self._rows]
+        sign = _bareiss(work, n, full=False)
+        if not sign:
+            return Rational(0)
+        product = 1
+        for den in self._dens:
+            product *= den
+        return Rational(sign * work[n - 1][n - 1], product)
+
+    def solve(self, rhs: Sequence[RationalLike]) -> List[Rational]:
+        """Решение системы A·x = rhs"""
+        n = self._square()
+        if len(rhs) != n:
+            raise ValueError("Размер правой части не совпадает с размером матрицы")
+        work = []
+        for nums, den, value in zip(self._rows, self._dens, rhs):
+            # Уравнение (nums/den)·x = p/q умножается на НОК(den, q)
+            p, q = _parts(value)
+            g = gcd(den, q)
+            work.append([num * (q // g) for num in nums] + [p * (den // g)])
+        if not _bareiss(work, n, full=True):
+            raise ValueError(_SINGULAR)
+        return [Rational(work[i][n], work[i][i]) for i in range(n)]
+
+    def inverse(self) -> "RationalMatrix":
+        """Обратная матрица"""
+        n = self._square()
+        if n == 0:
+            return RationalMatrix._from_rows([], [])
+        work = [
+            nums + [int(i == j) for j in range(n)] for i, nums in enumerate(self._rows)
+        ]
+        if not _bareiss(work, n, full=True):
+            raise ValueError(_SINGULAR)
+        # Здесь work = [det·I | det·N⁻¹], а A⁻¹ = N⁻¹·D, D — знаменатели строк
+        det = work[0][0]
+        sign = -1 if det < 0 else 1
+        rows: List[List[int]] = []
+        dens: List[int] = []
+        for i in range(n):
+            nums = [sign * value * den for value, den in zip(work[i][n:], self._dens)]
+            g = gcd(abs(det), *nums)
+            rows.append([value // g for value in nums])
+            dens.append(abs(det) // g)
+        return RationalMatrix._from_rows(rows, dens)
+
+    def _square(self) -> int:
+        n, m = self.shape
+        if n != m:
+            raise ValueError("Матрица должна быть квадратной")
+        return n
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RationalMatrix):
+            return NotImplemented
+        return self.shape == other.shape and all(
+            a * e == b * d
+            for nums, d, other_nums, e in zip(
+                self._rows, self._dens, other._rows, other._dens
+            )
+            for a, b in zip(nums, other_nums)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return "\n".join(" ".join(map(str, row)) for row in self.tolist())
+
+    def __repr__(self) -> str:
+        return f"RationalMatrix({[[str(x) for x in row] for row in self.tolist()]})"
+
+
+def _parts(value: RationalLike) -> Tuple[int, int]:
+    parts = Rational._parts(value)
+    if parts is None:
+        raise TypeError("Элементы матрицы должны быть Rational или int")
+    return parts
+
+
+def _integer_row(row: Iterable[RationalLike]) -> Tuple[List[int], int]:
+    """Числители строки над НОК знаменателей элементов"""
+    items = [_parts(value) for value in row]
+    den = 1
+    for _, d in items:
+        den = den // gcd(den, d) * d
+    return [n * (den // d) for n, d in items], den
+
+
+def _bareiss(work: List[List[int]], n: int, full: bool) -> int:
+    """Исключение Бареисса на месте по первым n столбцам
+
+    При full=False — прямой ход: work[n-1][n-1] равен определителю левого
+    блока с точностью до знака. При full=True — вариант Гаусса-Жордана
+    (Монтанте): левый блок становится det·I, правые столбцы умножены на det.
+    Возвращает знак перестановки строк или 0 для вырожденной матрицы.
+    """
+    sign = 1
+    prev = 1
+    for k in range(n):
+        pivot = next((i for i in range(k, n) if work[i][k]), None)
+        if pivot is None:
+            return 0
+        if pivot != k:
+            work[k], work[pivot] = work[pivot], work[k]
+            sign = -sign
+        pivot_row = work[k]
+        akk = pivot_row[k]
+        for i in range(0 if full else k + 1, n):
+            if i == k:
+                continue
+            row = work[i]
+            aik = row[k]
+            start = 0 if full else k
+            head = row[:start]
+            if aik:
+                tail = [
+                    (akk * x - aik * y) // prev
+                    for x, y in zip(row[start:], pivot_row[start:])
+                ]
+            else:
+                tail = [akk * x // prev for x in row[start:]]
+            work[i] = head + tail
+        prev = akk
+    return sign
@@ -0,0 +1,101 @@
+"""Параллельное выполнение операций над целыми числами в пуле процессов.
+
+``parallel_map(func, *iterables)`` работает как встроенный ``map``, но
+выполняет вызовы в ``ProcessPoolExecutor``. Числа передаются в компактном
+виде (``RadixInteger.__reduce__``: int или упакованные цифры), мелкие задачи
+объединяются в порции примерно равного суммарного размера, чтобы накладные
+расходы на обмен между процессами не превышали полезную работу. Порядок
+результатов совпадает с порядком аргументов.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from .zad2 import Integer
+
+V = TypeVar("V")
+
+# Верхняя граница суммарного размера операндов (в цифрах) одной порции
+CHUNK_DIGITS = 200_000
+
+# Число порций на процесс: запас для выравнивания нагрузки
+_CHUNKS_PER_WORKER = 4
+
+
+def parallel_map(
+    func: Callable[..., V],
+    *iterables: Iterable[object],
+    workers: Optional[int] = None,
+    chunk_digits: int = CHUNK_DIGITS,
+    executor: Optional[Executor] = None,
+) -> List[V]:
+    """Результаты func(*args) для аргументов из iterables в исходном порядке
+
+    func должна сериализоваться pickle (функция модуля или метод класса,
+    например ``Decimal.multiply``). Если передан executor, используется он,
+    иначе на время вызова создаётся пул из workers процессов.
+    """
+    tasks = list(zip(*iterables))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if executor is None and (workers <= 1 or len(tasks) < 2):
+        return [func(*args) for args in tasks]
+    budget = max(
+        1,
+        min(
+            chunk_digits, sum(map(_task_size, tasks)) // (workers * _CHUNKS_PER_WORKER)
+        ),
+    )
+    chunks = list(_chunks(tasks, budget))
+    if executor is not None:
+        return _collect(executor.map(_run_chunk, repeat(func), chunks))
+    with ProcessPoolExecutor(workers) as pool:
+        return _collect(pool.map(_run_chunk, repeat(func), chunks))
+
+
+def _run_chunk(func: Callable[..., V], chunk: Sequence[Tuple[object, ...]]) -> List[V]:
+    """Выполнение порции задач в процессе пула"""
+    return [func(*args) for args in chunk]
+
+
+def _collect(results: Iterable[List[V]]) -> List[V]:
+    return [item for chunk in results for item in chunk]
+
+
+def _chunks(
+    tasks: List[Tuple[object, ...]], budget: int
+) -> Iterator[List[Tuple[object, ...]]]:
+    """Разбиение задач на порции с суммарным размером не больше budget"""
+    chunk: List[Tuple[object, ...]] = []
+    size = 0
+    for args in tasks:
+        cost = _task_size(args)
+        if chunk and size + cost > budget:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(args)
+        size += cost
+    if chunk:
+        yield chunk
+
+
+def _task_size(args: Tuple[object, ...]) -> int:
+    return sum(map(_size, args)) or 1
+
+
+def _size(arg: object) -> int:
+    """Размер операнда в цифрах без вычисления цифр"""
+    if not isinstance(arg, Integer):
+        return 0
+    return arg._digit_count() or 0
@@ -0,0 +1,170 @@
+"""Потоковое вычисление файлов с выражениями над целыми числами.
+
+Каждая строка — выражение вида ``123 * 45`` или ``0b1010 // 0b110``:
+литералы, операторы ``+ - * // %`` и скобки. Литерал без префикса читается
+в системе счисления base, префиксы ``0b``/``0o``/``0x`` задают её явно.
+Строки читаются, вычисляются и записываются порциями по chunk_size, поэтому
+память не зависит от размера файла.
+"""
+
+import re
+from itertools import islice
+from typing import IO, Callable, Dict, Iterable, Iterator, List, NamedTuple
+
+from . import convert
+from .zad2 import Radix, RadixInteger
+
+# Размер порции строк по умолчанию
+CHUNK_SIZE = 10_000
+# Наибольшая глубина вложенности скобок (разбор рекурсивный)
+MAX_NESTING = 100
+
+_TOKEN = re.compile(r"\s*(?:(0[bB]|0[oO]|0[xX])?([0-9A-Za-z]+)|(//|[-+*%()]))")
+_PREFIX_BASES = {"0b": 2, "0o": 8, "0x": 16}
+
+_OPERATORS: Dict[str, Callable[[RadixInteger, RadixInteger], RadixInteger]] = {
+    "+": lambda a, b: a.add(b),
+    "-": lambda a, b: a.subtract(b),
+    "*": lambda a, b: a.multiply(b),
+    "//": lambda a, b: a.divide(b),
+    "%": lambda a, b: a.mod(b),
+}
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "//": 2, "%": 2}
+
+
+class Token(NamedTuple):
+    kind: str  # "number", "op", "(" или ")"
+    text: str
+    base: int = 10
+
+
+def tokenize(line: str, base: int = 10) -> List[Token]:
+    """Разбиение строки на литералы, операторы и скобки"""
+    tokens: List[Token] = []
+    pos = 0
+    line = line.rstrip()
+    while pos < len(line):
+        match = _TOKEN.match(line, pos)
+        if match is None:
+            # Позиция самого символа, а не пробелов перед ним
+            pos += len(line[pos:]) - len(line[pos:].lstrip())
+            raise ValueError(f"Неожиданный символ в позиции {pos}: {line[pos]!r}")
+        prefix, literal, symbol = match.groups()
+        if literal is not None:
+            literal_base = _PREFIX_BASES[prefix.lower()] if prefix else base
+            tokens.append(Token("number", literal, literal_base))
+        elif symbol in _OPERATORS:
+            tokens.append(Token("op", symbol))
+        else:
+            tokens.append(Token(symbol, symbol))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Разбор выражения с приоритетами операторов (левоассоциативно)"""
+
+    def __init__(self, tokens: List[Token]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.depth = 0
+
+    def parse(self) -> RadixInteger:
+        if not self.tokens:
+            raise ValueError("Пустое выражение")
+        result = self.expression(1)
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Лишний токен: {self.tokens[self.pos].text!r}")
+        return result
+
+    def expression(self, min_precedence: int) -> RadixInteger:
+        left = self.operand()
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            if token.kind != "op" or _PRECEDENCE[token.text] < min_precedence:
+                break
+            self.pos += 1
+            right = self.expression(_PRECEDENCE[token.text] + 1)
+            left = _OPERATORS[token.text](left, right)
+        return left
+
+    def operand(self) -> RadixInteger:
+        if self.pos >= len(self.tokens):
+            raise ValueError("Ожидалось число")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        if token.kind == "number":
+            return Radix(token.base)(convert.from_ascii(token.text))
+        if token.kind == "(":
+            self.depth += 1
+            if self.depth > MAX_NESTING:
+                raise ValueError(
+                    f"Слишком глубокая вложенность скобок (больше {MAX_NESTING})"
+                )
+            result = self.expression(1)
+            self.depth -= 1
+            if self.pos >= len(self.tokens) or self.tokens[self.pos].kind != ")":
+                raise ValueError("Не закрыта скобка")
+            self.pos += 1
+            return result
+        raise ValueError(f"Ожидалось число, получено {token.text!r}")
+
+
+def evaluate(line: str, base: int = 10) -> RadixInteger:
+    """Вычисление одного выражения"""
+    return _Parser(tokenize(line, base)).parse()
+
+
+def evaluate_lines(
+    lines: Iterable[str],
+    base: int = 10,
+    chunk_size: int = CHUNK_SIZE,
+    strict: bool = False,
+) -> Iterator[str]:
+    """Результаты для каждой строки в исходном порядке
+
+    Пустые строки дают пустой результат. Ошибка в строке даёт ``error: ...``,
+    а при strict=True прерывает вычисление.
+    """
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        for line in chunk:
+            yield _evaluate_line(line, base, strict)
+
+
+def _evaluate_line(line: str, base: int, strict: bool) -> str:
+    if not line.strip():
+        return ""
+    try:
+        return str(evaluate(line, base))
+    except (TypeError, ValueError) as error:
+        if strict:
+            raise ValueError(f"{line.strip()!r}: {error}") from error
+        return f"error: {error}"
+
+
+def evaluate_file(
+    source: IO[str],
+    target: IO[str],
+    base: int = 10,
+    chunk_size: int = CHUNK_SIZE,
+    strict: bool = False,
+) -> int:
+    """Вычисление всех строк source с записью результатов в target; возвращает число строк"""
+    count = 0
+    buffer: List[str] = []
+    try:
+        for result in evaluate_lines(source, base, chunk_size, strict):
+            buffer.append(result)
+            count += 1
+            if len(buffer) >= chunk_size:
+                target.write("\n".join(buffer) + "\n")
+                buffer.clear()
+    finally:
+        # При ошибке (strict=True) уже вычисленные результаты тоже записываются
+        if buffer:
+            target.write("\n".join(buffer) + "\n")
+    return count
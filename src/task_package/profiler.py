@@ -0,0 +1,213 @@
+"""Сэмплирующий профилировщик с разметкой методов zad1/zad2 по размеру операндов.
+
+По сигналу таймера (SIGPROF — процессорное время, SIGALRM — реальное)
+обработчик снимает стек прерванного потока и увеличивает счётчик этого
+стека. Кадры методов zad1 и zad2 подписываются классом получателя и
+корзиной размера наибольшего операнда, например
+``Decimal.multiply[digits<=10000]``, поэтому в flame graph видно, откуда
+приходят гигантские операнды. Результат записывается в формате collapsed
+stacks (``кадр;кадр;кадр число``), который понимают flamegraph.pl,
+speedscope и inferno.
+
+    with profiler.profile("job.folded"):
+        run_job()
+
+или из командной строки:
+
+    python -m task_package.profiler -o job.folded script.py [аргументы]
+
+Работает только на Unix и только в главном потоке; сэмплируется главный поток.
+"""
+
+import argparse
+import runpy
+import signal
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import zad1, zad2
+from .instrument import SIZE_BUCKETS, operand_size
+
+# Интервал между сэмплами по умолчанию, с
+INTERVAL = 0.005
+# Ограничение глубины снимаемого стека
+MAX_DEPTH = 256
+
+_TIMERS = {
+    "cpu": ("ITIMER_PROF", "SIGPROF"),
+    "wall": ("ITIMER_REAL", "SIGALRM"),
+}
+_MODULES = {zad1.__file__: zad1.__name__, zad2.__file__: zad2.__name__}
+
+
+class Profiler:
+    """Сборщик сэмплов стека по таймеру"""
+
+    def __init__(self, interval: float = INTERVAL, mode: str = "cpu") -> None:
+        if mode not in _TIMERS:
+            raise ValueError(f"Неизвестный режим: {mode!r} (ожидается cpu или wall)")
+        if interval <= 0:
+            raise ValueError("Интервал должен быть положительным")
+        timer, signum = _TIMERS[mode]
+        if not hasattr(signal, "setitimer") or not hasattr(signal, signum):
+            raise RuntimeError("Сэмплирующий профилировщик доступен только на Unix")
+        self.interval = interval
+        self.mode = mode
+        self.samples: "Counter[Tuple[str, ...]]" = Counter()
+        self._timer = getattr(signal, timer)
+        self._signum = getattr(signal, signum)
+        self._previous: Any = None
+        self._running = False
+
+    def start(self) -> None:
+        """Установка обработчика сигнала и запуск таймера"""
+        if self._running:
+            return
+        self._previous = signal.signal(self._signum, self._sample)
+        signal.setitimer(self._timer, self.interval, self.interval)
+        self._running = True
+
+    def stop(self) -> None:
+        """Остановка таймера и возврат прежнего обработчика"""
+        if not self._running:
+            return
+        signal.setitimer(self._timer, 0, 0)
+        signal.signal(self._signum, self._previous)
+        self._running = False
+
+    def reset(self) -> None:
+        self.samples.clear()
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        if frame is not None:
+            self.samples[stack(frame)] += 1
+
+    def collapsed(self) -> str:
+        """Сэмплы в формате collapsed stacks"""
+        return "".join(
+            f"{';'.join(frames)} {count}\n"
+            for frames, count in sorted(self.samples.items())
+        )
+
+    def write(self, path: str) -> None:
+        """Запись сэмплов в файл для flamegraph.pl, speedscope или inferno"""
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(self.collapsed())
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+@contextmanager
+def profile(
+    path: Optional[str] = None, interval: float = INTERVAL, mode: str = "cpu"
+) -> Iterator[Profiler]:
+    """Профилирование блока with; при указании path результат записывается в файл"""
+    profiler = Profiler(interval, mode)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        if path is not None:
+            profiler.write(path)
+
+
+def stack(frame: FrameType) -> Tuple[str, ...]:
+    """Подписи кадров от внешнего к текущему"""
+    frames: List[str] = []
+    current: Optional[FrameType] = frame
+    while current is not None and len(frames) < MAX_DEPTH:
+        frames.append(frame_label(current))
+        current = current.f_back
+    frames.reverse()
+    return tuple(frames)
+
+
+def frame_label(frame: FrameType) -> str:
+    """Подпись кадра; для методов zad1/zad2 — класс, метод и корзина размера"""
+    code = frame.f_code
+    module = _MODULES.get(code.co_filename)
+    if module is None:
+        name = frame.f_globals.get("__name__", code.co_filename)
+        return _clean(f"{name}:{code.co_qualname}")
+    args = _arguments(frame)
+    receiver = args[0] if args else None
+    if isinstance(receiver, type):
+        name = f"{receiver.__name__}.{code.co_name}"
+    elif receiver is not None and "." in code.co_qualname:
+        name = f"{type(receiver).__name__}.{code.co_name}"
+    else:
+        name = f"{module}:{code.co_qualname}"
+    size = operand_size(args)
+    if size is None:
+        return _clean(name)
+    return _clean(f"{name}[{size_bucket(size)}]")
+
+
+def size_bucket(digits: int) -> str:
+    """Корзина размера операнда: digits<=N по границам instrument.SIZE_BUCKETS"""
+    for bound in SIZE_BUCKETS:
+        if digits <= bound:
+            return f"digits<={bound}"
+    return f"digits>{SIZE_BUCKETS[-1]}"
+
+
+def _arguments(frame: FrameType) -> Tuple[Any, ...]:
+    code = frame.f_code
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    local: Dict[str, Any] = frame.f_locals
+    return tuple(local[name] for name in names if name in local)
+
+
+def _clean(label: str) -> str:
+    # «;» разделяет кадры, пробел отделяет число сэмплов
+    return label.replace(";", ",").replace(" ", "_")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Сэмплирующее профилирование скрипта Python"
+    )
+    parser.add_argument(
+        "-o", "--output", default="profile.folded", help="файл collapsed stacks"
+    )
+    parser.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=INTERVAL,
+        help="интервал между сэмплами, с",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=sorted(_TIMERS),
+        default="cpu",
+        help="процессорное или реальное время",
+    )
+    parser.add_argument("script", help="профилируемый скрипт")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="аргументы скрипта")
+    args = parser.parse_args(argv)
+
+    sys.argv = [args.script, *args.args]
+    with profile(args.output, args.interval, args.mode) as profiler:
+        try:
+            runpy.run_path(args.script, run_name="__main__")
+        except SystemExit:
+            pass
+    print(
+        f"Сэмплов: {sum(profiler.samples.values())}, записано в {args.output}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Рациональные числа с точной арифметикой.
+
+Дробь хранится несократимой, знаменатель всегда положителен, знак хранится
+в числителе. Сложение и умножение используют приём Хенричи (Кнут, т. 2,
+4.5.1): общие множители знаменателей и числителей сокращаются до умножения,
+поэтому промежуточные значения не растут, а вместо gcd от полного результата
+вычисляются gcd от исходных, меньших, чисел. Сравнение выполняется точно,
+перекрёстным умножением.
+
+Для сумм многих дробей ``Rational.sum`` и ``RationalAccumulator`` складывают
+попарно (деревом), приводя к НОК знаменателей и откладывая сокращение до конца.
+"""
+
+from functools import total_ordering
+from math import gcd
+from typing import Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+Q = TypeVar("Q", bound="Rational")
+RationalLike = Union["Rational", int]
+
+
+@total_ordering
+class Rational:
+    """Обыкновенная дробь numerator/denominator"""
+
+    __slots__ = ("_numerator", "_denominator")
+
+    def __init__(self, numerator: int = 0, denominator: int = 1) -> None:
+        numerator = int(numerator)
+        denominator = int(denominator)
+        if denominator == 0:
+            raise ValueError("Знаменатель не может быть равен нулю")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        g = gcd(numerator, denominator)
+        self._numerator = numerator // g
+        self._denominator = denominator // g
+
+    @classmethod
+    def _from_reduced(cls: Type[Q], numerator: int, denominator: int) -> Q:
+        """Создание из уже несократимой дроби с положительным знаменателем"""
+        obj = cls.__new__(cls)
+        obj._numerator = numerator
+        obj._denominator = denominator
+        return obj
+
+    @classmethod
+    def from_string(cls: Type[Q], text: str) -> Q:
+        """Разбор записи вида ``-3/4`` или ``5``"""
+        numerator, _, denominator = text.strip().partition("/")
+        try:
+            parts = int(numerator), int(denominator) if denominator else 1
+        except ValueError:
+            raise ValueError(f"Некорректная запись дроби: {text!r}") from None
+        return cls(*parts)
+
+    @classmethod
+    def sum(cls, values: Iterable[RationalLike], start: RationalLike = 0) -> "Rational":
+        """Сумма дробей попарным сложением с одним сокращением в конце"""
+        acc = RationalAccumulator()
+        acc.add(start)
+        for value in values:
+            acc.add(value)
+        return acc.result()
+
+    @property
+    def numerator(self) -> int:
+        return self._numerator
+
+    @property
+    def denominator(self) -> int:
+        return self._denominator
+
+    @staticmethod
+    def _parts(other: object) -> Optional[Tuple[int, int]]:
+        """Числитель и знаменатель операнда или None для неподдерживаемых типов"""
+        if isinstance(other, Rational):
+            return other._numerator, other._denominator
+        if isinstance(other, int):
+            return other, 1
+        return None
+
+    def _operand(self, other: object) -> Tuple[int, int]:
+        parts = self._parts(other)
+        if parts is None:
+            raise TypeError("Аргумент должен быть Rational или int")
+        return parts
+
+    def _add(self, c: int, d: int) -> "Rational":
+        a, b = self._numerator, self._denominator
+        g = gcd(b, d)
+        if g == 1:
+            numerator = a * d + b * c
+            return Rational._from_reduced(numerator, b * d if numerator else 1)
+        s = b // g
+        t = a * (d // g) + c * s
+        if not t:
+            return Rational._from_reduced(0, 1)
+        g2 = gcd(t, g)
+        if g2 == 1:
+            return Rational._from_reduced(t, s * d)
+        return Rational._from_reduced(t // g2, s * (d // g2))
+
+    def _mul(self, c: int, d: int) -> "Rational":
+        a, b = self._numerator, self._denominator
+        if not a or not c:
+            return Rational._from_reduced(0, 1)
+        g1 = gcd(a, d)
+        g2 = gcd(c, b)
+        return Rational._from_reduced((a // g1) * (c // g2), (b // g2) * (d // g1))
+
+    def add(self, other: RationalLike) -> "Rational":
+        """Сложение"""
+        return self._add(*self._operand(other))
+
+    def sub(self, other: RationalLike) -> "Rational":
+        """Вычитание"""
+        c, d = self._operand(other)
+        return self._add(-c, d)
+
+    def mul(self, other: RationalLike) -> "Rational":
+        """Умножение"""
+        return self._mul(*self._operand(other))
+
+    def div(self, other: RationalLike) -> "Rational":
+        """Деление"""
+        c, d = self._operand(other)
+        if c == 0:
+            raise ValueError("Деление на ноль невозможно")
+        if c < 0:
+            c, d = -c, -d
+        return self._mul(d, c)
+
+    def equals(self, other: object) -> bool:
+        """Точное равенство"""
+        parts = self._parts(other)
+        return parts is not None and parts == (self._numerator, self._denominator)
+
+    def greater(self, other: RationalLike) -> bool:
+        """Строго больше (без перевода в float)"""
+        c, d = self._operand(other)
+        return self._numerator * d > c * self._denominator
+
+    def less(self, other: RationalLike) -> bool:
+        """Строго меньше (без перевода в float)"""
+        c, d = self._operand(other)
+        return self._numerator * d < c * self._denominator
+
+    def __add__(self, other: RationalLike) -> "Rational":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._add(*parts)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: RationalLike) -> "Rational":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._add(-parts[0], parts[1])
+
+    def __rsub__(self, other: RationalLike) -> "Rational":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return (-self)._add(*parts)
+
+    def __mul__(self, other: RationalLike) -> "Rational":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._mul(*parts)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: RationalLike) -> "Rational":
+        if self._parts(other) is None:
+            return NotImplemented
+        return self.div(other)
+
+    def __rtruediv__(self, other: RationalLike) -> "Rational":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return Rational._from_reduced(*parts).div(self)
+
+    def __neg__(self) -> "Rational":
+        return Rational._from_reduced(-self._numerator, self._denominator)
+
+    def __abs__(self) -> "Rational":
+        return Rational._from_reduced(abs(self._numerator), self._denominator)
+
+    def __eq__(self, other: object) -> bool:
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return parts == (self._numerator, self._denominator)
+
+    def __lt__(self, other: RationalLike) -> bool:
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._numerator * parts[1] < parts[0] * self._denominator
+
+    def __hash__(self) -> int:
+        if self._denominator == 1:
+            return hash(self._numerator)
+        return hash((self._numerator, self._denominator))
+
+    def __bool__(self) -> bool:
+        return self._numerator != 0
+
+    def __float__(self) -> float:
+        return self._numerator / self._denominator
+
+    def __str__(self) -> str:
+        return f"{self._numerator}/{self._denominator}"
+
+    def __repr__(self) -> str:
+        return f"Rational({self._numerator}, {self._denominator})"
+
+
+class RationalAccumulator:
+    """Накопитель суммы дробей
+
+    Частичные суммы хранятся несокращёнными парами (числитель, знаменатель)
+    в стеке, как разряды двоичного счётчика: две суммы из одинакового числа
+    слагаемых сразу складываются. Складываемые операнды поэтому имеют близкий
+    размер, знаменатель суммы — НОК знаменателей (нужен только gcd
+    знаменателей), а gcd числителя и знаменателя вычисляется один раз в result.
+    """
+
+    __slots__ = ("_stack",)
+
+    def __init__(self) -> None:
+        # (числитель, знаменатель, число слагаемых)
+        self._stack: List[Tuple[int, int, int]] = []
+
+    def add(self, value: RationalLike) -> None:
+        """Добавление слагаемого"""
+        parts = Rational._parts(value)
+        if parts is None:
+            raise TypeError("Аргумент должен быть Rational или int")
+        numerator, denominator = parts
+        stack = self._stack
+        count = 1
+        while stack and stack[-1][2] == count:
+            top_numerator, top_denominator, _ = stack.pop()
+            numerator, denominator = _add_unreduced(
+                top_numerator, top_denominator, numerator, denominator
+            )
+            count *= 2
+        stack.append((numerator, denominator, count))
+
+    def result(self) -> Rational:
+        """Сокращённая сумма добавленных слагаемых"""
+        numerator, denominator = 0, 1
+        for top_numerator, top_denominator, _ in reversed(self._stack):
+            numerator, denominator = _add_unreduced(
+                top_numerator, top_denominator, numerator, denominator
+            )
+        return Rational(numerator, denominator)
+
+    def __len__(self) -> int:
+        return sum(count for _, _, count in self._stack)
+
+
+def _add_unreduced(a: int, b: int, c: int, d: int) -> Tuple[int, int]:
+    """a/b + c/d над НОК знаменателей, без сокращения числителя"""
+    g = gcd(b, d)
+    if g == 1:
+        return a * d + c * b, b * d
+    return a * (d // g) + c * (b // g), b // g * d
@@ -0,0 +1,223 @@
+"""Асинхронный сервис арифметики над числами zad1/zad2.
+
+Клиент присылает по строке на запрос и получает по строке ответа
+``ok <результат>`` или ``error <сообщение>``, в том же порядке. Запросы:
+
+- ``dec <выражение>``, ``bin <выражение>`` — выражение модуля pipeline над
+  Decimal или Binary, например ``dec 123 * 45``;
+- ``real <a> + <b>``, ``real <a> / <b>``, ``real <a> ** <b>``,
+  ``real log <a> [<основание>]`` — операции Real;
+- ``stats`` — число запросов и перцентили задержки в миллисекундах.
+
+Запросы длиннее ``offload_size`` символов вычисляются в пуле процессов,
+чтобы длинная арифметика не останавливала цикл событий.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+
+from . import pipeline
+from .zad1 import Number, Real
+
+# Начиная с этой длины запроса (в символах) вычисление уходит в пул процессов
+OFFLOAD_SIZE = 10_000
+
+# Число последних запросов, по которым считаются перцентили
+LATENCY_WINDOW = 10_000
+
+# Предельная длина строки запроса
+LINE_LIMIT = 1 << 26
+
+PERCENTILES = (50, 90, 99)
+
+_INTEGER_BASES = {"dec": 10, "bin": 2}
+
+
+def handle(line: str) -> str:
+    """Ответ на один запрос (без перевода строки)"""
+    command, _, rest = line.strip().partition(" ")
+    try:
+        if command in _INTEGER_BASES:
+            return f"ok {pipeline.evaluate(rest, _INTEGER_BASES[command])}"
+        if command == "real":
+            return f"ok {_real(rest.split())}"
+        raise ValueError(f"Неизвестная команда: {command!r}")
+    except (TypeError, ValueError, ArithmeticError) as error:
+        return f"error {error}"
+
+
+def _real(args: List[str]) -> Number:
+    if args and args[0] == "log" and len(args) in (2, 3):
+        return Real(float(args[1])).logarithm(
+            float(args[2]) if len(args) == 3 else None
+        )
+    if len(args) != 3:
+        raise ValueError("Ожидалось: real <a> <операция> <b>")
+    left, op, right = Real(float(args[0])), args[1], float(args[2])
+    if op == "+":
+        return left.add(right)
+    if op == "/":
+        return left.divide(right)
+    if op == "**":
+        return left.power(right)
+    raise ValueError(f"Неизвестная операция: {op!r}")
+
+
+def percentiles(
+    samples: List[float], points: Tuple[int, ...] = PERCENTILES
+) -> Dict[int, float]:
+    """Перцентили выборки (метод ближайшего ранга)"""
+    if not samples:
+        return {p: 0.0 for p in points}
+    ordered = sorted(samples)
+    return {p: ordered[max(0, -(-p * len(ordered) // 100) - 1)] for p in points}
+
+
+class ArithmeticServer:
+    """Сервер на TCP или Unix-сокете"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        offload_size: int = OFFLOAD_SIZE,
+        window: int = LATENCY_WINDOW,
+    ) -> None:
+        self.workers = workers
+        self.offload_size = offload_size
+        self.requests = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """Запуск на TCP-сокете; возвращает фактический адрес (port=0 — любой свободный)"""
+        self._server = await asyncio.start_server(
+            self._serve_client, host, port, limit=LINE_LIMIT
+        )
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str) -> None:
+        """Запуск на Unix-сокете"""
+        self._server = await asyncio.start_unix_server(
+            self._serve_client, path, limit=LINE_LIMIT
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("Сервер не запущен")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def stats(self) -> Dict[str, float]:
+        """Число запросов и перцентили задержки (мс) по последним запросам"""
+        result: Dict[str, float] = {"count": self.requests}
+        for point, value in percentiles(list(self._latencies)).items():
+            result[f"p{point}"] = value * 1000
+        return result
+
+    async def respond(self, line: str) -> str:
+        if line.strip() == "stats":
+            return "ok " + " ".join(
+                f"{key}={value:g}" for key, value in self.stats().items()
+            )
+        start = time.perf_counter()
+        if len(line) >= self.offload_size:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers)
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._pool, handle, line
+            )
+        else:
+            response = handle(line)
+        self._latencies.append(time.perf_counter() - start)
+        self.requests += 1
+        return response
+
+    async def _serve_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self.respond(line.decode("ascii", "replace"))
+                writer.write(response.encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+class Client:
+    """Клиент: запросы отправляются по одному, ответы читаются по порядку"""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 0) -> "Client":
+        return cls(*await asyncio.open_connection(host, port, limit=LINE_LIMIT))
+
+    @classmethod
+    async def connect_unix(cls, path: str) -> "Client":
+        return cls(*await asyncio.open_unix_connection(path, limit=LINE_LIMIT))
+
+    async def request(self, line: str) -> str:
+        self._writer.write(line.encode("ascii") + b"\n")
+        await self._writer.drain()
+        return (await self._reader.readline()).decode("utf-8").rstrip("\n")
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = ArithmeticServer(args.workers, args.offload_size)
+    if args.unix:
+        await server.start_unix(args.unix)
+        print(f"Сервер слушает {args.unix}")
+    else:
+        host, port = await server.start(args.host, args.port)
+        print(f"Сервер слушает {host}:{port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Сервис арифметики над числами")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="путь к Unix-сокету вместо TCP")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--offload-size", type=int, default=OFFLOAD_SIZE)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Файловый формат целых чисел и отображение таких файлов в память.
+
+Файл состоит из заголовка фиксированной длины и цифр в том же упакованном
+виде, в каком их хранит объект (по байту на цифру или упакованные биты).
+``open_mmap`` отображает файл в память только для чтения и отдаёт объекту
+``memoryview`` на область цифр без копирования, поэтому несколько процессов,
+открывших один файл, разделяют одну физическую копию страниц.
+"""
+
+import mmap
+import os
+import struct
+from typing import NamedTuple, Optional, Type, Union
+
+from .zad2 import PackedRadixInteger, Radix, RadixInteger
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"TPKI"
+VERSION = 1
+FLAG_PACKED = 1
+
+# Сигнатура, версия, основание, флаги, число цифр, длина данных
+_HEADER = struct.Struct("<4sBBHQQ")
+HEADER_SIZE = _HEADER.size
+
+
+class Header(NamedTuple):
+    base: int
+    packed: bool
+    ndigits: int
+    length: int
+
+
+def save(number: RadixInteger, path: PathLike) -> None:
+    """Запись числа в файл: заголовок и упакованные цифры"""
+    data = number._storage()
+    packed = isinstance(number, PackedRadixInteger)
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        number.BASE,
+        FLAG_PACKED if packed else 0,
+        number._ndigits,
+        len(data),
+    )
+    with open(path, "wb") as out:
+        out.write(header)
+        out.write(data)
+
+
+def read_header(buffer: Union[bytes, memoryview, mmap.mmap]) -> Header:
+    """Разбор и проверка заголовка файла"""
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("Файл слишком короткий для заголовка")
+    magic, version, base, flags, ndigits, length = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Неизвестный формат файла")
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {version}")
+    if HEADER_SIZE + length > len(buffer):
+        raise ValueError("Файл обрезан")
+    return Header(base, bool(flags & FLAG_PACKED), ndigits, length)
+
+
+def open_mmap(path: PathLike, cls: Optional[Type[RadixInteger]] = None) -> RadixInteger:
+    """Число, цифры которого отображены из файла в память без копирования
+
+    Если cls не указан, класс выбирается по основанию из заголовка.
+    """
+    with open(path, "rb") as stream:
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    header = read_header(mapped)
+    target = Radix(header.base) if cls is None else cls
+    if target.BASE != header.base:
+        raise ValueError(
+            f"Файл содержит число с основанием {header.base}, ожидалось {target.BASE}"
+        )
+    if header.packed != issubclass(target, PackedRadixInteger):
+        raise ValueError("Формат хранения в файле не совпадает с классом")
+    # Цифры не проверяются: файл пишется только через save, а проверка
+    # потребовала бы прочитать его целиком
+    view = memoryview(mapped)[HEADER_SIZE : HEADER_SIZE + header.length]
+    obj = target.__new__(target)
+    obj._data = view  # type: ignore[assignment]
+    obj._ndigits = header.ndigits
+    obj._value = None
+    return obj
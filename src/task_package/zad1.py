@@ -1,10 +1,98 @@
 import math
-from typing import Union
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+
+# Ключ кэша — код операции и сырые биты пары float (различает 0.0 и -0.0)
+_key = struct.Struct("<cdd").pack
+
+
+class _LRUCache:
+    """Ограниченный LRU-кэш результатов Real.power и Real.logarithm
+
+    Кроме результатов хранит таблицу ln(base) для повторяющихся оснований
+    логарифма. Доступ защищён блокировкой.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_data", "_ln", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[bytes, float]" = OrderedDict()
+        self._ln: "OrderedDict[float, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[float]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value: float) -> None:
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def ln(self, base: float) -> float:
+        """ln(base) из таблицы (вычисляется при первом обращении)"""
+        with self._lock:
+            value = self._ln.get(base)
+            if value is None:
+                value = self._ln[base] = math.log(base)
+                if len(self._ln) > self.maxsize:
+                    self._ln.popitem(last=False)
+            return value
+
+
+_cache: Optional[_LRUCache] = None
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """Включение кэша Real.power и Real.logarithm (прежнее содержимое сбрасывается)
+
+    С кэшем log(x, base) считается как ln(x) / ln(base) с ln(base) из таблицы —
+    так же, как math.log(x, base), поэтому результаты совпадают побитово.
+    Поиск в кэше дороже самих ** и math.log для float, поэтому по умолчанию
+    кэш выключен (см. benchmarks/bench_memo.py).
+    """
+    global _cache
+    _cache = _LRUCache(maxsize)
+
+
+def disable_cache() -> None:
+    """Отключение кэша"""
+    global _cache
+    _cache = None
+
+
+def cache_info() -> Dict[str, int]:
+    """Попадания, промахи, размер и ёмкость кэша (нули, если кэш выключен)"""
+    cache = _cache
+    if cache is None:
+        return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+    return {
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "size": len(cache._data),
+        "maxsize": cache.maxsize,
+    }
 
 
 class Number:
     """Базовый класс для чисел типа float"""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: Union[float, int] = 0.0) -> None:
         self._value = float(value)
 
@@ -25,6 +113,84 @@ class Number:
             raise ValueError("Деление на ноль невозможно")
         return Number(self._value / other_val)
 
+    @staticmethod
+    def _operand(other: object) -> Optional[float]:
+        """Значение операнда оператора или None для неподдерживаемых типов"""
+        if isinstance(other, Number):
+            return other._value
+        if isinstance(other, (int, float)):
+            return float(other)
+        return None
+
+    def __add__(self, other: Union["Number", float, int]) -> "Number":
+        if self._operand(other) is None:
+            return NotImplemented
+        return self.add(other)
+
+    __radd__ = __add__
+
+    def __truediv__(self, other: Union["Number", float, int]) -> "Number":
+        if self._operand(other) is None:
+            return NotImplemented
+        return self.divide(other)
+
+    def __rtruediv__(self, other: Union[float, int]) -> "Number":
+        if self._operand(other) is None:
+            return NotImplemented
+        return Number(other).divide(self)
+
+    def __iadd__(self, other: Union["Number", float, int]) -> "Number":
+        """Сложение на месте без создания нового объекта"""
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        self._value += value
+        return self
+
+    def __itruediv__(self, other: Union["Number", float, int]) -> "Number":
+        """Деление на месте без создания нового объекта"""
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        if value == 0:
+            raise ValueError("Деление на ноль невозможно")
+        self._value /= value
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        return self._value == value
+
+    def __lt__(self, other: Union["Number", float, int]) -> bool:
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        return self._value < value
+
+    # Сравнения заданы явно, а не через total_ordering: для NaN все они ложны, как у float
+    def __le__(self, other: Union["Number", float, int]) -> bool:
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        return self._value <= value
+
+    def __gt__(self, other: Union["Number", float, int]) -> bool:
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        return self._value > value
+
+    def __ge__(self, other: Union["Number", float, int]) -> bool:
+        value = self._operand(other)
+        if value is None:
+            return NotImplemented
+        return self._value >= value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
     def __str__(self) -> str:
         return str(self._value)
 
@@ -36,13 +202,23 @@ class Real(Number):
     """Производный класс для возведения
     в производную степень и нахождения логарифма"""
 
+    __slots__ = ()
+
     def power(self, exponent: Union["Real", float, int]) -> "Real":
         """Возведение в произвольную степень"""
         if isinstance(exponent, Real):
             exp_val = exponent._value
         else:
             exp_val = float(exponent)
-        return Real(self._value**exp_val)
+        cache = _cache
+        if cache is None:
+            return Real(self._value**exp_val)
+        key = _key(b"p", self._value, exp_val)
+        value = cache.get(key)
+        if value is None:
+            value = Real(self._value**exp_val)._value
+            cache.put(key, value)
+        return Real(value)
 
     def logarithm(self, base: Union["Real", float, int, None] = None) -> "Real":
         """Вычисление логарифма числа"""
@@ -59,7 +235,38 @@ class Real(Number):
             if self._value <= 0 or base_val <= 0 or base_val == 1:
                 raise ValueError("Некорректные значения для логарифма")
 
-            return Real(math.log(self._value, base_val))
+            cache = _cache
+            if cache is None:
+                return Real(math.log(self._value, base_val))
+            key = _key(b"l", self._value, base_val)
+            value = cache.get(key)
+            if value is None:
+                # math.log(x, base) вычисляет именно log(x) / log(base)
+                value = math.log(self._value) / cache.ln(base_val)
+                cache.put(key, value)
+            return Real(value)
+
+    def __pow__(self, exponent: Union["Real", float, int]) -> "Real":
+        if isinstance(exponent, Number) and not isinstance(exponent, Real):
+            return NotImplemented
+        if self._operand(exponent) is None:
+            return NotImplemented
+        return self.power(exponent)
+
+    def __rpow__(self, base: Union[float, int]) -> "Real":
+        if self._operand(base) is None:
+            return NotImplemented
+        return Real(base).power(self)
+
+    def __ipow__(self, exponent: Union["Real", float, int]) -> "Real":
+        """Возведение в степень на месте без создания нового объекта"""
+        if isinstance(exponent, Number) and not isinstance(exponent, Real):
+            return NotImplemented
+        value = self._operand(exponent)
+        if value is None:
+            return NotImplemented
+        self._value = float(self._value**value)
+        return self
 
     def __repr__(self) -> str:
         return f"Real({self._value})"
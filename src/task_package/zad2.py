@@ -1,16 +1,263 @@
+import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar
+from contextlib import nullcontext
+from functools import partial
+from typing import (
+    IO,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from . import convert, division, limbs
 
 T = TypeVar("T", bound="Integer")
+R = TypeVar("R", bound="RadixInteger")
+P = TypeVar("P", bound="PackedRadixInteger")
+
+StreamSource = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# Размер порции чтения для from_stream
+STREAM_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = b" \t\r\n\v\f"
 
 
 class Integer(ABC):
-    """Абстрактный базовый класс для целых чисел"""
+    """Абстрактный базовый класс для целых чисел
+
+    Цифры хранятся в компактном виде (``_data``, формат задаёт подкласс),
+    рядом кэшируется значение в виде int (``_value``). Любая из двух форм
+    может отсутствовать и строится лениво из другой.
+    """
 
-    def __init__(self, digits: Optional[List[int]] = None) -> None:
+    __slots__ = ("_data", "_ndigits", "_value")
+
+    BASE: int
+    _DIGITS_ERROR = "Некорректные цифры"
+
+    _data: Optional[bytes]
+    _ndigits: int
+    _value: Optional[int]
+
+    def __init__(self, digits: Optional[Union[Sequence[int], bytes]] = None) -> None:
         if digits is None:
             digits = [0]
-        self.digits = digits
+        self._assign(digits)
+
+    @property
+    def digits(self) -> List[int]:
+        """Массив цифр (новый список при каждом обращении)"""
+        return list(self._unpack(self._storage()))
+
+    @digits.setter
+    def digits(self, digits: List[int]) -> None:
+        self._assign(digits)
+
+    def _assign(self, digits: Union[Sequence[int], bytes]) -> None:
+        """Проверка и сохранение значений цифр"""
+        raw = self._digit_bytes(digits)
+        self._validate(raw)
+        self._data = self._pack(raw)
+        self._ndigits = len(raw)
+        self._value = None
+
+    @classmethod
+    def _digit_bytes(cls, digits: Union[Sequence[int], bytes]) -> bytes:
+        """Значения цифр в виде bytes; значения относительно основания не проверяются"""
+        # bytes(5) дал бы пять нулевых байтов, а bytes("12") — ошибку кодировки
+        if isinstance(digits, (int, str)):
+            raise TypeError("Цифры должны быть заданы последовательностью чисел")
+        try:
+            raw = bytes(digits)
+        except (TypeError, ValueError):
+            raise ValueError(cls._DIGITS_ERROR) from None
+        if not raw:
+            raise ValueError("Число должно содержать хотя бы одну цифру")
+        return raw
+
+    def _storage(self) -> bytes:
+        """Компактные цифры; строятся из значения при первом обращении"""
+        if self._data is None:
+            self._data, self._ndigits = self._pack_int(self._value or 0)
+        return self._data
+
+    def _digit_count(self) -> Optional[int]:
+        """Число цифр в своей системе без их вычисления
+
+        Для объекта, созданного из int, считается по значению, поэтому равные
+        числа дают одинаковый размер независимо от того, построены ли цифры.
+        None — если слоты ещё не заполнены (объект в процессе создания).
+        """
+        if getattr(self, "_data", None) is not None:
+            return self._ndigits
+        value = getattr(self, "_value", None)
+        if value is None:
+            return None
+        return convert.digit_count(value, self.BASE)
+
+    def _validate(self, raw: bytes) -> None:
+        """Проверка значений цифр перед упаковкой"""
+
+    def _pack(self, raw: bytes) -> bytes:
+        """Упаковка значений цифр (по байту на цифру) в формат хранения"""
+        return raw
+
+    def _unpack(self, data: bytes) -> bytes:
+        """Распаковка формата хранения в значения цифр"""
+        return bytes(data)
+
+    def _unpack_int(self, data: bytes) -> int:
+        """Значение числа по данным в формате хранения"""
+        return convert.to_int(data, self.BASE)
+
+    def _pack_int(self, value: int) -> Tuple[bytes, int]:
+        """Формат хранения и количество цифр для неотрицательного целого"""
+        raw = convert.from_int(value, self.BASE)
+        return raw, len(raw)
+
+    def to_int(self) -> int:
+        """Преобразование массива цифр в целое число (результат кэшируется)"""
+        if self._value is None:
+            self._value = self._unpack_int(self._data or b"")
+        return self._value
+
+    @classmethod
+    def from_int(cls: Type[T], num: int) -> T:
+        """Создание объекта из целого числа (знак отбрасывается)
+
+        Цифры не вычисляются до первого обращения к digits.
+        """
+        obj = cls.__new__(cls)
+        obj._data = None
+        obj._ndigits = 0
+        obj._value = abs(num)
+        return obj
+
+    @classmethod
+    def _from_raw(cls: Type[T], raw: bytes) -> T:
+        """Создание объекта из уже проверенных значений цифр без повторной проверки"""
+        obj = cls.__new__(cls)
+        obj._data = obj._pack(raw)
+        obj._ndigits = len(raw)
+        obj._value = None
+        return obj
+
+    def _to_int(self) -> int:
+        """Синоним to_int для обратной совместимости"""
+        return self.to_int()
+
+    @classmethod
+    def _from_int(cls: Type[T], num: int) -> T:
+        """Синоним from_int для обратной совместимости"""
+        return cls.from_int(num)
+
+    def _set_value(self, value: int) -> None:
+        """Замена значения на месте; цифры будут построены заново лениво"""
+        self._value = abs(value)
+        self._data = None
+        self._ndigits = 0
+
+    def _same_kind(self, other: object) -> bool:
+        return isinstance(other, Integer) and other.BASE == self.BASE
+
+    def __add__(self: T, other: T) -> T:
+        return self.add(other)
+
+    def __sub__(self: T, other: T) -> T:
+        return self.subtract(other)
+
+    def __mul__(self: T, other: T) -> T:
+        return self.multiply(other)
+
+    def __floordiv__(self: T, other: T) -> T:
+        return self.divide(other)
+
+    def __mod__(self: T, other: T) -> T:
+        return self.divmod(other)[1]
+
+    def __iadd__(self: T, other: T) -> T:
+        """Сложение на месте без создания нового объекта"""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        self._set_value(self.to_int() + other.to_int())
+        return self
+
+    def __isub__(self: T, other: T) -> T:
+        """Вычитание на месте без создания нового объекта"""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        self._set_value(self.to_int() - other.to_int())
+        return self
+
+    def __imul__(self: T, other: T) -> T:
+        """Умножение на месте без создания нового объекта"""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        self._set_value(self.to_int() * other.to_int())
+        return self
+
+    def __ifloordiv__(self: T, other: T) -> T:
+        """Целочисленное деление на месте без создания нового объекта"""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        divisor = other.to_int()
+        if divisor == 0:
+            raise ValueError("Деление на ноль")
+        self._set_value(division.divmod_int(self.to_int(), divisor)[0])
+        return self
+
+    def __imod__(self: T, other: T) -> T:
+        """Остаток от деления на месте без создания нового объекта"""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        divisor = other.to_int()
+        if divisor == 0:
+            raise ValueError("Деление на ноль")
+        self._set_value(division.divmod_int(self.to_int(), divisor)[1])
+        return self
+
+    def _compare(self, other: "Integer") -> int:
+        """Сравнение значений: -1, 0 или 1"""
+        a, b = self.to_int(), other.to_int()
+        return (a > b) - (a < b)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Integer) or other.BASE != self.BASE:
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __lt__(self, other: "Integer") -> bool:
+        if not self._same_kind(other):
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other: "Integer") -> bool:
+        if not self._same_kind(other):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def __gt__(self, other: "Integer") -> bool:
+        if not self._same_kind(other):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other: "Integer") -> bool:
+        if not self._same_kind(other):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def __hash__(self) -> int:
+        # Хэш зависит от значения: не изменяйте на месте числа, лежащие в set/dict
+        return hash((self.BASE, self.to_int()))
 
     @abstractmethod
     def __str__(self) -> str:
@@ -42,141 +289,314 @@ class Integer(ABC):
         """Абстрактный метод деления"""
         pass
 
+    @abstractmethod
+    def divmod(self: T, other: T) -> Tuple[T, T]:
+        """Абстрактный метод деления с остатком"""
+        pass
 
-class Decimal(Integer):
-    """Класс для десятичных чисел"""
 
-    def __init__(self, digits: Optional[List[int]] = None) -> None:
-        super().__init__(digits)
-        self._validate_digits()
+class RadixInteger(Integer):
+    """Общее арифметическое ядро для целых в системе счисления с основанием BASE
 
-    def _validate_digits(self) -> None:
-        """Проверка корректности цифр (0-9)"""
-        for digit in self.digits:
-            if not 0 <= digit <= 9:
-                raise ValueError("Цифры должны быть в диапазоне 0-9")
+    Цифры хранятся по байту на цифру. Подклассы задают BASE, а также
+    _KIND (прилагательное для сообщений об ошибках) и _DIGITS_ERROR.
+    """
 
-    def _to_int(self) -> int:
-        """Преобразование массива цифр в целое число"""
-        return int("".join(map(str, self.digits)))
+    __slots__ = ()
+
+    _KIND = "целые"
+
+    def _validate(self, raw: bytes) -> None:
+        if not convert.digits_valid(raw, self.BASE):
+            raise ValueError(self._DIGITS_ERROR)
+
+    def _check_operand(self, other: object, action: str) -> None:
+        if not isinstance(other, RadixInteger) or other.BASE != self.BASE:
+            raise TypeError(f"Можно {action} только {self._KIND} числа")
+
+    def _compare(self, other: Integer) -> int:
+        """Если значения ещё не вычислены, сравнение идёт по цифрам без разбора"""
+        if self._value is not None or other._value is not None:
+            return super()._compare(other)
+        a = bytes(self._storage()).lstrip(b"\x00")
+        b = bytes(other._storage()).lstrip(b"\x00")
+        return ((len(a), a) > (len(b), b)) - ((len(a), a) < (len(b), b))
+
+    def save(self, path: "Union[str, os.PathLike[str]]") -> None:
+        """Запись числа в файл для последующего open_mmap"""
+        from .storage import save
+
+        save(self, path)
 
     @classmethod
-    def _from_int(cls, num: int) -> "Decimal":
-        """Создание объекта из целого числа"""
-        if num == 0:
-            return cls([0])
-        digits: List[int] = []
-        n = abs(num)
-        while n > 0:
-            digits.insert(0, n % 10)
-            n //= 10
-        return cls(digits)
+    def open_mmap(cls: Type[R], path: "Union[str, os.PathLike[str]]") -> R:
+        """Число, цифры которого отображены из файла в память без копирования
+
+        У RadixInteger класс выбирается по основанию из заголовка файла.
+        """
+        from .storage import open_mmap
+
+        return open_mmap(path, None if cls is RadixInteger else cls)  # type: ignore[return-value]
+
+    def __reduce__(self) -> Tuple[object, ...]:
+        """Сериализация в компактном виде: значение int, если оно вычислено, иначе упакованные цифры"""
+        cls: Union[int, Type[RadixInteger]] = type(self)
+        if _radix_classes.get(self.BASE) is cls:
+            # Классы Radix создаются динамически, поэтому передаётся основание
+            cls = self.BASE
+        if self._value is not None:
+            return _restore, (cls, self._value)
+        return _restore, (cls, bytes(self._storage()), self._ndigits)
 
     def __str__(self) -> str:
-        """Строковое представление в виде десятичного числа"""
-        return str(self._to_int())
+        """Строковое представление цифрами системы счисления"""
+        return convert.to_ascii(self._storage()).decode()
 
     def __repr__(self) -> str:
         """Формальное представление в виде массива цифр"""
-        return f"Decimal({self.digits})"
-
-    def add(self, other: "Decimal") -> "Decimal":
-        """Сложение десятичных чисел"""
-        if not isinstance(other, Decimal):
-            raise TypeError("Можно складывать только десятичные числа")
-        result = self._to_int() + other._to_int()
-        return Decimal._from_int(result)
-
-    def subtract(self, other: "Decimal") -> "Decimal":
-        """Вычитание десятичных чисел"""
-        if not isinstance(other, Decimal):
-            raise TypeError("Можно вычитать только десятичные числа")
-        result = self._to_int() - other._to_int()
-        return Decimal._from_int(result)
-
-    def multiply(self, other: "Decimal") -> "Decimal":
-        """Умножение десятичных чисел"""
-        if not isinstance(other, Decimal):
-            raise TypeError("Можно умножать только десятичные числа")
-        result = self._to_int() * other._to_int()
-        return Decimal._from_int(result)
-
-    def divide(self, other: "Decimal") -> "Decimal":
-        """Деление десятичных чисел"""
-        if not isinstance(other, Decimal):
-            raise TypeError("Можно делить только десятичные числа")
-        if other._to_int() == 0:
+        return f"{type(self).__name__}({self.digits})"
+
+    def add(self: R, other: R) -> R:
+        """Сложение"""
+        self._check_operand(other, "складывать")
+        return type(self).from_int(self.to_int() + other.to_int())
+
+    def subtract(self: R, other: R) -> R:
+        """Вычитание (результат по модулю)"""
+        self._check_operand(other, "вычитать")
+        return type(self).from_int(self.to_int() - other.to_int())
+
+    def multiply(self: R, other: R) -> R:
+        """Умножение"""
+        self._check_operand(other, "умножать")
+        if (
+            self._value is None
+            and other._value is None
+            and not convert.is_power_of_two(self.BASE)
+        ):
+            threshold = limbs.DIGITS_THRESHOLD
+            if (
+                threshold is not None
+                and min(self._ndigits, other._ndigits) >= threshold
+            ):
+                # Оба числа заданы цифрами: умножаем лимбы, минуя перевод в int
+                raw = limbs.multiply_digits(
+                    self._storage(), other._storage(), self.BASE
+                )
+                return type(self)._from_raw(raw)
+        return type(self).from_int(self.to_int() * other.to_int())
+
+    def divide(self: R, other: R) -> R:
+        """Целочисленное деление"""
+        return self.divmod(other)[0]
+
+    def mod(self: R, other: R) -> R:
+        """Остаток от деления"""
+        return self.divmod(other)[1]
+
+    def divmod(self: R, other: R) -> Tuple[R, R]:
+        """Частное и остаток от деления за один проход"""
+        self._check_operand(other, "делить")
+        divisor = other.to_int()
+        if divisor == 0:
             raise ValueError("Деление на ноль")
-        result = self._to_int() // other._to_int()
-        return Decimal._from_int(result)
+        quotient, remainder = division.divmod_int(self.to_int(), divisor)
+        cls = type(self)
+        return cls.from_int(quotient), cls.from_int(remainder)
 
+    __divmod__ = divmod
 
-class Binary(Integer):
-    """Класс для двоичных чисел"""
+    @classmethod
+    def from_stream(
+        cls: Type[R], source: StreamSource, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> R:
+        """Построение числа из потока ASCII-цифр порциями по chunk_size байт
+
+        source - путь к файлу или файловый объект в бинарном режиме.
+        Пробельные символы пропускаются; весь текст в памяти не хранится.
+        """
+        opened: ContextManager[IO[bytes]]
+        if isinstance(source, (str, os.PathLike)):
+            opened = open(source, "rb")
+        else:
+            opened = nullcontext(source)
+        with opened as stream:
+            return cls._from_chunks(iter(partial(stream.read, chunk_size), b""))
 
-    def __init__(self, digits: Optional[List[int]] = None) -> None:
-        super().__init__(digits)
-        self._validate_bits()
+    @classmethod
+    def _from_chunks(cls: Type[R], chunks: Iterable[bytes]) -> R:
+        """Проверка и упаковка цифр по мере чтения порций"""
+        out = bytearray()
+        for chunk in chunks:
+            raw = convert.from_ascii(chunk.translate(None, _WHITESPACE))
+            if not convert.digits_valid(raw, cls.BASE):
+                raise ValueError(cls._DIGITS_ERROR)
+            out += raw
+        if not out:
+            raise ValueError("Поток не содержит цифр")
+        # Буфер передаётся без копии (копия удвоила бы пик памяти) и дальше только читается
+        return cls._from_raw(cast(bytes, out))
+
+    def to_radix(self, base: int) -> "RadixInteger":
+        """Перевод в систему с другим основанием
+
+        Между степенями двойки упакованные биты переиспользуются как есть,
+        без перевода через десятичное int.
+        """
+        target = Radix(base)
+        if isinstance(self, PackedRadixInteger) and issubclass(
+            target, PackedRadixInteger
+        ):
+            data = self._storage()
+            value = int.from_bytes(data, "big")
+            obj = target.__new__(target)
+            obj._data = data
+            obj._ndigits = -(-value.bit_length() // target._BITS) or 1
+            obj._value = self._value
+            return obj
+        return target.from_int(self.to_int())
+
+
+class PackedRadixInteger(RadixInteger):
+    """Целые в системе с основанием 2**k: цифры хранятся упакованными битами"""
+
+    __slots__ = ()
+
+    _BITS: int
+
+    def _pack(self, raw: bytes) -> bytes:
+        """Биты упаковываются по восемь в байт (big-endian)"""
+        value = convert.to_int(raw, self.BASE)
+        return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+    def _unpack(self, data: bytes) -> bytes:
+        return convert.from_ascii(self._digit_string(data))
+
+    def _unpack_int(self, data: bytes) -> int:
+        return int.from_bytes(data, "big")
+
+    def _pack_int(self, value: int) -> Tuple[bytes, int]:
+        ndigits = -(-value.bit_length() // self._BITS) or 1
+        return value.to_bytes((value.bit_length() + 7) // 8, "big"), ndigits
 
-    def _validate_bits(self) -> None:
-        """Проверка корректности битов (0 или 1)"""
-        for bit in self.digits:
-            if bit not in (0, 1):
-                raise ValueError("Биты должны быть 0 или 1")
+    @classmethod
+    def _from_chunks(cls: Type[P], chunks: Iterable[bytes]) -> P:
+        """Каждая порция сразу переводится в int, части склеиваются сдвигами"""
+        pieces: List[Tuple[int, int]] = []
+        for chunk in chunks:
+            text = chunk.translate(None, _WHITESPACE)
+            if not convert.digits_valid(convert.from_ascii(text), cls.BASE):
+                raise ValueError(cls._DIGITS_ERROR)
+            if text:
+                try:
+                    pieces.append((int(text, cls.BASE), len(text)))
+                except ValueError:
+                    raise ValueError(cls._DIGITS_ERROR) from None
+        if not pieces:
+            raise ValueError("Поток не содержит цифр")
+        value, ndigits = _join_pieces(pieces, 0, len(pieces), cls._BITS)
+        obj = cls.__new__(cls)
+        obj._value = value
+        obj._data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+        obj._ndigits = ndigits
+        return obj
+
+    def _compare(self, other: Integer) -> int:
+        # Упакованные биты переводятся в int за линейное время
+        return Integer._compare(self, other)
+
+    def _digit_string(self, data: bytes) -> bytes:
+        """Цифры в виде ASCII-строки с сохранением ведущих нулей"""
+        if not self._ndigits:
+            return b""
+        value = self._unpack_int(data)
+        return convert.to_ascii(convert.from_int(value, self.BASE)).rjust(
+            self._ndigits, b"0"
+        )
 
-    def _to_int(self) -> int:
-        """Преобразование массива битов в целое число"""
-        return int("".join(map(str, self.digits)), 2)
+    def __str__(self) -> str:
+        return self._digit_string(self._storage()).decode()
 
-    @classmethod
-    def _from_int(cls, num: int) -> "Binary":
-        """Создание объекта из целого числа"""
-        if num == 0:
-            return cls([0])
-        bits: List[int] = []
-        n = abs(num)
-        while n > 0:
-            bits.insert(0, n % 2)
-            n //= 2
-        return cls(bits)
+
+def _join_pieces(
+    pieces: List[Tuple[int, int]], lo: int, hi: int, bits: int
+) -> Tuple[int, int]:
+    """Склейка частей (значение, число цифр) сбалансированным деревом сдвигов"""
+    if hi - lo == 1:
+        return pieces[lo]
+    mid = (lo + hi) >> 1
+    high, high_digits = _join_pieces(pieces, lo, mid, bits)
+    low, low_digits = _join_pieces(pieces, mid, hi, bits)
+    return high << (low_digits * bits) | low, high_digits + low_digits
+
+
+class Decimal(RadixInteger):
+    """Класс для десятичных чисел"""
+
+    __slots__ = ()
+
+    BASE = 10
+    _KIND = "десятичные"
+    _DIGITS_ERROR = "Цифры должны быть в диапазоне 0-9"
 
     def __str__(self) -> str:
-        """Строковое представление в виде двоичного числа"""
-        return "".join(map(str, self.digits))
+        """Строковое представление в виде десятичного числа"""
+        return convert.to_ascii(self._storage()).lstrip(b"0").decode() or "0"
 
-    def __repr__(self) -> str:
-        """Формальное представление в виде массива битов"""
-        return f"Binary({self.digits})"
-
-    def add(self, other: "Binary") -> "Binary":
-        """Сложение двоичных чисел"""
-        if not isinstance(other, Binary):
-            raise TypeError("Можно складывать только двоичные числа")
-        result = self._to_int() + other._to_int()
-        return Binary._from_int(result)
-
-    def subtract(self, other: "Binary") -> "Binary":
-        """Вычитание двоичных чисел"""
-        if not isinstance(other, Binary):
-            raise TypeError("Можно вычитать только двоичные числа")
-        result = self._to_int() - other._to_int()
-        return Binary._from_int(result)
-
-    def multiply(self, other: "Binary") -> "Binary":
-        """Умножение двоичных чисел"""
-        if not isinstance(other, Binary):
-            raise TypeError("Можно умножать только двоичные числа")
-        result = self._to_int() * other._to_int()
-        return Binary._from_int(result)
-
-    def divide(self, other: "Binary") -> "Binary":
-        """Деление двоичных чисел"""
-        if not isinstance(other, Binary):
-            raise TypeError("Можно делить только двоичные числа")
-        if other._to_int() == 0:
-            raise ValueError("Деление на ноль")
-        result = self._to_int() // other._to_int()
-        return Binary._from_int(result)
+
+class Binary(PackedRadixInteger):
+    """Класс для двоичных чисел"""
+
+    __slots__ = ()
+
+    BASE = 2
+    _BITS = 1
+    _KIND = "двоичные"
+    _DIGITS_ERROR = "Биты должны быть 0 или 1"
+
+
+_RADIX_NAMES = {8: ("Octal", "восьмеричные"), 16: ("Hexadecimal", "шестнадцатеричные")}
+_radix_classes: Dict[int, Type[RadixInteger]] = {10: Decimal, 2: Binary}
+
+
+def Radix(base: int) -> Type[RadixInteger]:
+    """Класс целых чисел в системе счисления с основанием base (2-36)
+
+    Классы кэшируются: Radix(10) is Decimal, Radix(2) is Binary.
+    """
+    cls = _radix_classes.get(base)
+    if cls is not None:
+        return cls
+    if not 2 <= base <= convert.MAX_BASE:
+        raise ValueError(f"Основание должно быть в диапазоне 2-{convert.MAX_BASE}")
+    name, kind = _RADIX_NAMES.get(base, (f"Radix{base}", f"{base}-ричные"))
+    namespace: Dict[str, object] = {
+        "__slots__": (),
+        "__doc__": f"Класс для чисел в системе счисления с основанием {base}",
+        "__module__": __name__,
+        "BASE": base,
+        "_KIND": kind,
+        "_DIGITS_ERROR": f"Цифры должны быть в диапазоне 0-{base - 1}",
+    }
+    parent: Type[RadixInteger] = RadixInteger
+    if convert.is_power_of_two(base):
+        parent = PackedRadixInteger
+        namespace["_BITS"] = base.bit_length() - 1
+    cls = _radix_classes[base] = type(name, (parent,), namespace)
+    return cls
+
+
+def _restore(
+    cls: Union[int, Type[R]], payload: Union[int, bytes], ndigits: int = 0
+) -> R:
+    """Восстановление числа, сериализованного RadixInteger.__reduce__"""
+    target = Radix(cls) if isinstance(cls, int) else cls
+    obj = cast(R, target.__new__(target))
+    if isinstance(payload, int):
+        obj._data, obj._ndigits, obj._value = None, 0, payload
+    else:
+        obj._data, obj._ndigits, obj._value = payload, ndigits, None
+    return obj
 
 
 class Reader:
@@ -186,7 +606,7 @@ class Reader:
         try:
             num_str = input("Введите десятичное число: ")
             num = int(num_str)
-            return Decimal._from_int(num)
+            return Decimal.from_int(num)
         except ValueError:
             raise ValueError("Некорректный ввод десятичного числа")
 
@@ -195,9 +615,7 @@ class Reader:
         """Чтение двоичного числа с клавиатуры"""
         try:
             bin_str = input("Введите двоичное число: ")
-            if not all(bit in "01" for bit in bin_str):
-                raise ValueError()
-            return Binary([int(bit) for bit in bin_str])
+            return Binary(convert.from_ascii(bin_str))
         except ValueError:
             raise ValueError("Некорректный ввод двоичного числа")
 
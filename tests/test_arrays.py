@@ -0,0 +1,95 @@
+import math
+
+import pytest
+
+from task_package import arrays
+from task_package.arrays import NumberArray, RealArray
+from task_package.zad1 import Number, Real
+
+
+class TestNumberArray:
+    def test_init_from_mixed_values(self):
+        arr = NumberArray([1, 2.5, Number(4.0)])
+        assert arr.tolist() == [1.0, 2.5, 4.0]
+        assert len(arr) == 3
+
+    def test_add_scalar_broadcast(self):
+        arr = NumberArray([1.0, 2.0, 3.0])
+        assert arr.add(2).tolist() == [3.0, 4.0, 5.0]
+        assert arr.add(Number(0.5)).tolist() == [1.5, 2.5, 3.5]
+
+    def test_add_elementwise(self):
+        result = NumberArray([1.0, 2.0]).add(NumberArray([10.0, 20.0]))
+        assert result.tolist() == [11.0, 22.0]
+
+    def test_size_mismatch(self):
+        with pytest.raises(ValueError, match="Размеры массивов не совпадают"):
+            NumberArray([1.0, 2.0]).add(NumberArray([1.0]))
+
+    def test_divide(self):
+        result = NumberArray([10.0, 9.0]).divide(NumberArray([2.0, 3.0]))
+        assert result.tolist() == [5.0, 3.0]
+
+    def test_divide_by_zero_scalar(self):
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            NumberArray([1.0]).divide(0)
+
+    def test_divide_by_zero_element(self):
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            NumberArray([1.0, 2.0]).divide(NumberArray([1.0, 0.0]))
+
+    def test_items_are_numbers(self):
+        arr = NumberArray([1.5])
+        assert isinstance(arr[0], Number)
+        assert [item._value for item in arr] == [1.5]
+        assert repr(arr) == "NumberArray([1.5])"
+
+
+class TestRealArray:
+    def test_power_matches_real(self):
+        values = [8.0, 4.0, 2.0]
+        result = RealArray(values).power(Real(2.0))
+        assert result.tolist() == [Real(v).power(2.0)._value for v in values]
+        assert isinstance(result, RealArray)
+        assert isinstance(result[0], Real)
+
+    def test_power_elementwise(self):
+        result = RealArray([2.0, 3.0]).power(RealArray([3.0, 2.0]))
+        assert result.tolist() == [8.0, 9.0]
+
+    def test_logarithm_natural(self):
+        result = RealArray([1.0, math.e])
+        assert result.logarithm().tolist() == pytest.approx([0.0, 1.0])
+
+    def test_logarithm_with_base(self):
+        result = RealArray([8.0, 100.0]).logarithm(RealArray([2.0, 10.0]))
+        assert result.tolist() == pytest.approx([3.0, 2.0])
+
+    def test_logarithm_non_positive(self):
+        with pytest.raises(
+            ValueError, match="Логарифм определен только для положительных чисел"
+        ):
+            RealArray([1.0, 0.0]).logarithm()
+
+    @pytest.mark.parametrize("backend", ["default", "array"])
+    def test_logarithm_non_positive_after_nan(self, backend, monkeypatch):
+        if backend == "array":
+            monkeypatch.setattr(arrays, "np", None)
+        values = RealArray([math.nan, -1.0])
+        with pytest.raises(
+            ValueError, match="Логарифм определен только для положительных чисел"
+        ):
+            values.logarithm()
+        with pytest.raises(ValueError, match="Некорректные значения для логарифма"):
+            values.logarithm(2)
+        with pytest.raises(ValueError, match="Некорректные значения для логарифма"):
+            RealArray([2.0, 3.0]).logarithm(RealArray([math.nan, -2.0]))
+
+    def test_logarithm_invalid_base(self):
+        with pytest.raises(ValueError, match="Некорректные значения для логарифма"):
+            RealArray([2.0, 3.0]).logarithm(1)
+        with pytest.raises(ValueError, match="Некорректные значения для логарифма"):
+            RealArray([2.0, 3.0]).logarithm(RealArray([2.0, -2.0]))
+
+    def test_empty(self):
+        assert RealArray().logarithm().tolist() == []
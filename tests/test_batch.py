@@ -0,0 +1,88 @@
+import pytest
+
+from task_package.batch import BinaryBatch, DecimalBatch
+from task_package.zad2 import Binary, Decimal
+
+
+class TestDecimalBatch:
+    def test_init_and_to_ints(self):
+        batch = DecimalBatch([[1, 2, 3], [4, 5], [0]])
+        assert len(batch) == 3
+        assert batch.to_ints() == [123, 45, 0]
+
+    def test_validation_once_per_batch(self):
+        with pytest.raises(ValueError, match="Цифры должны быть в диапазоне 0-9"):
+            DecimalBatch([[1, 2], [3, 10]])
+
+    def test_item_validation_matches_decimal(self):
+        with pytest.raises(TypeError):
+            DecimalBatch([5, 3])  # type: ignore[list-item]
+        with pytest.raises(TypeError):
+            DecimalBatch(["12"])  # type: ignore[list-item]
+        with pytest.raises(ValueError):
+            DecimalBatch([[1], []])
+        with pytest.raises(ValueError, match="Цифры должны быть в диапазоне 0-9"):
+            DecimalBatch([[300]])
+        with pytest.raises(ValueError, match="Биты должны быть 0 или 1"):
+            BinaryBatch([[1, -1]])
+
+    def test_arithmetic(self):
+        a = DecimalBatch([[1, 2, 3], [5, 0]])
+        b = DecimalBatch([[4, 5], [2, 5]])
+        assert a.add(b).to_ints() == [168, 75]
+        assert a.subtract(b).to_ints() == [78, 25]
+        assert b.subtract(a).to_ints() == [78, 25]
+        assert a.multiply(b).to_ints() == [5535, 1250]
+        assert a.divide(b).to_ints() == [2, 2]
+
+    def test_matches_scalar_operations(self):
+        values = [(123, 45), (10**50, 7), (0, 3)]
+        a = DecimalBatch.from_ints([x for x, _ in values])
+        b = DecimalBatch.from_ints([y for _, y in values])
+        for result, (x, y) in zip(a.multiply(b), values):
+            assert (
+                result.to_int()
+                == Decimal.from_int(x).multiply(Decimal.from_int(y)).to_int()
+            )
+
+    def test_divide_by_zero(self):
+        with pytest.raises(ValueError, match="Деление на ноль"):
+            DecimalBatch([[1], [2]]).divide(DecimalBatch([[1], [0]]))
+
+    def test_size_mismatch(self):
+        with pytest.raises(ValueError, match="Размеры пакетов не совпадают"):
+            DecimalBatch([[1]]).add(DecimalBatch([[1], [2]]))
+
+    def test_type_mismatch(self):
+        with pytest.raises(TypeError):
+            DecimalBatch([[1]]).add(BinaryBatch([[1]]))
+
+    def test_getitem_keeps_digits(self):
+        batch = DecimalBatch([[0, 7], [4, 2]])
+        assert batch[0].digits == [0, 7]
+        assert batch[-1].digits == [4, 2]
+        assert isinstance(batch[1], Decimal)
+
+    def test_lazy_buffer_from_results(self):
+        result = DecimalBatch.from_ints([12, 3]).add(DecimalBatch.from_ints([1, 1]))
+        assert repr(result) == "DecimalBatch([[1, 3], [4]])"
+
+    def test_from_items(self):
+        batch = DecimalBatch.from_items([Decimal([1, 2]), Decimal([3])])
+        assert batch.to_ints() == [12, 3]
+        with pytest.raises(TypeError):
+            DecimalBatch.from_items([Binary([1])])
+
+
+class TestBinaryBatch:
+    def test_arithmetic(self):
+        a = BinaryBatch([[1, 0, 1, 0], [1, 0, 1]])
+        b = BinaryBatch([[1, 1, 0], [1, 0]])
+        assert a.add(b).to_ints() == [16, 7]
+        assert a.multiply(b).to_ints() == [60, 10]
+        assert a.divide(b)[0].digits == [1]
+        assert a.subtract(b)[1].digits == [1, 1]
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="Биты должны быть 0 или 1"):
+            BinaryBatch([[1, 2]])
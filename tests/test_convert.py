@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from task_package import convert
+from task_package.zad2 import Binary, Decimal
+
+
+class TestConvert:
+    @pytest.mark.parametrize("base", [2, 3, 8, 10, 16, 32, 36])
+    def test_roundtrip(self, base):
+        rng = random.Random(base)
+        for bits in (1, 64, 5000, 40000):
+            num = rng.getrandbits(bits)
+            assert convert.to_int(convert.from_int(num, base), base) == num
+
+    def test_from_int_decimal_matches_str(self):
+        num = 7**4000
+        digits = convert.from_int(num, 10)
+        assert convert.to_ascii(digits).lstrip(b"0").decode() == str(num)
+        assert digits[0] != 0
+
+    def test_from_int_zero_and_negative(self):
+        assert convert.from_int(0, 10) == b"\x00"
+        assert convert.from_int(-5, 2) == bytes([1, 0, 1])
+
+    def test_to_int_leading_zeros(self):
+        assert convert.to_int([0, 0, 4, 2], 10) == 42
+        assert convert.to_int([], 10) == 0
+
+    def test_beyond_str_digits_limit(self):
+        """Длина больше sys.get_int_max_str_digits() не вызывает ошибку"""
+        digits = [9] * 10000
+        assert convert.to_int(digits, 10) == 10**10000 - 1
+
+    @pytest.mark.parametrize("base", [2, 3, 8, 10, 36])
+    def test_digit_count(self, base):
+        rng = random.Random(base)
+        values = [0, 1, base - 1, base]
+        for k in (2, 50, 1000):
+            values += [base**k - 1, base**k, base**k + 1]
+        values += [rng.getrandbits(rng.randrange(1, 5000)) for _ in range(50)]
+        for value in values:
+            assert convert.digit_count(value, base) == len(
+                convert.from_int(value, base)
+            )
+            assert convert.digit_count(-value, base) == convert.digit_count(value, base)
+
+    def test_invalid_base(self):
+        with pytest.raises(ValueError, match="Основание"):
+            convert.from_int(10, 1)
+
+
+class TestPublicConversionApi:
+    def test_decimal_from_int_to_int(self):
+        num = 3**50000
+        dec = Decimal.from_int(num)
+        assert dec.to_int() == num
+        assert str(dec) == convert.to_ascii(convert.from_int(num)).decode()
+
+    def test_binary_from_int_to_int(self):
+        num = 5**30000
+        bin_obj = Binary.from_int(num)
+        assert bin_obj.to_int() == num
+        assert str(bin_obj) == format(num, "b")
+
+    def test_decimal_str_strips_leading_zeros(self):
+        assert str(Decimal([0, 0, 1, 2])) == "12"
+        assert str(Decimal([0, 0])) == "0"
+
+    def test_large_multiply(self):
+        a = Decimal([9] * 6000)
+        b = Decimal([7] * 5000)
+        assert a.multiply(b).to_int() == (10**6000 - 1) * (7 * (10**5000 - 1) // 9)
+
+
+class TestParallelConversion:
+    @pytest.fixture
+    def parallel(self, monkeypatch):
+        monkeypatch.setattr(convert, "PARALLEL_THRESHOLD", 2000)
+        monkeypatch.setattr(convert, "PARALLEL_WORKERS", 2)
+
+    @pytest.mark.parametrize("base", [3, 10, 36])
+    def test_matches_serial(self, base, parallel):
+        num = random.Random(base).getrandbits(60000)
+        digits = convert.from_int(num, base)
+        assert convert.to_int(digits, base) == num
+        convert.PARALLEL_THRESHOLD = None
+        assert convert.from_int(num, base) == digits
+
+    def test_leading_zeros_kept_inside_pieces(self, parallel):
+        num = 10**30000 + 1
+        assert convert.from_int(num) == b"\x01" + b"\x00" * 29999 + b"\x01"
+
+    def test_serial_inside_worker_process(self, parallel):
+        from concurrent.futures import ProcessPoolExecutor
+
+        assert convert._parallel_workers(10**9) == 2
+        with ProcessPoolExecutor(1) as pool:
+            assert pool.submit(convert._parallel_workers, 10**9).result() == 1
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(convert, "PARALLEL_THRESHOLD", None)
+        assert convert._parallel_workers(10**9) == 1
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from task_package import division
+from task_package.zad2 import Binary, Decimal
+
+
+class TestDivmodInt:
+    def test_small_values(self):
+        assert division.divmod_int(17, 5) == (3, 2)
+        assert division.divmod_int(0, 7) == (0, 0)
+
+    def test_burnikel_ziegler_matches_builtin(self, monkeypatch):
+        monkeypatch.setattr(division, "DIV_THRESHOLD", 64)
+        monkeypatch.setattr(division, "_DIV_LIMIT", 32)
+        rng = random.Random(5)
+        for _ in range(100):
+            a = rng.getrandbits(rng.randrange(1, 6000))
+            b = rng.getrandbits(rng.randrange(1, 3000)) or 1
+            assert division.divmod_int(a, b) == divmod(a, b)
+
+    def test_large_default_thresholds(self):
+        rng = random.Random(6)
+        a = rng.getrandbits(200_000)
+        b = rng.getrandbits(60_000) | 1
+        assert division.divmod_int(a, b) == divmod(a, b)
+
+
+class TestIntegerDivmod:
+    def test_decimal_divmod(self):
+        q, r = Decimal([1, 2, 3]).divmod(Decimal([4, 5]))
+        assert q.digits == [2]
+        assert r.digits == [3, 3]
+
+    def test_decimal_mod(self):
+        assert Decimal([1, 0, 0]).mod(Decimal([7])).to_int() == 2
+
+    def test_builtin_divmod(self):
+        q, r = divmod(Binary([1, 0, 1, 0]), Binary([1, 1]))
+        assert q.digits == [1, 1]
+        assert r.digits == [1]
+
+    def test_divmod_by_zero(self):
+        with pytest.raises(ValueError, match="Деление на ноль"):
+            Binary([1]).mod(Binary([0]))
+
+    def test_divmod_type_error(self):
+        with pytest.raises(TypeError, match="Можно делить только десятичные числа"):
+            Decimal([1]).divmod(Binary([1]))
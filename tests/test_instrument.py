@@ -0,0 +1,88 @@
+import pytest
+
+from task_package import instrument
+from task_package.zad1 import Number, Real
+from task_package.zad2 import Binary, Decimal, Radix, RadixInteger
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    yield
+    instrument.disable()
+    instrument.recorder.reset()
+
+
+class TestInstrument:
+    def test_no_wrappers_when_disabled(self):
+        original = RadixInteger.__dict__["add"]
+        with instrument.collect():
+            assert RadixInteger.__dict__["add"] is not original
+        assert RadixInteger.__dict__["add"] is original
+        assert isinstance(
+            Decimal.__dict__.get("from_int", classmethod(len)), classmethod
+        )
+        assert not instrument.is_enabled()
+
+    def test_counts_by_receiver_class(self):
+        with instrument.collect() as recorder:
+            Decimal([1, 2, 3]).add(Decimal([4, 5]))
+            Binary([1, 0]).multiply(Binary([1, 1]))
+            Radix(8)([7]).add(Radix(8)([1]))
+            Number(1.0).divide(2)
+            Real(8.0).logarithm(2)
+        stats = recorder.snapshot()
+        assert stats["Decimal.add"]["calls"] == 1
+        assert stats["Decimal._validate"]["calls"] == 2
+        assert stats["Binary.multiply"]["calls"] == 1
+        assert stats["Octal.add"]["calls"] == 1
+        assert stats["Number.divide"]["calls"] == 1
+        assert stats["Real.logarithm"]["calls"] == 1
+        assert stats["Decimal.add"]["seconds"] >= 0
+
+    def test_operand_size_histogram(self):
+        with instrument.collect() as recorder:
+            Decimal.from_int(10**50).add(Decimal([1]))
+        sizes = recorder.snapshot()["Decimal.add"]["sizes"]
+        assert sizes["100"] == 1
+        assert sum(sizes.values()) == 1
+
+    @pytest.mark.parametrize("cls", [Decimal, Binary, Radix(3)])
+    def test_operand_size_same_for_equal_values(self, cls):
+        """Размер не зависит от того, построены ли цифры"""
+        for k in (100, 101, 1000):
+            for value in (cls.BASE**k - 1, cls.BASE**k):
+                lazy = cls.from_int(value)
+                built = cls(list(cls.from_int(value).digits))
+                size = instrument.operand_size((lazy,))
+                assert size == instrument.operand_size((built,))
+                assert size == len(built.digits)
+
+    def test_nested_collect_keeps_wrappers(self):
+        with instrument.collect():
+            with instrument.collect():
+                Decimal([1]).add(Decimal([2]))
+            assert instrument.is_enabled()
+            Decimal([1]).add(Decimal([2]))
+        assert instrument.recorder.snapshot()["Decimal.add"]["calls"] == 2
+
+    def test_prometheus(self, tmp_path):
+        with instrument.collect() as recorder:
+            Decimal([1, 2]).multiply(Decimal([3]))
+        path = tmp_path / "metrics.prom"
+        recorder.write_prometheus(str(path))
+        text = path.read_text(encoding="utf-8")
+        assert "# TYPE task_package_calls_total counter" in text
+        assert 'task_package_calls_total{method="Decimal.multiply"} 1' in text
+        assert (
+            'task_package_operand_digits_bucket{method="Decimal.multiply",le="+Inf"} 1'
+            in text
+        )
+        assert 'task_package_operand_digits_count{method="Decimal.multiply"} 1' in text
+
+    def test_results_unchanged(self):
+        with instrument.collect():
+            assert Decimal([1, 2, 3]).divmod(Decimal([4, 5])) == (
+                Decimal([2]),
+                Decimal([3, 3]),
+            )
+            assert str(Binary.from_int(5)) == "101"
@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+from task_package.arrays import RealArray
+from task_package.lazy import const, var
+from task_package.zad1 import Real
+
+
+class TestGraph:
+    def test_hash_consing(self):
+        x = var("x")
+        assert x.add(1) is x.add(1)
+        assert const(0.0) is not const(-0.0)
+
+    def test_common_subexpressions_evaluated_once(self):
+        x = var("x")
+        shared = x.add(1).power(2)
+        expr = shared.divide(shared.add(3))
+        # x, 1, x+1, 2, (x+1)**2, 3, сумма, частное; без слияния было бы 12
+        assert len(expr.nodes()) == 8
+
+    def test_operators(self):
+        x = var("x")
+        assert (x + 1) is x.add(1)
+        assert (2 / x) is const(2).divide(x)
+        assert (x**3) is x.power(3)
+
+
+class TestEvaluate:
+    def test_matches_eager_chain(self):
+        x, y = var("x"), var("y")
+        expr = x.add(5).power(3).divide(y).logarithm(2)
+        expected = Real(
+            Real(Real(1.5).add(5)._value).power(3).divide(4)._value
+        ).logarithm(2)
+        result = expr.evaluate(x=1.5, y=Real(4.0))
+        assert isinstance(result, Real)
+        assert result._value == expected._value
+
+    def test_array_single_pass(self):
+        x = var("x")
+        expr = (x + 1).logarithm()
+        result = expr.evaluate(x=RealArray([0.0, math.e - 1]))
+        assert isinstance(result, RealArray)
+        assert result.tolist() == pytest.approx([0.0, 1.0])
+
+    def test_array_and_scalar_inputs(self):
+        x, y = var("x"), var("y")
+        assert (x / y).evaluate(x=RealArray([2.0, 4.0]), y=2).tolist() == [1.0, 2.0]
+        assert const(3).evaluate(x=RealArray([1.0, 2.0])).tolist() == [3.0, 3.0]
+
+    def test_errors(self):
+        x, y = var("x"), var("y")
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            (x / y).evaluate(x=1, y=0)
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            (x / y).evaluate(x=RealArray([1.0, 2.0]), y=RealArray([1.0, 0.0]))
+        with pytest.raises(
+            ValueError, match="Логарифм определен только для положительных чисел"
+        ):
+            x.logarithm().evaluate(x=RealArray([1.0, -1.0]))
+        with pytest.raises(ValueError, match="Некорректные значения для логарифма"):
+            x.logarithm(1).evaluate(x=2.0)
+        with pytest.raises(ValueError, match="Размеры массивов не совпадают"):
+            (x + y).evaluate(x=RealArray([1.0]), y=RealArray([1.0, 2.0]))
+        with pytest.raises(ValueError, match="y"):
+            (x + y).evaluate(x=1.0)
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from task_package import convert, limbs
+from task_package.zad2 import Decimal
+
+RADIX = 10**limbs.LIMB_DIGITS
+
+
+def limbs_value(poly):
+    return sum(coeff * RADIX**i for i, coeff in enumerate(poly))
+
+
+def random_limbs(rng, size):
+    return [rng.randrange(RADIX) for _ in range(size)]
+
+
+class TestLimbs:
+    def test_digits_roundtrip(self):
+        raw = convert.from_int(12345678901234567890)
+        poly = limbs.digits_to_limbs(raw)
+        assert poly == [234567890, 345678901, 12]
+        assert limbs.limbs_to_digits(poly) == raw
+
+    def test_limbs_to_digits_zero(self):
+        assert limbs.limbs_to_digits([]) == b"\x00"
+
+    @pytest.mark.parametrize(
+        "algorithm", [limbs.mul_schoolbook, limbs.mul_karatsuba, limbs.mul_toom3]
+    )
+    @pytest.mark.parametrize("sizes", [(3, 3), (10, 7), (31, 30), (64, 50)])
+    def test_algorithms_agree(self, algorithm, sizes):
+        rng = random.Random(sum(sizes))
+        a, b = random_limbs(rng, sizes[0]), random_limbs(rng, sizes[1])
+        assert limbs_value(algorithm(a, b)) == limbs_value(a) * limbs_value(b)
+
+    def test_default_thresholds_select_every_algorithm(self, monkeypatch):
+        assert limbs.KARATSUBA_THRESHOLD <= limbs.TOOM3_THRESHOLD
+        calls = []
+        for name in ("mul_karatsuba", "mul_toom3"):
+            original = getattr(limbs, name)
+            monkeypatch.setattr(
+                limbs, name, lambda a, b, f=original, n=name: calls.append(n) or f(a, b)
+            )
+        size = limbs.KARATSUBA_THRESHOLD
+        limbs.mul_poly([1] * size, [1] * size)
+        size = limbs.TOOM3_THRESHOLD
+        limbs.mul_poly([1] * size, [1] * size)
+        assert calls[0] == "mul_karatsuba"
+        assert "mul_toom3" in calls
+
+    def test_multiply_with_low_thresholds(self, monkeypatch):
+        monkeypatch.setattr(limbs, "KARATSUBA_THRESHOLD", 4)
+        monkeypatch.setattr(limbs, "TOOM3_THRESHOLD", 9)
+        rng = random.Random(7)
+        for n, m in [(40, 40), (100, 13), (57, 80)]:
+            a, b = random_limbs(rng, n), random_limbs(rng, m)
+            assert limbs_value(limbs.multiply(a, b, RADIX)) == limbs_value(
+                a
+            ) * limbs_value(b)
+
+    def test_multiply_digits(self):
+        x, y = 3**5000, 7**4000
+        assert limbs.multiply_digits(
+            convert.from_int(x), convert.from_int(y)
+        ) == convert.from_int(x * y)
+
+    def test_decimal_multiply_uses_limbs(self, monkeypatch):
+        monkeypatch.setattr(limbs, "DIGITS_THRESHOLD", 1)
+        a = Decimal([0, 9, 9, 9])
+        b = Decimal([1, 2])
+        result = a.multiply(b)
+        assert result._value is None
+        assert result.digits == [1, 1, 9, 8, 8]
+        assert result.to_int() == 999 * 12
+
+    def test_limb_path_is_opt_in(self, monkeypatch):
+        assert limbs.DIGITS_THRESHOLD is None
+        monkeypatch.setattr(limbs, "multiply_digits", None)
+        a = Decimal._from_raw(convert.from_int(3**3000))
+        assert a.multiply(a).to_int() == 3**6000
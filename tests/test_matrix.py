@@ -0,0 +1,100 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from task_package.matrix import RationalMatrix
+from task_package.rational import Rational
+
+
+def random_rows(n, seed):
+    rng = random.Random(seed)
+    return [
+        [Rational(rng.randint(-9, 9), rng.randint(1, 5)) for _ in range(n)]
+        for _ in range(n)
+    ]
+
+
+def to_fractions(rows):
+    return [[Fraction(x.numerator, x.denominator) for x in row] for row in rows]
+
+
+def fraction_det(rows):
+    m = [list(row) for row in rows]
+    n = len(m)
+    det = Fraction(1)
+    for k in range(n):
+        pivot = next((i for i in range(k, n) if m[i][k]), None)
+        if pivot is None:
+            return Fraction(0)
+        if pivot != k:
+            m[k], m[pivot] = m[pivot], m[k]
+            det = -det
+        det *= m[k][k]
+        for i in range(k + 1, n):
+            factor = m[i][k] / m[k][k]
+            m[i] = [a - factor * b for a, b in zip(m[i], m[k])]
+    return det
+
+
+class TestRationalMatrix:
+    def test_shared_row_denominator(self):
+        matrix = RationalMatrix([[Rational(1, 2), Rational(1, 3)], [1, 2]])
+        assert matrix._dens == [6, 1]
+        assert matrix._rows[0] == [3, 2]
+        assert matrix[0, 1] == Rational(1, 3)
+        assert matrix.shape == (2, 2)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_determinant(self, seed):
+        rows = random_rows(6, seed)
+        det = RationalMatrix(rows).determinant()
+        assert Fraction(det.numerator, det.denominator) == fraction_det(
+            to_fractions(rows)
+        )
+
+    def test_solve(self):
+        rows = random_rows(7, 42)
+        x = [Rational(k, k + 1) for k in range(7)]
+        rhs = [Rational.sum(a * b for a, b in zip(row, x)) for row in rows]
+        assert RationalMatrix(rows).solve(rhs) == x
+
+    def test_empty_matrix(self):
+        empty = RationalMatrix([])
+        assert empty.determinant() == 1
+        assert empty.inverse() == empty
+        assert empty.solve([]) == []
+
+    def test_solve_needs_pivoting(self):
+        matrix = RationalMatrix([[0, 1], [1, 0]])
+        assert matrix.solve([2, Rational(1, 3)]) == [Rational(1, 3), 2]
+        assert matrix.determinant() == -1
+
+    def test_inverse(self):
+        rows = random_rows(5, 7)
+        matrix = RationalMatrix(rows)
+        inverse = matrix.inverse().tolist()
+        product = [
+            [
+                Rational.sum(a * inverse[k][j] for k, a in enumerate(row))
+                for j in range(5)
+            ]
+            for row in rows
+        ]
+        assert RationalMatrix(product) == RationalMatrix.identity(5)
+
+    def test_singular(self):
+        matrix = RationalMatrix([[1, 2], [Rational(1, 2), 1]])
+        assert matrix.determinant() == 0
+        with pytest.raises(ValueError, match="Матрица вырождена"):
+            matrix.inverse()
+        with pytest.raises(ValueError, match="Матрица вырождена"):
+            matrix.solve([1, 1])
+
+    def test_shape_errors(self):
+        with pytest.raises(ValueError):
+            RationalMatrix([[1, 2], [3]])
+        with pytest.raises(ValueError, match="квадратной"):
+            RationalMatrix([[1, 2]]).determinant()
+        with pytest.raises(TypeError):
+            RationalMatrix([[0.5]])
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import task_package
+
+HEAVY = (
+    "task_package.arrays",
+    "task_package.batch",
+    "task_package.parallel",
+    "task_package.storage",
+    "numpy",
+    "mmap",
+)
+
+
+def _loaded_after(statement):
+    code = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    src = os.path.dirname(os.path.dirname(task_package.__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyPackage:
+    def test_public_names(self):
+        from task_package import arrays, batch, zad1, zad2
+
+        assert task_package.Binary is zad2.Binary
+        assert task_package.Real is zad1.Real
+        assert task_package.RealArray is arrays.RealArray
+        assert task_package.BinaryBatch is batch.BinaryBatch
+        assert set(task_package.__all__) <= set(dir(task_package))
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            task_package.Octal
+        with pytest.raises(ImportError):
+            exec("from task_package import missing_name", {})
+
+    def test_bare_import_loads_nothing(self):
+        loaded = _loaded_after("import task_package")
+        assert not {name for name in loaded if name.startswith("task_package.")}
+
+    def test_binary_import_skips_heavy_engines(self):
+        loaded = _loaded_after("from task_package import Binary")
+        assert "task_package.zad2" in loaded
+        assert not loaded & set(HEAVY)
+        assert "concurrent.futures" not in loaded
+        assert "task_package.zad1" not in loaded
@@ -0,0 +1,65 @@
+import operator
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from task_package import parallel
+from task_package.parallel import parallel_map
+from task_package.zad2 import Binary, Decimal, Radix
+
+
+class TestPickle:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            Decimal([0, 1, 2]),
+            Binary([1, 0, 1, 1]),
+            Radix(7)([6, 0]),
+            Radix(16).from_int(255),
+        ],
+    )
+    def test_roundtrip(self, obj):
+        restored = pickle.loads(pickle.dumps(obj))
+        assert type(restored) is type(obj)
+        assert restored.digits == obj.digits
+
+    def test_value_sent_without_digits(self):
+        obj = Decimal.from_int(7**4000)
+        assert len(pickle.dumps(obj)) < 4000
+        assert pickle.loads(pickle.dumps(obj)).to_int() == 7**4000
+
+    def test_digits_sent_without_value(self):
+        obj = pickle.loads(pickle.dumps(Decimal([1, 2, 3])))
+        assert obj._value is None
+        assert obj.to_int() == 123
+
+
+class TestParallelMap:
+    def test_serial_fallback(self):
+        result = parallel_map(Decimal.add, [Decimal([1])], [Decimal([2])], workers=1)
+        assert result == [Decimal([3])]
+
+    def test_order_with_pool(self):
+        lefts = [Decimal.from_int(i) for i in range(50)]
+        rights = [Decimal.from_int(10**i) for i in range(50)]
+        result = parallel_map(
+            Decimal.multiply, lefts, rights, workers=2, chunk_digits=100
+        )
+        assert [r.to_int() for r in result] == [i * 10**i for i in range(50)]
+
+    def test_shared_executor(self):
+        with ProcessPoolExecutor(2) as pool:
+            result = parallel_map(
+                operator.floordiv,
+                [Binary([1, 0, 1, 0])] * 3,
+                [Binary([1, 1])] * 3,
+                executor=pool,
+            )
+        assert result == [Binary([1, 1])] * 3
+
+    def test_chunks_respect_budget(self):
+        tasks = [(Decimal([1] * 10),)] * 7 + [(Decimal([1] * 100),)]
+        chunks = list(parallel._chunks(tasks, 30))
+        assert [len(c) for c in chunks] == [3, 3, 1, 1]
+        assert sum(chunks, []) == tasks
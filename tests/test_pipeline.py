@@ -0,0 +1,111 @@
+import io
+
+import pytest
+
+from task_package.pipeline import (
+    MAX_NESTING,
+    evaluate,
+    evaluate_file,
+    evaluate_lines,
+    tokenize,
+)
+from task_package.zad2 import Binary, Decimal
+
+
+class TestTokenize:
+    def test_tokens(self):
+        tokens = tokenize("0b1010 // (12+3)")
+        assert [t.text for t in tokens] == ["1010", "//", "(", "12", "+", "3", ")"]
+        assert tokens[0].base == 2
+        assert tokens[3].base == 10
+
+    def test_default_base(self):
+        assert tokenize("ff", base=16)[0].base == 16
+
+    def test_bad_symbol(self):
+        with pytest.raises(ValueError):
+            tokenize("1 ^ 2")
+
+    def test_bad_symbol_position(self):
+        with pytest.raises(ValueError, match="позиции 4: '\\^'"):
+            tokenize("1 + ^ 2")
+
+
+class TestEvaluate:
+    def test_decimal(self):
+        result = evaluate("123 * 45")
+        assert isinstance(result, Decimal)
+        assert str(result) == "5535"
+
+    def test_binary(self):
+        result = evaluate("1010 // 110", base=2)
+        assert isinstance(result, Binary)
+        assert result.to_int() == 1
+
+    def test_precedence(self):
+        assert evaluate("2 + 3 * 4").to_int() == 14
+        assert evaluate("(2 + 3) * 4").to_int() == 20
+        assert evaluate("100 // 7 % 4").to_int() == 14 % 4
+        assert evaluate("10 - 3 - 2").to_int() == 5
+
+    @pytest.mark.parametrize("line", ["", "1 +", "(1 + 2", "1 2", "0b1 + 1", "19 // 0"])
+    def test_errors(self, line):
+        with pytest.raises((TypeError, ValueError)):
+            evaluate(line)
+
+    def test_nesting_limit(self):
+        depth = MAX_NESTING
+        assert evaluate("(" * depth + "7" + ")" * depth).to_int() == 7
+        with pytest.raises(ValueError, match="вложенность"):
+            evaluate("(" * 2000 + "1" + ")" * 2000)
+
+
+class TestStream:
+    def test_order_and_errors(self):
+        lines = ["1 + 1\n", "\n", "5 // 0\n", "0x10 * 0x10\n"]
+        assert list(evaluate_lines(lines, chunk_size=3)) == [
+            "2",
+            "",
+            "error: Деление на ноль",
+            "100",
+        ]
+
+    def test_deep_nesting_does_not_abort_run(self):
+        lines = ["(" * 2000 + "1" + ")" * 2000, "2 + 2"]
+        results = list(evaluate_lines(lines))
+        assert results[0].startswith("error: ")
+        assert results[1] == "4"
+
+    def test_strict(self):
+        with pytest.raises(ValueError):
+            list(evaluate_lines(["1 // 0"], strict=True))
+
+    def test_lazy(self):
+        def source():
+            yield "1 + 1"
+            raise AssertionError("прочитано больше одной порции")
+
+        assert next(evaluate_lines(source(), chunk_size=1)) == "2"
+
+    def test_file(self):
+        source = io.StringIO("".join(f"{i} * {i}\n" for i in range(25)))
+        target = io.StringIO()
+        assert evaluate_file(source, target, chunk_size=4) == 25
+        assert target.getvalue().splitlines() == [str(i * i) for i in range(25)]
+
+    def test_file_with_non_ascii_line(self):
+        raw = "1 + 2\n3 * é\n4 * 5\n".encode()
+        source = io.TextIOWrapper(io.BytesIO(raw), encoding="ascii", errors="replace")
+        target = io.StringIO()
+        assert evaluate_file(source, target) == 3
+        lines = target.getvalue().splitlines()
+        assert lines[0] == "3"
+        assert lines[1].startswith("error: ")
+        assert lines[2] == "20"
+
+    def test_strict_keeps_earlier_results(self):
+        source = io.StringIO("1 + 2\n5 // 0\n4 * 5\n")
+        target = io.StringIO()
+        with pytest.raises(ValueError):
+            evaluate_file(source, target, strict=True)
+        assert target.getvalue() == "3\n"
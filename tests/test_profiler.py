@@ -0,0 +1,74 @@
+import signal
+import sys
+import time
+
+import pytest
+
+from task_package import profiler
+from task_package.zad2 import Decimal
+
+pytestmark = pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="нужен Unix")
+
+
+def _frame_of(func, *args):
+    """Кадр func в момент вызова (через sys.setprofile)"""
+    captured = []
+
+    def hook(frame, event, arg):
+        if event == "call" and frame.f_code is func.__code__ and not captured:
+            captured.append(profiler.frame_label(frame))
+
+    sys.setprofile(hook)
+    try:
+        func(*args)
+    finally:
+        sys.setprofile(None)
+    return captured[0]
+
+
+class TestProfiler:
+    def test_size_bucket(self):
+        assert profiler.size_bucket(1) == "digits<=1"
+        assert profiler.size_bucket(500) == "digits<=1000"
+        assert profiler.size_bucket(10**8) == "digits>10000000"
+
+    def test_frame_label_for_zad2_method(self):
+        a = Decimal.from_int(10**1500)
+        b = Decimal.from_int(7)
+        label = _frame_of(Decimal.multiply, a, b)
+        assert label == "Decimal.multiply[digits<=10000]"
+
+    def test_frame_label_for_other_code(self):
+        def helper():
+            return sys._getframe()
+
+        assert profiler.frame_label(helper()).startswith(f"{__name__}:")
+
+    def test_samples_and_collapsed_output(self, tmp_path):
+        a = Decimal.from_int(3**20000)
+        path = tmp_path / "out.folded"
+        with profiler.profile(str(path), interval=0.001) as prof:
+            deadline = time.monotonic() + 5
+            while not prof.samples and time.monotonic() < deadline:
+                a.multiply(a)._storage()
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines
+        for line in lines:
+            frames, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert frames
+        assert signal.getsignal(signal.SIGPROF) is not prof._sample
+
+    def test_stop_restores_handler(self):
+        previous = signal.getsignal(signal.SIGALRM)
+        prof = profiler.Profiler(mode="wall")
+        with prof:
+            assert signal.getsignal(signal.SIGALRM) == prof._sample
+        assert signal.getsignal(signal.SIGALRM) is previous
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            profiler.Profiler(mode="gpu")
+        with pytest.raises(ValueError):
+            profiler.Profiler(interval=0)
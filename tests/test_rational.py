@@ -0,0 +1,100 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+from task_package.rational import Rational, RationalAccumulator
+
+
+def as_fraction(value):
+    return Fraction(value.numerator, value.denominator)
+
+
+class TestRational:
+    def test_normalized(self):
+        r = Rational(6, -8)
+        assert (r.numerator, r.denominator) == (-3, 4)
+        assert str(r) == "-3/4"
+        assert Rational(0, -5).denominator == 1
+
+    def test_zero_denominator(self):
+        with pytest.raises(ValueError, match="Знаменатель не может быть равен нулю"):
+            Rational(1, 0)
+
+    def test_from_string(self):
+        assert Rational.from_string(" -10/4 ") == Rational(-5, 2)
+        assert Rational.from_string("7") == 7
+        with pytest.raises(ValueError):
+            Rational.from_string("1/x")
+
+    def test_matches_fraction(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            a = Rational(rng.randint(-50, 50), rng.randint(1, 60))
+            b = Rational(rng.randint(-50, 50), rng.randint(1, 60))
+            fa, fb = as_fraction(a), as_fraction(b)
+            assert as_fraction(a.add(b)) == fa + fb
+            assert as_fraction(a.sub(b)) == fa - fb
+            assert as_fraction(a.mul(b)) == fa * fb
+            if b:
+                assert as_fraction(a.div(b)) == fa / fb
+            assert a.less(b) == (fa < fb)
+            assert a.greater(b) == (fa > fb)
+            assert a.equals(b) == (fa == fb)
+
+    def test_zero_results_are_normalized(self):
+        half = Rational(1, 2)
+        assert (half - half).denominator == 1
+        assert (Rational(1, 6) - Rational(2, 12)).denominator == 1
+        assert (Rational(0, 1) * Rational(1, 3)).denominator == 1
+
+    def test_exact_comparison_of_large_values(self):
+        big = 10**400
+        left, right = Rational(big + 1, big), Rational(big, big - 1)
+        assert float(left) == float(right)
+        assert left < right
+        assert Rational(big, big + 1) < Rational(big + 1, big + 2)
+        assert not Rational(big, big + 1).greater(Rational(big + 1, big + 2))
+
+    def test_operators_and_ints(self):
+        r = Rational(1, 3)
+        assert r + 1 == Rational(4, 3)
+        assert 1 - r == Rational(2, 3)
+        assert 2 * r == Rational(2, 3)
+        assert 1 / r == 3
+        assert r / -2 == Rational(-1, 6)
+        assert hash(Rational(4, 2)) == hash(2)
+        assert float(r) == 1 / 3
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            r / 0
+        with pytest.raises(TypeError):
+            r.add(0.5)
+
+    def test_slots(self):
+        with pytest.raises(AttributeError):
+            Rational(1, 2).extra = 1
+
+
+class TestSum:
+    def test_harmonic(self):
+        expected = sum((Fraction(1, k) for k in range(1, 301)), Fraction(0))
+        assert (
+            as_fraction(Rational.sum(Rational(1, k) for k in range(1, 301))) == expected
+        )
+
+    def test_mixed_signs_and_ints(self):
+        values = [Rational(1, 2), -1, Rational(-3, 4), 2, Rational(1, 4)]
+        assert Rational.sum(values, start=Rational(1, 3)) == Rational(4, 3)
+        assert Rational.sum([]) == 0
+
+    def test_accumulator(self):
+        acc = RationalAccumulator()
+        for k in range(1, 11):
+            acc.add(Rational(1, k * (k + 1)))
+        assert len(acc) == 10
+        assert acc.result() == Rational(10, 11)
+        assert acc.result().denominator == 11
+
+    def test_rejects_other_types(self):
+        with pytest.raises(TypeError):
+            Rational.sum([0.5])
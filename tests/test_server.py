@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from task_package import server
+from task_package.server import ArithmeticServer, Client, handle, percentiles
+
+
+class TestHandle:
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("dec 123 * 45", "ok 5535"),
+            ("bin 1010 // 110", "ok 1"),
+            ("real 10.5 + 2.5", "ok 13.0"),
+            ("real 8 ** 2", "ok 64.0"),
+            ("real log 8 2", "ok 3.0"),
+        ],
+    )
+    def test_requests(self, line, expected):
+        assert handle(line) == expected
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "dec 1 // 0",
+            "hex 1",
+            "real 1 / 0",
+            "real log -1",
+            "bin 12",
+            "dec " + "(" * 2000 + "1" + ")" * 2000,
+        ],
+    )
+    def test_errors(self, line):
+        assert handle(line).startswith("error ")
+
+
+def test_percentiles():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentiles(samples) == {50: 50.0, 90: 90.0, 99: 99.0}
+    assert percentiles([]) == {50: 0.0, 90: 0.0, 99: 0.0}
+
+
+class TestServer:
+    def test_tcp_concurrent_clients(self):
+        async def scenario():
+            srv = ArithmeticServer(offload_size=server.OFFLOAD_SIZE)
+            host, port = await srv.start(port=0)
+            clients = [await Client.connect(host, port) for _ in range(5)]
+            replies = await asyncio.gather(
+                *(c.request(f"dec {i} * {i}") for i, c in enumerate(clients))
+            )
+            stats = await clients[0].request("stats")
+            for c in clients:
+                await c.close()
+            await srv.close()
+            return replies, stats
+
+        replies, stats = asyncio.run(scenario())
+        assert replies == [f"ok {i * i}" for i in range(5)]
+        assert stats.startswith("ok count=5 p50=")
+
+    def test_large_request_offloaded(self):
+        async def scenario():
+            srv = ArithmeticServer(workers=1, offload_size=100)
+            host, port = await srv.start(port=0)
+            client = await Client.connect(host, port)
+            reply = await client.request("dec " + "9" * 200 + " + 1")
+            offloaded = srv._pool is not None
+            await client.close()
+            await srv.close()
+            return reply, offloaded
+
+        reply, offloaded = asyncio.run(scenario())
+        assert reply == "ok 1" + "0" * 200
+        assert offloaded
+
+    def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "arith.sock")
+
+        async def scenario():
+            srv = ArithmeticServer()
+            await srv.start_unix(path)
+            client = await Client.connect_unix(path)
+            reply = await client.request("bin 1010 + 110")
+            await client.close()
+            await srv.close()
+            return reply
+
+        assert asyncio.run(scenario()) == "ok 10000"
@@ -0,0 +1,70 @@
+import pytest
+
+from task_package import storage
+from task_package.zad2 import Binary, Decimal, Radix, RadixInteger
+
+
+class TestMmapStorage:
+    def test_decimal_roundtrip(self, tmp_path):
+        path = tmp_path / "dec.tpki"
+        Decimal([0, 1, 2, 3]).save(path)
+        dec = Decimal.open_mmap(path)
+        assert isinstance(dec._data, memoryview)
+        assert dec.digits == [0, 1, 2, 3]
+        assert str(dec) == "123"
+        assert dec.to_int() == 123
+
+    def test_binary_roundtrip_keeps_leading_zeros(self, tmp_path):
+        path = tmp_path / "bin.tpki"
+        Binary([0, 0, 1, 0, 1, 1, 0, 1, 1, 1]).save(path)
+        bin_obj = Binary.open_mmap(path)
+        assert str(bin_obj) == "0010110111"
+        assert bin_obj.to_int() == 0b10110111
+
+    def test_lazy_value_is_saved(self, tmp_path):
+        path = tmp_path / "big.tpki"
+        Decimal.from_int(7**3000).save(path)
+        assert Decimal.open_mmap(path).to_int() == 7**3000
+
+    def test_class_from_header(self, tmp_path):
+        path = tmp_path / "hex.tpki"
+        Radix(16)([10, 11]).save(path)
+        number = RadixInteger.open_mmap(path)
+        assert type(number) is Radix(16)
+        assert str(number) == "ab"
+
+    def test_comparison_without_parsing(self, tmp_path):
+        Decimal([0, 0, 9, 9]).save(tmp_path / "a.tpki")
+        Decimal([1, 0, 0]).save(tmp_path / "b.tpki")
+        a = Decimal.open_mmap(tmp_path / "a.tpki")
+        b = Decimal.open_mmap(tmp_path / "b.tpki")
+        assert a < b
+        assert a == Decimal([9, 9])
+        assert a._value is None and b._value is None
+
+    def test_arithmetic(self, tmp_path):
+        path = tmp_path / "n.tpki"
+        Decimal([4, 2]).save(path)
+        number = Decimal.open_mmap(path)
+        assert (number + Decimal([8])).to_int() == 50
+        number += Decimal([1])
+        assert number.to_int() == 43
+
+    def test_base_mismatch(self, tmp_path):
+        path = tmp_path / "dec.tpki"
+        Decimal([1]).save(path)
+        with pytest.raises(ValueError, match="основанием 10"):
+            Binary.open_mmap(path)
+
+    def test_bad_magic(self, tmp_path):
+        path = tmp_path / "junk.tpki"
+        path.write_bytes(b"x" * storage.HEADER_SIZE)
+        with pytest.raises(ValueError, match="Неизвестный формат файла"):
+            Decimal.open_mmap(path)
+
+    def test_truncated(self, tmp_path):
+        path = tmp_path / "cut.tpki"
+        Decimal([1, 2, 3, 4]).save(path)
+        path.write_bytes(path.read_bytes()[:-2])
+        with pytest.raises(ValueError, match="Файл обрезан"):
+            Decimal.open_mmap(path)
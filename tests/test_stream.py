@@ -0,0 +1,73 @@
+import io
+import random
+import tracemalloc
+
+import pytest
+
+from task_package.zad2 import Binary, Decimal, Radix
+
+
+def digits_text(base, count, seed=0):
+    rng = random.Random(seed)
+    alphabet = "0123456789abcdefghijklmnopqrstuvwxyz"[:base]
+    return "".join(rng.choices(alphabet, k=count))
+
+
+class TestFromStream:
+    def test_decimal_from_file_object(self):
+        dec = Decimal.from_stream(io.BytesIO(b"0012345\n"), chunk_size=3)
+        assert dec.digits == [0, 0, 1, 2, 3, 4, 5]
+        assert dec.to_int() == 12345
+
+    def test_binary_from_path(self, tmp_path):
+        path = tmp_path / "number.txt"
+        path.write_bytes(b"0010 1101\n")
+        bin_obj = Binary.from_stream(path, chunk_size=2)
+        assert str(bin_obj) == "00101101"
+        assert bin_obj.to_int() == 45
+
+    @pytest.mark.parametrize("cls", [Decimal, Binary, Radix(16), Radix(7)])
+    def test_chunking_does_not_change_value(self, cls):
+        text = digits_text(cls.BASE, 4000, seed=cls.BASE)
+        expected = cls.from_stream(io.BytesIO(text.encode()), chunk_size=1 << 16)
+        for chunk_size in (1, 7, 64, 1000):
+            result = cls.from_stream(io.BytesIO(text.encode()), chunk_size=chunk_size)
+            assert result == expected
+            assert result.digits == expected.digits
+        assert expected.to_int() == int(text, cls.BASE)
+
+    def test_invalid_digit(self):
+        with pytest.raises(ValueError, match="Цифры должны быть в диапазоне 0-9"):
+            Decimal.from_stream(io.BytesIO(b"12a4"))
+        with pytest.raises(ValueError, match="Биты должны быть 0 или 1"):
+            Binary.from_stream(io.BytesIO(b"1012"), chunk_size=2)
+
+    @pytest.mark.parametrize("text", [b"1\x052", b"\x001", b"1_0", b"-10", b"1\xff"])
+    def test_bytes_outside_alphabet(self, text):
+        with pytest.raises(ValueError, match="Цифры должны быть в диапазоне 0-9"):
+            Decimal.from_stream(io.BytesIO(text))
+        with pytest.raises(ValueError, match="Биты должны быть 0 или 1"):
+            Binary.from_stream(io.BytesIO(text.replace(b"2", b"1")))
+
+    def test_empty_stream(self):
+        with pytest.raises(ValueError, match="Поток не содержит цифр"):
+            Decimal.from_stream(io.BytesIO(b"\n"))
+
+    def test_peak_memory_is_bounded(self, tmp_path):
+        """Пик памяти близок к размеру упакованных цифр, а не к тексту + int + списку"""
+        size = 2_000_000
+        path = tmp_path / "big.txt"
+        path.write_text(digits_text(2, size))
+        tracemalloc.start()
+        bin_obj = Binary.from_stream(path, chunk_size=1 << 16)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert bin_obj.to_int().bit_length() <= size
+        assert peak < size
+
+        path.write_text(digits_text(10, size))
+        tracemalloc.start()
+        Decimal.from_stream(path, chunk_size=1 << 16)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak < 2 * size
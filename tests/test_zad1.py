@@ -248,6 +248,122 @@ class TestReal:
         assert repr(real) == "Real(3.14)"
 
 
+class TestSlots:
+    def test_package_classes_have_no_dict(self):
+        from task_package.zad1 import Number as PackageNumber
+        from task_package.zad1 import Real as PackageReal
+
+        assert not hasattr(PackageNumber(1.0), "__dict__")
+        assert not hasattr(PackageReal(1.0), "__dict__")
+
+
+class TestOperators:
+    def test_number_operators(self):
+        from task_package.zad1 import Number as PackageNumber
+
+        num = PackageNumber(10.0)
+        assert (num + 2)._value == 12.0
+        assert (2 + num)._value == 12.0
+        assert (num / PackageNumber(4.0))._value == 2.5
+        assert (20 / num)._value == 2.0
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            num / 0
+
+    def test_inplace_keeps_identity(self):
+        from task_package.zad1 import Number as PackageNumber
+        from task_package.zad1 import Real as PackageReal
+
+        total = PackageNumber(0)
+        before = total
+        total += 1.5
+        total /= 3
+        assert total is before and total._value == 0.5
+        real = PackageReal(2.0)
+        before_real = real
+        real **= 3
+        assert real is before_real and real._value == 8.0
+        with pytest.raises(ValueError, match="Деление на ноль невозможно"):
+            total /= 0
+
+    def test_real_power_operator(self):
+        from task_package.zad1 import Real as PackageReal
+
+        assert (PackageReal(2.0) ** PackageReal(3.0))._value == 8.0
+        assert (2 ** PackageReal(3.0))._value == 8.0
+
+    def test_comparison_and_hash(self):
+        from task_package.zad1 import Number as PackageNumber
+        from task_package.zad1 import Real as PackageReal
+
+        values = [PackageNumber(3), PackageReal(1), PackageNumber(2)]
+        assert [v._value for v in sorted(values)] == [1.0, 2.0, 3.0]
+        assert PackageNumber(1) == PackageReal(1.0) == 1
+        assert len({PackageNumber(1), PackageReal(1.0), PackageNumber(2)}) == 2
+
+    def test_nan_comparisons_are_false(self):
+        from task_package.zad1 import Number as PackageNumber
+
+        nan = PackageNumber(float("nan"))
+        assert not nan < 1
+        assert not nan <= 1
+        assert not nan > 1
+        assert not nan >= 1
+        assert not nan == nan
+        assert PackageNumber(2) > 1 and PackageNumber(2) >= 2 and PackageNumber(1) <= 1
+
+
+class TestCache:
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        from task_package import zad1
+
+        zad1.enable_cache(maxsize=2)
+        yield zad1
+        zad1.disable_cache()
+
+    def test_hits_and_misses(self, cache):
+        real = cache.Real(2.0)
+        assert real.power(10)._value == 1024.0
+        assert real.power(10)._value == 1024.0
+        assert cache.cache_info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    def test_lru_eviction(self, cache):
+        real = cache.Real(3.0)
+        real.power(1)
+        real.power(2)
+        real.power(1)
+        real.power(3)  # вытесняет power(2)
+        real.power(2)
+        assert cache.cache_info()["misses"] == 4
+
+    def test_key_uses_float_bits(self, cache):
+        assert math.copysign(1.0, cache.Real(0.0).power(3.0)._value) == 1.0
+        assert math.copysign(1.0, cache.Real(-0.0).power(3.0)._value) == -1.0
+
+    def test_logarithm(self, cache):
+        real = cache.Real(8.0)
+        assert real.logarithm(2)._value == 3.0
+        assert real.logarithm(2)._value == 3.0
+        assert cache.cache_info()["hits"] == 1
+        with pytest.raises(ValueError, match="Некорректные значения для логарифма"):
+            real.logarithm(1)
+
+    def test_same_results_as_without_cache(self, cache):
+        cases = [(float(base**k), base) for base in (2, 3, 10) for k in range(31)]
+        cases += [(0.5, 2.0), (1e-300, 7.5), (123.456, 0.25), (2.0, 10.0)]
+        expected = [cache.Real(x).logarithm(base)._value for x, base in cases]
+        cache.disable_cache()
+        assert [cache.Real(x).logarithm(base)._value for x, base in cases] == expected
+        assert [cache.Real(x).power(0.37)._value for x, _ in cases] == [
+            x**0.37 for x, _ in cases
+        ]
+
+    def test_disabled_by_default(self, cache):
+        cache.disable_cache()
+        cache.Real(2.0).power(2)
+        assert cache.cache_info()["size"] == 0
+
+
 class TestIntegration:
     """Интеграционные тесты для взаимодействия классов"""
 
@@ -3,7 +3,7 @@ import sys
 
 import pytest
 
-from task_package.zad2 import Binary, Decimal, Integer
+from task_package.zad2 import Binary, Decimal, Integer, Radix, Reader
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))  # noqa: E402
 
@@ -153,6 +153,198 @@ class TestBinary:
             bin1.divide(bin2)
 
 
+class TestCachedValue:
+    def test_from_int_digits_are_lazy(self):
+        dec = Decimal.from_int(1234)
+        assert dec._data is None
+        assert dec.digits == [1, 2, 3, 4]
+
+    def test_to_int_is_cached(self):
+        bin_obj = Binary([1, 1, 0])
+        assert bin_obj._value is None
+        assert bin_obj.to_int() == 6
+        assert bin_obj._value == 6
+
+    def test_digits_assignment_invalidates_cache(self):
+        dec = Decimal([4, 2])
+        assert dec.to_int() == 42
+        dec.digits = [7]
+        assert dec.to_int() == 7
+
+    def test_chain_keeps_results_lazy(self):
+        acc = Decimal([1])
+        step = Decimal([3])
+        for _ in range(100):
+            acc = acc.multiply(step)
+        assert acc._data is None
+        assert acc.to_int() == 3**100
+
+
+class TestCompactStorage:
+    def test_decimal_stores_bytes(self):
+        dec = Decimal([1, 2, 3])
+        assert dec._data == bytes([1, 2, 3])
+
+    def test_binary_is_bit_packed(self):
+        bin_obj = Binary([1] * 16 + [0] * 4)
+        assert len(bin_obj._data) == 3
+        assert bin_obj.digits == [1] * 16 + [0] * 4
+
+    def test_binary_keeps_leading_zeros(self):
+        bin_obj = Binary([0, 0, 1, 1])
+        assert bin_obj.digits == [0, 0, 1, 1]
+        assert str(bin_obj) == "0011"
+
+    def test_digits_returns_copy(self):
+        dec = Decimal([4, 2])
+        dec.digits.append(7)
+        assert dec.digits == [4, 2]
+
+    def test_slots(self):
+        assert not hasattr(Decimal([1]), "__dict__")
+        assert not hasattr(Binary([1]), "__dict__")
+
+    def test_invalid_digit_type(self):
+        with pytest.raises(ValueError, match="Цифры должны быть в диапазоне 0-9"):
+            Decimal([-1])
+
+    def test_non_sequence_digits(self):
+        with pytest.raises(TypeError):
+            Decimal(5)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            Binary("101")  # type: ignore[arg-type]
+
+    def test_empty_digits(self):
+        with pytest.raises(ValueError):
+            Decimal([])
+        with pytest.raises(ValueError):
+            Binary([])
+
+
+class TestValidation:
+    def test_large_valid_input(self):
+        digits = [d % 10 for d in range(100000)]
+        assert Decimal(digits).digits == digits
+
+    def test_invalid_digit_at_end(self):
+        with pytest.raises(ValueError, match="Биты должны быть 0 или 1"):
+            Binary([1, 0] * 1000 + [2])
+
+    def test_from_raw_skips_validation(self):
+        dec = Decimal._from_raw(bytes([4, 2]))
+        assert dec.to_int() == 42
+
+    def test_read_binary(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda prompt="": "1011")
+        assert Reader.read_binary().digits == [1, 0, 1, 1]
+
+    def test_read_binary_invalid(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda prompt="": "10a1")
+        with pytest.raises(ValueError, match="Некорректный ввод двоичного числа"):
+            Reader.read_binary()
+
+    def test_read_binary_control_bytes(self, monkeypatch):
+        monkeypatch.setattr("builtins.input", lambda prompt="": "\x00\x01")
+        with pytest.raises(ValueError, match="Некорректный ввод двоичного числа"):
+            Reader.read_binary()
+
+
+class TestOperators:
+    def test_binary_operators(self):
+        a, b = Decimal([1, 2, 3]), Decimal([4, 5])
+        assert (a + b).to_int() == 168
+        assert (a - b).to_int() == 78
+        assert (a * b).to_int() == 5535
+        assert (a // b).to_int() == 2
+        assert (a % b).to_int() == 33
+
+    def test_operator_type_error(self):
+        with pytest.raises(TypeError, match="Можно складывать только двоичные числа"):
+            Binary([1]) + Decimal([1])
+
+    def test_inplace_keeps_identity(self):
+        total = Binary([0])
+        before = total
+        for _ in range(5):
+            total += Binary([1, 1])
+        assert total is before
+        assert total.digits == [1, 1, 1, 1]
+
+    def test_inplace_does_not_touch_operand(self):
+        a, b = Decimal([9]), Decimal([4])
+        a *= b
+        a //= Decimal([5])
+        a %= Decimal([4])
+        a -= Decimal([9])
+        assert a.to_int() == 6
+        assert b.to_int() == 4
+
+    def test_inplace_divide_by_zero(self):
+        a = Decimal([1])
+        with pytest.raises(ValueError, match="Деление на ноль"):
+            a //= Decimal([0])
+
+    def test_equality_and_hash(self):
+        assert Decimal([0, 4, 2]) == Decimal([4, 2])
+        assert Decimal([1]) != Binary([1])
+        assert len({Decimal([1, 0]), Decimal([0, 1, 0]), Decimal([5])}) == 2
+
+    def test_ordering(self):
+        values = [Binary([1, 1]), Binary([1]), Binary([1, 0])]
+        assert [v.to_int() for v in sorted(values)] == [1, 2, 3]
+        assert Decimal([2]) < Decimal([1, 0]) <= Decimal([1, 0])
+        with pytest.raises(TypeError):
+            Decimal([1]) < Binary([1])
+
+
+class TestRadix:
+    def test_known_bases_reuse_classes(self):
+        assert Radix(10) is Decimal
+        assert Radix(2) is Binary
+        assert Radix(16) is Radix(16)
+        assert Radix(16).__name__ == "Hexadecimal"
+
+    def test_hex_arithmetic(self):
+        Hex = Radix(16)
+        a = Hex([15, 15])
+        b = Hex([1])
+        assert str(a.add(b)) == "100"
+        assert (a * a).to_int() == 255 * 255
+        assert repr(a) == "Hexadecimal([15, 15])"
+
+    def test_base36_and_validation(self):
+        Base36 = Radix(36)
+        assert str(Base36.from_int(36**3 + 35)) == "100z"
+        with pytest.raises(ValueError, match="Цифры должны быть в диапазоне 0-35"):
+            Base36([36])
+
+    def test_type_error_between_bases(self):
+        with pytest.raises(
+            TypeError, match="Можно складывать только восьмеричные числа"
+        ):
+            Radix(8)([1]).add(Radix(16)([1]))
+
+    def test_invalid_base(self):
+        with pytest.raises(ValueError, match="Основание"):
+            Radix(37)
+
+    def test_binary_to_hex_reuses_packed_bits(self):
+        bin_obj = Binary([0, 1, 1, 1, 1, 1, 1, 1, 1])
+        hex_obj = bin_obj.to_radix(16)
+        assert hex_obj._data is bin_obj._data
+        assert hex_obj.digits == [15, 15]
+        assert hex_obj.to_radix(8).digits == [3, 7, 7]
+        assert hex_obj.to_radix(2).digits == [1] * 8
+
+    def test_to_radix_non_power_of_two(self):
+        assert Binary([1, 0, 1, 0]).to_radix(10).digits == [1, 0]
+        assert Decimal([2, 5, 5]).to_radix(16).digits == [15, 15]
+        assert Radix(3)([2, 2]).to_radix(10).digits == [8]
+
+    def test_zero_conversion(self):
+        assert Binary([0, 0]).to_radix(16).digits == [0]
+
+
 class TestIntegerABC:
     def test_abstract_methods(self):
         """Тест, что абстрактные методы действительно абстрактные"""